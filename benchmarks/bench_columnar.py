@@ -0,0 +1,54 @@
+"""Benchmark columnar parsing against creating Variant objects.
+
+This compares :py:func:`mavehgvs.util.parse_variant_strings` with
+:py:func:`mavehgvs.columnar.parse_variant_columns`, including a simple filter for
+intronic substitutions on the result.
+NumPy is required.
+
+Run with ``python benchmarks/bench_columnar.py [count]``.
+"""
+
+import sys
+import timeit
+
+from mavehgvs import parse_variant_strings
+from mavehgvs.columnar import VARIANT_TYPES, parse_variant_columns
+from variants import random_variants
+
+SUB = VARIANT_TYPES.index("sub")
+
+
+def filter_objects(variant_strings):
+    valid, _ = parse_variant_strings(variant_strings)
+    return sum(
+        1
+        for v in valid
+        if v is not None
+        and v.variant_type == "sub"
+        and v.positions.intronic_position is not None
+    )
+
+
+def filter_columns(variant_strings):
+    columns = parse_variant_columns(variant_strings)
+    return int(
+        (
+            columns.valid
+            & (columns.variant_type == SUB)
+            & (columns.start_intronic != 0)
+        ).sum()
+    )
+
+
+def main(count: int = 1_000_000) -> None:
+    variant_strings = random_variants("c", count)
+    assert filter_objects(variant_strings) == filter_columns(variant_strings)
+
+    print(f"{'method':>8} {'variants/s':>12}")
+    for name, f in (("objects", filter_objects), ("columns", filter_columns)):
+        elapsed = min(timeit.repeat(lambda: f(variant_strings), number=1, repeat=3))
+        print(f"{name:>8} {count / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
@@ -0,0 +1,52 @@
+"""Benchmark parsing variant strings that are repeated many times.
+
+This simulates count tables where each variant appears once for every replicate and
+time point, and compares parsing every variant string with
+:py:func:`mavehgvs.util.parse_variant_strings` to parsing each distinct string once
+with ``deduplicate=True``.
+
+Run with ``python benchmarks/bench_dedup.py [count]``.
+"""
+
+import random
+import sys
+import timeit
+
+from mavehgvs import parse_unique_variant_strings, parse_variant_strings
+from variants import PREFIXES, random_variants
+
+
+def main(count: int = 500_000) -> None:
+    print(f"{count:,} variants")
+    print(f"{'ratio':>8} {'unique':>10} {'parse/s':>12} {'dedup/s':>12} {'speedup':>8}")
+    for ratio in (1, 2, 10, 100, 1000):
+        per_prefix = max(1, count // ratio // len(PREFIXES))
+        unique = list()
+        for prefix in PREFIXES:
+            unique.extend(random_variants(prefix, per_prefix))
+        variant_strings = (unique * ratio)[:count]
+        random.Random(0).shuffle(variant_strings)
+
+        *_, info = parse_unique_variant_strings(variant_strings)
+        parse_time = min(
+            timeit.repeat(
+                lambda: parse_variant_strings(variant_strings), number=1, repeat=3
+            )
+        )
+        dedup_time = min(
+            timeit.repeat(
+                lambda: parse_variant_strings(variant_strings, deduplicate=True),
+                number=1,
+                repeat=3,
+            )
+        )
+        print(
+            f"{info.ratio:>8.1f} {info.unique:>10,} "
+            f"{len(variant_strings) / parse_time:>12,.0f} "
+            f"{len(variant_strings) / dedup_time:>12,.0f} "
+            f"{parse_time / dedup_time:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
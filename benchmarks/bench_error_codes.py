@@ -0,0 +1,67 @@
+"""Benchmark batch parsing of mostly invalid variant strings.
+
+This compares :py:func:`mavehgvs.util.parse_variant_strings` returning error messages
+to returning error codes with ``error_codes=True`` for inputs with increasing
+fractions of invalid variant strings, like uploads with many malformed values.
+
+Run with ``python benchmarks/bench_error_codes.py [count]``.
+"""
+
+import random
+import sys
+import timeit
+
+from mavehgvs import parse_variant_strings
+from variants import PREFIXES, random_variants
+
+INVALID_VALUES = (
+    "NA",
+    "",
+    "-",
+    "c.1A>",
+    "p.Met1",
+    "wild type",
+    "c.[1A>T]",
+    "c.5_3del",
+    "c.[3A>T;1C>G]",
+    "1-Mar",
+)
+"""Tuple[str, ...]: invalid values that are mixed into the input.
+"""
+
+
+def main(count: int = 200_000) -> None:
+    per_prefix = count // len(PREFIXES)
+    valid_strings = list()
+    for prefix in PREFIXES:
+        valid_strings.extend(random_variants(prefix, per_prefix))
+
+    rng = random.Random(0)
+    print(f"{len(valid_strings):,} variants")
+    print(f"{'invalid':>8} {'messages/s':>12} {'codes/s':>12} {'speedup':>8}")
+    for fraction in (0.0, 0.5, 0.9, 1.0):
+        variant_strings = [
+            rng.choice(INVALID_VALUES) if rng.random() < fraction else s
+            for s in valid_strings
+        ]
+        message_time = min(
+            timeit.repeat(
+                lambda: parse_variant_strings(variant_strings), number=1, repeat=3
+            )
+        )
+        code_time = min(
+            timeit.repeat(
+                lambda: parse_variant_strings(variant_strings, error_codes=True),
+                number=1,
+                repeat=3,
+            )
+        )
+        print(
+            f"{fraction:>8.0%} {len(variant_strings) / message_time:>12,.0f} "
+            f"{len(variant_strings) / code_time:>12,.0f} "
+            f"{message_time / code_time:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
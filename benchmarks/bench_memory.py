@@ -0,0 +1,52 @@
+"""Benchmark the memory used by parsed variants.
+
+This reports the memory allocated per object when parsing many variants, measured
+with :py:mod:`tracemalloc`, and the size of the object itself including any instance
+dictionary.
+Position strings are made unique so that interned positions are not shared between
+variants.
+
+Run with ``python benchmarks/bench_memory.py [count]``.
+"""
+
+import sys
+import tracemalloc
+
+from mavehgvs import Variant, VariantPosition
+
+
+def shallow_size(obj) -> int:
+    """Size of an object and its instance dictionary, if it has one."""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def allocated_per_object(factory, inputs) -> float:
+    """Average memory allocated to create an object from each input."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(x) for x in inputs]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before - sys.getsizeof(objects)) / len(objects)
+
+
+def main(count: int = 100_000) -> None:
+    position_strings = [str(i) for i in range(1, count + 1)]
+    variant_strings = [f"c.{i}A>T" for i in range(1, count + 1)]
+
+    print(f"{'object':>16} {'shallow bytes':>14} {'allocated bytes':>16}")
+    print(
+        f"{'VariantPosition':>16} {shallow_size(VariantPosition('8')):>14} "
+        f"{allocated_per_object(VariantPosition, position_strings):>16.1f}"
+    )
+    print(
+        f"{'Variant':>16} {shallow_size(Variant('c.8A>T')):>14} "
+        f"{allocated_per_object(Variant, variant_strings):>16.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
@@ -0,0 +1,52 @@
+"""Benchmark overlap detection for multi-variants with many events.
+
+This compares the sort-and-sweep overlap check used by :py:class:`Variant` with a
+pairwise check over all combinations of events, and reports the time to construct
+the multi-variant.
+
+Run with ``python benchmarks/bench_overlaps.py``.
+"""
+
+import itertools
+import timeit
+
+from mavehgvs import Variant
+from variants import multi_variant
+
+
+def pairwise_overlaps(positions) -> bool:
+    """Reference O(n^2) overlap check over all pairs of events."""
+    for vp1, vp2 in itertools.combinations(positions, 2):
+        s1, e1 = vp1 if isinstance(vp1, tuple) else (vp1, vp1)
+        s2, e2 = vp2 if isinstance(vp2, tuple) else (vp2, vp2)
+        if s1 <= s2 <= e1 or s1 <= e2 <= e1 or s2 <= s1 <= e2 or s2 <= e1 <= e2:
+            return True
+    return False
+
+
+def main() -> None:
+    print(
+        f"{'events':>6} {'pairwise (ms)':>14} {'sweep (ms)':>11} {'Variant (ms)':>13}"
+    )
+    for events in (10, 100, 1000):
+        s = multi_variant("c", events)
+        positions = Variant(s).positions
+        number = max(1, 1000 // events)
+
+        pairwise = min(
+            timeit.repeat(lambda: pairwise_overlaps(positions), number=number, repeat=3)
+        )
+        sweep = min(
+            timeit.repeat(
+                lambda: Variant._check_overlaps(positions), number=number, repeat=3
+            )
+        )
+        construction = min(timeit.repeat(lambda: Variant(s), number=number, repeat=3))
+        print(
+            f"{events:>6} {pairwise / number * 1000:>14.3f} "
+            f"{sweep / number * 1000:>11.3f} {construction / number * 1000:>13.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark parsing variant strings with a pool of worker processes.
+
+This reports the throughput of :py:func:`mavehgvs.util.parse_variant_strings` for
+increasing numbers of worker processes, up to the number of CPUs.
+The time includes starting the worker processes.
+
+Run with ``python benchmarks/bench_parallel.py [count]``.
+"""
+
+import os
+import sys
+import time
+
+from mavehgvs import parse_variant_strings
+from variants import PREFIXES, random_variants
+
+
+def main(count: int = 1_000_000) -> None:
+    per_prefix = count // len(PREFIXES)
+    variant_strings = list()
+    for prefix in PREFIXES:
+        variant_strings.extend(random_variants(prefix, per_prefix))
+
+    cpus = os.cpu_count() or 1
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= cpus:
+        worker_counts.append(worker_counts[-1] * 2)
+    if worker_counts[-1] != cpus:
+        worker_counts.append(cpus)
+
+    print(f"{len(variant_strings):,} variants, {cpus} CPUs")
+    print(f"{'workers':>8} {'variants/s':>12} {'speedup':>8}")
+    baseline = None
+    for workers in worker_counts:
+        start = time.perf_counter()
+        parse_variant_strings(variant_strings, workers=workers)
+        elapsed = time.perf_counter() - start
+        if baseline is None:
+            baseline = elapsed
+        print(
+            f"{workers:>8} {len(variant_strings) / elapsed:>12,.0f} "
+            f"{baseline / elapsed:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
@@ -0,0 +1,72 @@
+"""Benchmark rejecting the invalid values found in real variant columns.
+
+The corpus mixes valid variants with missing values, free text, spreadsheet-mangled
+values, and variants with stray characters.
+This reports the fraction of strings rejected by the character pre-filter in
+:py:meth:`mavehgvs.Variant._read_prefix` and the throughput of matching the strings
+with :py:attr:`mavehgvs.Variant.fullmatch`, the pre-filter alone,
+:py:func:`mavehgvs.is_valid`, and parsing with error codes.
+
+Run with ``python benchmarks/bench_prefilter.py [count]``.
+"""
+
+import random
+import sys
+import timeit
+
+from mavehgvs import Variant, is_valid, parse_variant_strings
+from variants import PREFIXES, random_variants
+
+JUNK_VALUES = (
+    "NA",
+    "",
+    "N/A",
+    "nan",
+    "wild type",
+    "1-Mar",
+    "#VALUE!",
+    "1.00E+05",
+    "c. 1A>T",
+    "c.1A>T ",
+    "c.1A>T\n",
+    "c.1A>T (het)",
+    "c.[1A>T,2G>C]",
+    "c.1A>T/c.2G>C",
+    "p.Met1Leu?",
+    "p.(Met1Leu) likely",
+    "g.123456789A>G, het",
+    "NM_001130145.3:c.832C>T (pathogenic)",
+)
+"""Tuple[str, ...]: invalid values that are mixed into the corpus.
+"""
+
+
+def main(count: int = 200_000, junk_fraction: float = 0.8) -> None:
+    per_prefix = count // len(PREFIXES)
+    rng = random.Random(0)
+    variant_strings = [
+        rng.choice(JUNK_VALUES) if rng.random() < junk_fraction else s
+        for prefix in PREFIXES
+        for s in random_variants(prefix, per_prefix)
+    ]
+    read_prefix = Variant._read_prefix
+    rejected = sum(read_prefix(s) is None for s in variant_strings)
+    print(
+        f"{len(variant_strings):,} strings, {junk_fraction:.0%} junk, "
+        f"{rejected / len(variant_strings):.1%} rejected by the pre-filter"
+    )
+
+    methods = {
+        "fullmatch": lambda: [Variant.fullmatch(s) for s in variant_strings],
+        "prefilter": lambda: [read_prefix(s) for s in variant_strings],
+        "is_valid": lambda: [is_valid(s) for s in variant_strings],
+        "parse": lambda: parse_variant_strings(variant_strings, error_codes=True),
+    }
+    print(f"{'method':>10} {'strings/s':>12}")
+    for name, method in methods.items():
+        elapsed = min(timeit.repeat(method, number=1, repeat=3))
+        print(f"{name:>10} {len(variant_strings) / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main(*(float(x) if "." in x else int(x) for x in sys.argv[1:]))
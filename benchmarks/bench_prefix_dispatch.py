@@ -0,0 +1,49 @@
+"""Benchmark prefix-dispatched parsing against the combined variant pattern.
+
+For each prefix, this compares matching variant strings with the combined
+:py:attr:`Variant.fullmatch` pattern against matching with the smaller pattern
+selected by the variant prefix, and reports the throughput of :py:class:`Variant`
+construction.
+
+Run with ``python benchmarks/bench_prefix_dispatch.py [count]``.
+"""
+
+import sys
+import timeit
+
+from mavehgvs import Variant
+from variants import PREFIXES, random_variants
+
+
+def dispatched_match(s: str):
+    return Variant._event_parsers[s[0]].single(s, 2)
+
+
+def main(count: int = 100_000) -> None:
+    print(f"{'prefix':>6} {'combined/s':>12} {'dispatched/s':>12} {'gain':>6} ", end="")
+    print(f"{'Variant/s':>12}")
+    for prefix in PREFIXES:
+        variants = random_variants(prefix, count)
+        assert all(dispatched_match(s) for s in variants)
+
+        combined = min(
+            timeit.repeat(
+                lambda: [Variant.fullmatch(s) for s in variants], number=1, repeat=3
+            )
+        )
+        dispatched = min(
+            timeit.repeat(
+                lambda: [dispatched_match(s) for s in variants], number=1, repeat=3
+            )
+        )
+        construction = min(
+            timeit.repeat(lambda: [Variant(s) for s in variants], number=1, repeat=3)
+        )
+        print(
+            f"{prefix:>6} {count / combined:>12,.0f} {count / dispatched:>12,.0f} "
+            f"{combined / dispatched:>5.1f}x {count / construction:>12,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
@@ -0,0 +1,54 @@
+"""Benchmark sending parsed variants between processes.
+
+This compares the size and the time to encode and decode a list of parsed variants
+using variant strings that are parsed again, pickling the variants, and the bulk
+binary encoding in :py:mod:`mavehgvs.serialize`.
+
+Run with ``python benchmarks/bench_serialize.py [count]``.
+"""
+
+import pickle
+import sys
+import timeit
+
+from mavehgvs import Variant, serialize
+from variants import PREFIXES, multi_variant, random_variants
+
+
+def main(count: int = 100_000) -> None:
+    per_prefix = count // len(PREFIXES)
+    variants = list()
+    for prefix in PREFIXES:
+        variants.extend(Variant(s) for s in random_variants(prefix, per_prefix))
+        variants.extend(
+            Variant(multi_variant(prefix, 3, seed=i)) for i in range(per_prefix // 10)
+        )
+
+    methods = {
+        "strings": (
+            lambda: pickle.dumps([str(v) for v in variants]),
+            lambda data: [Variant(s) for s in pickle.loads(data)],
+        ),
+        "pickle": (lambda: pickle.dumps(variants), pickle.loads),
+        "dumps_many": (
+            lambda: serialize.dumps_many(variants),
+            serialize.loads_many,
+        ),
+    }
+
+    print(f"{len(variants):,} variants")
+    print(f"{'method':>10} {'bytes/variant':>14} {'encode/s':>12} {'decode/s':>12}")
+    for name, (encode, decode) in methods.items():
+        data = encode()
+        assert decode(data) == variants
+        encode_time = min(timeit.repeat(encode, number=1, repeat=3))
+        decode_time = min(timeit.repeat(lambda: decode(data), number=1, repeat=3))
+        print(
+            f"{name:>10} {len(data) / len(variants):>14.1f} "
+            f"{len(variants) / encode_time:>12,.0f} "
+            f"{len(variants) / decode_time:>12,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
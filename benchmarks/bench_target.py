@@ -0,0 +1,53 @@
+"""Benchmark validating many substitutions against a target sequence.
+
+This compares validating each parsed variant with a prepared
+:py:class:`mavehgvs.TargetSequence` with validating the columns returned by
+:py:func:`mavehgvs.columnar.parse_variant_columns` using vectorized operations.
+Parsing time is not included.
+NumPy is required.
+
+Run with ``python benchmarks/bench_target.py [count]``.
+"""
+
+import random
+import sys
+import timeit
+
+from mavehgvs import MaveHgvsParseError, TargetSequence, Variant
+from mavehgvs.columnar import parse_variant_columns, validate_target
+from variants import random_variants
+
+
+def main(count: int = 1_000_000) -> None:
+    rng = random.Random(0)
+    targetseq = "".join(rng.choice("ACGT") for _ in range(300))
+    target = TargetSequence(targetseq)
+
+    variant_strings = random_variants("c", count)
+    variants = [Variant(s) for s in variant_strings]
+    columns = parse_variant_columns(variant_strings)
+
+    def validate_objects():
+        for v in variants:
+            ref = v.sequence[0] if v.variant_type == "sub" else None
+            try:
+                target.validate(v.positions, ref)
+            except MaveHgvsParseError:
+                pass
+
+    def validate_arrays():
+        return validate_target(target, columns.start, columns.start_ref)
+
+    print(f"{count:,} variants")
+    print(f"{'method':>15} {'seconds':>8}")
+    for name, f in (
+        ("objects", validate_objects),
+        ("validate_target", validate_arrays),
+        ("columns", lambda: columns.validate_target(target)),
+    ):
+        elapsed = min(timeit.repeat(f, number=1, repeat=3))
+        print(f"{name:>15} {elapsed:>8.3f}")
+
+
+if __name__ == "__main__":
+    main(*(int(x) for x in sys.argv[1:]))
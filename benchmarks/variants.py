@@ -0,0 +1,106 @@
+"""Synthetic MAVE-HGVS variant strings for benchmarking.
+
+The generated variants resemble the variant columns of MaveDB score and count tables,
+which are dominated by single substitutions with a smaller number of indels.
+"""
+
+import random
+from typing import List
+
+from fqfa.constants import AA_CODES
+
+DNA = "ACGT"
+RNA = "acgu"
+AMINO_ACIDS = sorted(v for v in AA_CODES.values() if v != "Ter")
+
+PREFIXES = "cngmorp"
+
+
+def random_event(rng: random.Random, prefix: str, position: int) -> str:
+    """Generate a single variant event (without prefix) at the given position.
+
+    Parameters
+    ----------
+    rng : random.Random
+        Random number generator.
+    prefix : str
+        Variant prefix that determines the sequence alphabet and variant types.
+    position : int
+        Position of the variant event.
+
+    Returns
+    -------
+    str
+        The variant event.
+
+    """
+    roll = rng.random()
+    if prefix == "p":
+        aa = rng.choice(AMINO_ACIDS)
+        if roll < 0.8:
+            return f"{aa}{position}{rng.choice(AMINO_ACIDS)}"
+        elif roll < 0.9:
+            return f"{aa}{position}del"
+        else:
+            return f"{aa}{position}_{rng.choice(AMINO_ACIDS)}{position + 1}insGly"
+    else:
+        alphabet = RNA if prefix == "r" else DNA
+        if roll < 0.8:
+            ref, alt = rng.sample(alphabet, 2)
+            return f"{position}{ref}>{alt}"
+        elif roll < 0.9:
+            return f"{position}_{position + 2}del"
+        else:
+            return f"{position}delins{rng.choice(alphabet) * 3}"
+
+
+def random_variants(
+    prefix: str, count: int, length: int = 300, seed: int = 0
+) -> List[str]:
+    """Generate single variants with the given prefix.
+
+    Parameters
+    ----------
+    prefix : str
+        Variant prefix.
+    count : int
+        Number of variants to generate.
+    length : int
+        Length of the target sequence.
+    seed : int
+        Seed for the random number generator.
+
+    Returns
+    -------
+    List[str]
+        List of variant strings.
+
+    """
+    rng = random.Random(seed)
+    return [
+        f"{prefix}.{random_event(rng, prefix, rng.randint(1, length - 2))}"
+        for _ in range(count)
+    ]
+
+
+def multi_variant(prefix: str, events: int, seed: int = 0) -> str:
+    """Generate a multi-variant with non-overlapping events in sorted order.
+
+    Parameters
+    ----------
+    prefix : str
+        Variant prefix.
+    events : int
+        Number of events in the multi-variant.
+    seed : int
+        Seed for the random number generator.
+
+    Returns
+    -------
+    str
+        The multi-variant string.
+
+    """
+    rng = random.Random(seed)
+    elements = [random_event(rng, prefix, 5 * i + 1) for i in range(events)]
+    return f"{prefix}.[{';'.join(elements)}]"
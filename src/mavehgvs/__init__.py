@@ -1,7 +1,17 @@
-from mavehgvs.exceptions import MaveHgvsParseError
+from mavehgvs.exceptions import ErrorCode, MaveHgvsParseError
 from mavehgvs.position import VariantPosition
+from mavehgvs.target import TargetSequence, TargetRegistry
 from mavehgvs.variant import Variant
-from mavehgvs.util import parse_variant_strings
+from mavehgvs.util import (
+    parse_variant_strings,
+    parse_unique_variant_strings,
+    DeduplicationInfo,
+    iter_parse_variant_strings,
+    is_valid,
+    sort_variants,
+    variants_to_records,
+    variants_to_columns,
+)
 
 __version__ = "0.7.0"
 
@@ -9,6 +19,16 @@ __all__ = [
     "__version__",
     "Variant",
     "VariantPosition",
+    "TargetSequence",
+    "TargetRegistry",
     "MaveHgvsParseError",
+    "ErrorCode",
     "parse_variant_strings",
+    "parse_unique_variant_strings",
+    "DeduplicationInfo",
+    "iter_parse_variant_strings",
+    "is_valid",
+    "sort_variants",
+    "variants_to_records",
+    "variants_to_columns",
 ]
@@ -0,0 +1,134 @@
+"""Size-bounded least recently used cache for variant parsing results.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, NamedTuple, Optional
+
+__all__ = ["ParseCache", "CacheInfo"]
+
+
+class CacheInfo(NamedTuple):
+    """Statistics describing the state of a :py:class:`ParseCache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ParseCache:
+    """Least recently used cache with a maximum number of entries.
+
+    When the cache is full, adding a new entry discards the entry that was least
+    recently added or retrieved.
+    The cache is safe to share between threads.
+
+    Attributes
+    ----------
+    maxsize : int
+        The maximum number of entries in the cache.
+    hits : int
+        The number of lookups that found an entry.
+    misses : int
+        The number of lookups that did not find an entry.
+
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        """Create an empty cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of entries in the cache.
+
+        Raises
+        ------
+        ValueError
+            If maxsize is less than 1.
+
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retrieve an entry from the cache and mark it as recently used.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key for the entry.
+
+        Returns
+        -------
+        Optional[Any]
+            The cached value, or None if the key is not in the cache.
+
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Add an entry to the cache, discarding the least recently used entry if the
+        cache is full.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key for the entry.
+        value : Any
+            The value to store. This should not be None.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache and reset the hit and miss counts.
+
+        Returns
+        -------
+        None
+
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Report the cache statistics.
+
+        Returns
+        -------
+        CacheInfo
+            The number of hits and misses, the maximum size, and the current number of
+            entries.
+
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
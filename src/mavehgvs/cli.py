@@ -0,0 +1,426 @@
+"""Command-line validator for variant columns of delimited files.
+
+This validates the MAVE-HGVS columns of score and count files such as those used by
+MaveDB. The input is read in batches of rows, so files of any size can be validated
+in bounded memory. Invalid variants are written to a delimited error report, and
+summary statistics are printed to standard error.
+
+Run ``mavehgvs --help`` or ``python -m mavehgvs --help`` for usage information.
+"""
+
+import argparse
+import csv
+import gzip
+import os
+import sys
+import time
+from collections import deque
+from contextlib import ExitStack
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import (
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from mavehgvs import __version__
+from mavehgvs.target import TargetRegistry, TargetSequence, _prepare_target
+from mavehgvs.util import parse_variant_strings
+
+__all__ = [
+    "DEFAULT_COLUMNS",
+    "MISSING_VALUES",
+    "REPORT_COLUMNS",
+    "build_parser",
+    "validate_file",
+    "main",
+]
+
+DEFAULT_COLUMNS: Tuple[str, ...] = ("hgvs_nt", "hgvs_splice", "hgvs_pro")
+"""Tuple[str, ...]: MaveDB variant columns that are validated if they are present and
+no columns are specified.
+"""
+
+MISSING_VALUES: Tuple[str, ...] = ("", "NA")
+"""Tuple[str, ...]: values that denote a missing variant and are not validated.
+"""
+
+REPORT_COLUMNS: Tuple[str, ...] = ("row", "column", "variant", "error")
+"""Tuple[str, ...]: columns of the error report.
+
+The row is the 1-based number of the data row, not counting the header.
+"""
+
+_targets: Dict[str, Union[str, TargetSequence, TargetRegistry]] = dict()
+"""Dict[str, Union[str, TargetSequence, TargetRegistry]]: target sequence for each
+column, used by batches validated in a worker process.
+"""
+
+
+def _init_worker(
+    targets: Dict[str, Union[str, TargetSequence, TargetRegistry]]
+) -> None:
+    global _targets
+    _targets = targets
+
+
+def _validate_batch(
+    column: str,
+    first_row: int,
+    values: List[str],
+    targets: Optional[Dict[str, Union[str, TargetSequence, TargetRegistry]]] = None,
+) -> Tuple[int, List[Tuple[int, str, str]]]:
+    """Validate the values of one column for a batch of rows.
+
+    Parameters
+    ----------
+    column : str
+        Name of the column.
+    first_row : int
+        Row number of the first value.
+    values : List[str]
+        Value of the column in each row.
+    targets : Optional[Dict[str, Union[str, TargetSequence, TargetRegistry]]]
+        Target sequence for each column.
+        If None, the targets set for this worker process by :py:func:`_init_worker`
+        are used.
+
+    Returns
+    -------
+    Tuple[int, List[Tuple[int, str, str]]]
+        Returns the number of values that were validated and a list containing the
+        row number, variant, and error message of each invalid variant.
+
+    """
+    rows = [
+        i for i, value in enumerate(values, first_row) if value not in MISSING_VALUES
+    ]
+    variants = [values[i - first_row] for i in rows]
+    targets = _targets if targets is None else targets
+    # count files repeat each variant for every replicate or time point
+    _, errors = parse_variant_strings(
+        variants, targetseq=targets.get(column), deduplicate=True
+    )
+    invalid = [
+        (rows[i], variants[i], error)
+        for i, error in enumerate(errors)
+        if error is not None
+    ]
+    return len(variants), invalid
+
+
+def _open_input(path: str) -> TextIO:
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", newline="")
+    else:
+        return open(path, newline="")
+
+
+def _default_delimiter(path: str) -> str:
+    if path.endswith(".gz"):
+        path = path[:-3]
+    return "\t" if path.endswith((".tsv", ".tab", ".txt")) else ","
+
+
+def _parse_target(value: str) -> Tuple[str, str]:
+    column, sep, targetseq = value.partition("=")
+    if not sep or not column or not targetseq:
+        raise argparse.ArgumentTypeError("expected COLUMN=SEQUENCE")
+    return column, targetseq
+
+
+def _batches(
+    rows: Iterator[List[str]], columns: Dict[str, int], batch_size: int
+) -> Iterator[Tuple[str, int, List[str]]]:
+    """Split the rows into batches of values for each column.
+
+    Parameters
+    ----------
+    rows : Iterator[List[str]]
+        The data rows.
+    columns : Dict[str, int]
+        The index of each column to validate.
+    batch_size : int
+        The number of rows in each batch.
+
+    Returns
+    -------
+    Iterator[Tuple[str, int, List[str]]]
+        Iterator over the column name, first row number, and values of each batch.
+
+    """
+    first_row = 1
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        for column, index in columns.items():
+            values = [row[index] if index < len(row) else "" for row in batch]
+            yield column, first_row, values
+        first_row += len(batch)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser for the command-line interface.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        The argument parser.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="mavehgvs",
+        description="Validate the MAVE-HGVS variant columns of a delimited file.",
+    )
+    parser.add_argument(
+        "file",
+        help="CSV or TSV file to validate, which may be gzip compressed, or - to read "
+        "standard input",
+    )
+    parser.add_argument(
+        "-c",
+        "--column",
+        action="append",
+        dest="columns",
+        metavar="COLUMN",
+        help="column to validate, which may be repeated (default: any of "
+        f"{', '.join(DEFAULT_COLUMNS)})",
+    )
+    parser.add_argument(
+        "-t",
+        "--target",
+        action="append",
+        dest="targets",
+        default=[],
+        type=_parse_target,
+        metavar="COLUMN=SEQUENCE",
+        help="validate the variants in a column against a target sequence, which may "
+        "be repeated",
+    )
+    parser.add_argument(
+        "-f",
+        "--fasta",
+        help="validate the variants in the other columns against the target sequence "
+        "in a FASTA file named by the target identifier of each variant",
+    )
+    parser.add_argument(
+        "-d",
+        "--delimiter",
+        help="field delimiter (default: tab for .tsv, .tab, and .txt files, "
+        "otherwise comma)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="path for the error report, or - for standard output (default: -)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=1,
+        help="number of worker processes, or 0 to use all CPUs (default: 1)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10_000,
+        help="number of rows validated in each batch (default: 10000)",
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="do not print statistics",
+    )
+    parser.add_argument("--version", action="version", version=__version__)
+    return parser
+
+
+def _result(
+    pending: Tuple[str, Future]
+) -> Tuple[str, Tuple[int, List[Tuple[int, str, str]]]]:
+    column, future = pending
+    return column, future.result()
+
+
+def validate_file(  # noqa: max-complexity: 13
+    infile: TextIO,
+    report: TextIO,
+    delimiter: str,
+    columns: Optional[Sequence[str]] = None,
+    targets: Optional[Dict[str, Union[str, TargetSequence]]] = None,
+    workers: int = 1,
+    batch_size: int = 10_000,
+    registry: Optional[TargetRegistry] = None,
+) -> Dict[str, int]:
+    """Validate the variant columns of a delimited file and write an error report.
+
+    Parameters
+    ----------
+    infile : TextIO
+        The delimited file, which must have a header row.
+    report : TextIO
+        The file to write the error report to.
+    delimiter : str
+        The field delimiter of the input and report.
+    columns : Optional[Sequence[str]]
+        The names of the columns to validate.
+        If None, any of :py:data:`DEFAULT_COLUMNS` in the file are validated.
+    targets : Optional[Dict[str, Union[str, TargetSequence]]]
+        Target sequence to validate the variants of each column against.
+    workers : int
+        The number of worker processes to use.
+        If 1, the variants are validated in this process.
+    batch_size : int
+        The number of rows in each batch.
+    registry : Optional[TargetRegistry]
+        Target sequences for validating the variants of the columns without a target
+        sequence in ``targets``, using the target identifier of each variant.
+
+    Returns
+    -------
+    Dict[str, int]
+        Dictionary with the number of rows, variants, and invalid variants.
+
+    Raises
+    ------
+    ValueError
+        If the file has no header, does not have the columns to validate, or has a
+        target sequence for a column that is not validated.
+
+    """
+    targets = dict() if targets is None else targets
+    targets = {k: _prepare_target(v) for k, v in targets.items()}
+    reader = csv.reader(infile, delimiter=delimiter)
+    header = next(reader, None)
+    if header is None:
+        raise ValueError("input file is empty")
+
+    if columns is None:
+        columns = [x for x in DEFAULT_COLUMNS if x in header]
+        if not columns:
+            raise ValueError("input file has no variant columns")
+    for column in (*columns, *targets):
+        if column not in header:
+            raise ValueError(f"column '{column}' not found")
+        if column not in columns:
+            raise ValueError(f"target sequence for column '{column}' not validated")
+    column_indexes = {x: header.index(x) for x in columns}
+    if registry is not None:
+        targets.update((x, registry) for x in columns if x not in targets)
+
+    writer = csv.writer(report, delimiter=delimiter, lineterminator="\n")
+    writer.writerow(REPORT_COLUMNS)
+    stats = {"rows": 0, "variants": 0, "invalid": 0}
+
+    def write_result(
+        column: str, result: Tuple[int, List[Tuple[int, str, str]]]
+    ) -> None:
+        count, invalid = result
+        stats["variants"] += count
+        stats["invalid"] += len(invalid)
+        writer.writerows(
+            (row, column, variant, error) for row, variant, error in invalid
+        )
+
+    def counted_rows() -> Iterator[List[str]]:
+        for row in reader:
+            stats["rows"] += 1
+            yield row
+
+    batches = _batches(counted_rows(), column_indexes, batch_size)
+    if workers == 1:
+        for column, first_row, values in batches:
+            write_result(column, _validate_batch(column, first_row, values, targets))
+    else:
+        # limit the batches in progress so memory use does not depend on file size
+        pending: Deque[Tuple[str, Future]] = deque()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(targets,)
+        ) as pool:
+            for column, first_row, values in batches:
+                if len(pending) >= 2 * workers:
+                    write_result(*_result(pending.popleft()))
+                pending.append(
+                    (column, pool.submit(_validate_batch, column, first_row, values))
+                )
+            while pending:
+                write_result(*_result(pending.popleft()))
+
+    return stats
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the command-line interface.
+
+    Parameters
+    ----------
+    argv : Optional[Sequence[str]]
+        The command-line arguments.
+        If None, ``sys.argv`` is used.
+
+    Returns
+    -------
+    int
+        The exit status, which is 0 if all variants are valid, 1 if any variants are
+        invalid, and 2 if the file could not be validated.
+
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.workers < 0:
+        parser.error("workers must not be negative")
+    if args.batch_size < 1:
+        parser.error("batch size must be a positive integer")
+
+    workers = args.workers if args.workers > 0 else os.cpu_count() or 1
+    if args.delimiter is None:
+        delimiter = _default_delimiter(args.file)
+    else:
+        delimiter = args.delimiter.encode().decode("unicode_escape")
+
+    start = time.perf_counter()
+    try:
+        with ExitStack() as stack:
+            if args.file == "-":
+                infile = sys.stdin
+            else:
+                infile = stack.enter_context(_open_input(args.file))
+            if args.output == "-":
+                report = sys.stdout
+            else:
+                report = stack.enter_context(open(args.output, "w", newline=""))
+            stats = validate_file(
+                infile,
+                report,
+                delimiter,
+                args.columns,
+                dict(args.targets),
+                workers,
+                args.batch_size,
+                None if args.fasta is None else TargetRegistry.from_fasta(args.fasta),
+            )
+    except (OSError, ValueError, csv.Error) as error:
+        print(f"{parser.prog}: error: {error}", file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - start
+
+    if not args.quiet:
+        print(
+            f"{stats['rows']:,} rows, {stats['variants']:,} variants, "
+            f"{stats['invalid']:,} invalid, {elapsed:.2f} s "
+            f"({stats['variants'] / elapsed if elapsed > 0 else 0:,.0f} variants/s)",
+            file=sys.stderr,
+        )
+
+    return 1 if stats["invalid"] > 0 else 0
@@ -0,0 +1,627 @@
+"""Columnar parsing of many variant strings into NumPy arrays.
+
+This module requires NumPy, which can be installed with the ``numpy`` extra.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from fqfa.constants import AA_CODES
+
+from mavehgvs.exceptions import ErrorCode
+from mavehgvs.position import VariantPosition
+from mavehgvs.target import TargetRegistry, TargetSequence, _prepare_target
+from mavehgvs.variant import Variant
+
+__all__ = [
+    "PREFIXES",
+    "VARIANT_TYPES",
+    "TARGET_VALID",
+    "TARGET_OUT_OF_BOUNDS",
+    "TARGET_MISMATCH",
+    "TARGET_ERRORS",
+    "VariantColumns",
+    "parse_variant_columns",
+    "validate_target",
+]
+
+PREFIXES: str = "cgmnopr"
+"""str: variant prefixes, in the order used for prefix codes.
+"""
+
+VARIANT_TYPES: Sequence[str] = (*Variant.VTYPES, "multi")
+"""Sequence[str]: variant types, in the order used for variant type codes.
+
+Multi-variants have the last code, "multi".
+"""
+
+_PREFIX_CODES = {x: i for i, x in enumerate(PREFIXES)}
+_VARIANT_TYPE_CODES = {x: i for i, x in enumerate(VARIANT_TYPES)}
+_MULTI_VARIANT_CODE = _VARIANT_TYPE_CODES["multi"]
+
+_COLUMN_TYPES = (
+    ("valid", "B", bool),
+    ("prefix", "B", np.uint8),
+    ("variant_type", "B", np.uint8),
+    ("event_count", "q", np.int64),
+    ("start", "q", np.int64),
+    ("end", "q", np.int64),
+    ("start_intronic", "q", np.int64),
+    ("end_intronic", "q", np.int64),
+    ("start_utr", "B", bool),
+    ("end_utr", "B", bool),
+    ("start_ref", "B", np.uint8),
+    ("end_ref", "B", np.uint8),
+)
+"""Tuple[Tuple[str, str, type], ...]: name, :py:mod:`array` type code, and NumPy type
+of each column.
+"""
+
+_END_COLUMNS = (
+    ("start", "end"),
+    ("start_intronic", "end_intronic"),
+    ("start_utr", "end_utr"),
+    ("start_ref", "end_ref"),
+)
+"""Tuple[Tuple[str, str], ...]: start and end column pairs, whose end values are only
+filled for variants that do not have a single position.
+"""
+
+_AMINO_ACID_REFERENCES = {value: ord(key) for key, value in AA_CODES.items()}
+"""Dict[str, int]: ASCII code of the single-letter code for each three-letter amino
+acid code.
+"""
+
+TARGET_VALID: int = 0
+"""int: target validation code for variants that agree with the target sequence.
+"""
+
+TARGET_OUT_OF_BOUNDS: int = 1
+"""int: target validation code for variants with a position outside the target.
+"""
+
+TARGET_MISMATCH: int = 2
+"""int: target validation code for variants whose reference does not match the
+target.
+"""
+
+TARGET_ERRORS: Dict[int, str] = {
+    TARGET_OUT_OF_BOUNDS: "variant coordinate out of bounds",
+    TARGET_MISMATCH: "variant reference does not match target",
+}
+"""Dict[int, str]: error message for each target validation code other than
+:py:data:`TARGET_VALID`, which are the messages used by :py:class:`Variant`.
+"""
+
+
+class VariantColumns:
+    """Columnar result of parsing many variant strings.
+
+    Each attribute other than :py:attr:`errors` is a NumPy array with one element for
+    each variant string.
+    Elements for invalid variant strings are 0 or False.
+
+    Positions describe the whole variant, so the start and end of a multi-variant are
+    the start of its first event and the end of its last event.
+    The start and end of a variant with a single position are the same, and
+    target-identical variants without a position have a start and end of 0, which is
+    not a valid position.
+
+    :py:class:`Variant` objects are only created when they are requested using
+    :py:meth:`variant` or :py:meth:`variants`.
+
+    Attributes
+    ----------
+    valid : numpy.ndarray
+        Boolean array that is True for valid variants.
+    prefix : numpy.ndarray
+        Prefix codes, which are indexes into :py:data:`PREFIXES`.
+    variant_type : numpy.ndarray
+        Variant type codes, which are indexes into :py:data:`VARIANT_TYPES`.
+    event_count : numpy.ndarray
+        The number of events in each variant.
+    start : numpy.ndarray
+        Start positions.
+    end : numpy.ndarray
+        End positions.
+    start_intronic : numpy.ndarray
+        Intronic offsets of the start positions, or 0 for non-intronic positions.
+    end_intronic : numpy.ndarray
+        Intronic offsets of the end positions, or 0 for non-intronic positions.
+    start_utr : numpy.ndarray
+        Boolean array that is True if the start position is in the UTR.
+    end_utr : numpy.ndarray
+        Boolean array that is True if the end position is in the UTR.
+    start_ref : numpy.ndarray
+        ASCII codes of the single-letter reference residue at the start position if
+        the variant specifies it, or 0.
+        Reference residues are the amino acids of protein positions and the reference
+        bases of nucleotide substitutions.
+    end_ref : numpy.ndarray
+        ASCII codes of the single-letter reference residue at the end position if
+        the variant specifies it, or 0.
+    errors : List[Optional[str]]
+        The error message for each invalid variant, or None for valid variants.
+
+    """
+
+    def __init__(
+        self,
+        variant_strings: List[str],
+        targetseq: Optional[Union[str, TargetSequence, TargetRegistry]],
+        columns: Dict[str, np.ndarray],
+        errors: List[Optional[str]],
+    ) -> None:
+        """Create the result from columns built by :py:func:`parse_variant_columns`.
+
+        Parameters
+        ----------
+        variant_strings : List[str]
+            The variant strings that were parsed.
+        targetseq : Optional[Union[str, TargetSequence, TargetRegistry]]
+            The target sequence the variants were validated against.
+        columns : Dict[str, numpy.ndarray]
+            Array for each attribute.
+        errors : List[Optional[str]]
+            The error message for each invalid variant, or None for valid variants.
+
+        """
+        self._variant_strings = variant_strings
+        self._targetseq = targetseq
+        self.valid = columns["valid"]
+        self.prefix = columns["prefix"]
+        self.variant_type = columns["variant_type"]
+        self.event_count = columns["event_count"]
+        self.start = columns["start"]
+        self.end = columns["end"]
+        self.start_intronic = columns["start_intronic"]
+        self.end_intronic = columns["end_intronic"]
+        self.start_utr = columns["start_utr"]
+        self.end_utr = columns["end_utr"]
+        self.start_ref = columns["start_ref"]
+        self.end_ref = columns["end_ref"]
+        self.errors = errors
+
+    def __len__(self) -> int:
+        return len(self._variant_strings)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Return the arrays as a dictionary, for example to create a data frame.
+
+        Returns
+        -------
+        Dict[str, numpy.ndarray]
+            Dictionary of attribute names and arrays.
+
+        """
+        return {
+            "valid": self.valid,
+            "prefix": self.prefix,
+            "variant_type": self.variant_type,
+            "event_count": self.event_count,
+            "start": self.start,
+            "end": self.end,
+            "start_intronic": self.start_intronic,
+            "end_intronic": self.end_intronic,
+            "start_utr": self.start_utr,
+            "end_utr": self.end_utr,
+            "start_ref": self.start_ref,
+            "end_ref": self.end_ref,
+        }
+
+    def validate_target(self, targetseq: Union[str, TargetSequence]) -> np.ndarray:
+        """Validate the variants against a target sequence.
+
+        Variants with a single event are validated using :py:func:`validate_target`,
+        and multi-variants are validated individually.
+        The results are the same as parsing the variant strings with this target
+        sequence.
+
+        Parameters
+        ----------
+        targetseq : Union[str, TargetSequence]
+            The target sequence.
+            See the documentation for :py:class:`Variant` for further details.
+
+        Returns
+        -------
+        numpy.ndarray
+            The target validation code for each variant, which is
+            :py:data:`TARGET_VALID` for invalid variants.
+
+        """
+        codes = np.zeros(len(self), dtype=np.uint8)
+        targetseq = _prepare_target(targetseq)
+
+        # extended positions and variants without positions are not validated
+        rows = np.flatnonzero(
+            self.valid
+            & (self.event_count == 1)
+            & (self.start != 0)
+            & (self.start_intronic == 0)
+            & (self.end_intronic == 0)
+            & ~self.start_utr
+            & ~self.end_utr
+        )
+        start_codes = validate_target(targetseq, self.start[rows], self.start_ref[rows])
+        end_codes = validate_target(targetseq, self.end[rows], self.end_ref[rows])
+        out_of_bounds = (start_codes == TARGET_OUT_OF_BOUNDS) | (
+            end_codes == TARGET_OUT_OF_BOUNDS
+        )
+        codes[rows] = np.where(
+            out_of_bounds, TARGET_OUT_OF_BOUNDS, np.maximum(start_codes, end_codes)
+        )
+
+        target_codes = {
+            ErrorCode.OUT_OF_BOUNDS: TARGET_OUT_OF_BOUNDS,
+            ErrorCode.REFERENCE_MISMATCH: TARGET_MISMATCH,
+        }
+        for i in np.flatnonzero(self.valid & (self.event_count > 1)).tolist():
+            parsed = Variant._try_parse(self._variant_strings[i], targetseq, False)
+            if parsed.__class__ is ErrorCode:
+                codes[i] = target_codes[parsed]
+
+        return codes
+
+    def variant(self, i: int) -> Optional[Variant]:
+        """Create the Variant object for a single variant string.
+
+        Parameters
+        ----------
+        i : int
+            Index of the variant string.
+
+        Returns
+        -------
+        Optional[Variant]
+            The variant, or None if the variant string is not valid.
+
+        """
+        if not self.valid[i]:
+            return None
+        return Variant(self._variant_strings[i], targetseq=self._targetseq)
+
+    def variants(self) -> List[Optional[Variant]]:
+        """Create the Variant objects for all variant strings.
+
+        Returns
+        -------
+        List[Optional[Variant]]
+            The variants, with None for variant strings that are not valid.
+
+        """
+        return [
+            Variant(s, targetseq=self._targetseq) if v else None
+            for s, v in zip(self._variant_strings, self.valid.tolist())
+        ]
+
+
+def _position_values(position_string: str) -> Tuple[int, int, int, int]:
+    """Read the column values of a single position string that is not only digits.
+
+    Plain protein positions are read without creating a :py:class:`VariantPosition`.
+
+    Parameters
+    ----------
+    position_string : str
+        The position string of a single-event variant.
+
+    Returns
+    -------
+    Tuple[int, int, int, int]
+        The position, intronic offset, whether the position is in the UTR, and the
+        ASCII code of the amino acid of a protein position or 0.
+
+    """
+    digits = position_string[3:]
+    if digits.isdigit() and position_string[:3] in _AMINO_ACID_REFERENCES:
+        return int(digits), 0, 0, _AMINO_ACID_REFERENCES[position_string[:3]]
+
+    position = VariantPosition.intern(position_string)
+    return (
+        position._position,
+        position._intronic_position or 0,
+        position._utr is not None,
+        0
+        if position._amino_acid is None
+        else _AMINO_ACID_REFERENCES[position._amino_acid],
+    )
+
+
+def _fill_columns(
+    columns: Dict[str, array],
+    i: int,
+    prefix: str,
+    variant_count: int,
+    variant_types: Any,
+    positions: Any,
+    sequences: Any,
+) -> None:
+    """Fill the column values of a variant with a range of positions, several events,
+    or no position.
+
+    Parameters
+    ----------
+    columns : Dict[str, array.array]
+        The columns being filled.
+    i : int
+        Index of the variant.
+    prefix : str
+        The prefix of the variant.
+    variant_count : int
+        The number of events in the variant.
+    variant_types : Any
+        The variant type(s) returned by :py:meth:`Variant._parse`.
+    positions : Any
+        The position(s) returned by :py:meth:`Variant._parse`.
+    sequences : Any
+        The sequence(s) returned by :py:meth:`Variant._parse`.
+
+    """
+    if variant_count > 1:
+        columns["variant_type"][i] = _MULTI_VARIANT_CODE
+        columns["event_count"][i] = variant_count
+        first, last = positions[0], positions[-1]
+        first_type, last_type = variant_types[0], variant_types[-1]
+        first_sequence, last_sequence = sequences[0], sequences[-1]
+    else:
+        columns["variant_type"][i] = _VARIANT_TYPE_CODES[variant_types]
+        first = last = positions
+        first_type = last_type = variant_types
+        first_sequence = last_sequence = sequences
+
+    columns["has_end"][i] = True
+    if first is None:  # target-identical variant without a position
+        return
+
+    if first.__class__ is str:
+        first = VariantPosition.intern(first)
+    if last.__class__ is str:
+        last = VariantPosition.intern(last)
+    if first.__class__ is tuple:
+        first = first[0]
+    if last.__class__ is tuple:
+        last = last[1]
+
+    for key, position, variant_type, sequence in (
+        ("start", first, first_type, first_sequence),
+        ("end", last, last_type, last_sequence),
+    ):
+        columns[key][i] = position._position
+        columns[f"{key}_intronic"][i] = position._intronic_position or 0
+        columns[f"{key}_utr"][i] = position._utr is not None
+        if prefix == "p":
+            columns[f"{key}_ref"][i] = _AMINO_ACID_REFERENCES[position._amino_acid]
+        elif variant_type == "sub":
+            columns[f"{key}_ref"][i] = ord(sequence[0])
+
+
+def parse_variant_columns(
+    variants: Iterable[str],
+    targetseq: Optional[Union[str, TargetSequence, TargetRegistry]] = None,
+    expected_prefix: Optional[str] = None,
+) -> VariantColumns:
+    """Parse many MAVE-HGVS strings into NumPy arrays describing each variant.
+
+    This validates the variant strings in the same way as
+    :py:func:`mavehgvs.util.parse_variant_strings`, but does not create
+    :py:class:`Variant` objects, so downstream filtering and aggregation can use
+    vectorized operations.
+
+    Parameters
+    ----------
+    variants : Iterable[str]
+        Iterable of MAVE-HGVS strings to parse.
+    targetseq : Optional[Union[str, TargetSequence, TargetRegistry]]
+        If provided, all variants will be validated for agreement with this sequence.
+        See the documentation for :py:class:`Variant` for further details.
+        A target sequence string is prepared once as a :py:class:`TargetSequence`
+        if possible.
+    expected_prefix : Optional[str]
+        If provided, all variants will be expected to have the same single-letter
+        prefix.
+        Variants that do not have this prefix will be treated as invalid.
+
+    Returns
+    -------
+    VariantColumns
+        The arrays describing each variant.
+
+    """
+    if expected_prefix is not None and expected_prefix not in list(PREFIXES):
+        raise ValueError("invalid expected prefix")
+
+    targetseq = _prepare_target(targetseq)
+    variant_strings = list(variants)
+    n = len(variant_strings)
+    errors = [None] * n
+
+    # fill preallocated typed arrays in the loop and share their memory with NumPy
+    columns = {
+        key: array(typecode, bytes(n * array(typecode).itemsize))
+        for key, typecode, _ in _COLUMN_TYPES
+    }
+    columns["has_end"] = array("B", bytes(n))
+    valid = columns["valid"] = array("B", b"\x01" * n)
+    event_count = columns["event_count"] = array("q", [1]) * n
+    prefix_codes = columns["prefix"]
+    type_codes = columns["variant_type"]
+    starts = columns["start"]
+    start_intronic = columns["start_intronic"]
+    start_utr = columns["start_utr"]
+    start_refs = columns["start_ref"]
+
+    try_parse = Variant._try_parse
+    position_values = dict()  # values of each single position string
+    for i, s in enumerate(variant_strings):
+        parsed = try_parse(s, targetseq, False)
+        if parsed.__class__ is ErrorCode:
+            prefix_tuple = Variant._read_prefix(s)
+            target_id = None if prefix_tuple is None else prefix_tuple[0]
+            errors[i] = str(Variant._parse_error(parsed, target_id, targetseq))
+            valid[i] = event_count[i] = 0
+            continue
+        _, prefix, variant_count, variant_types, positions, sequences = parsed
+        if expected_prefix is not None and prefix != expected_prefix:
+            errors[i] = "unexpected variant prefix"
+            valid[i] = event_count[i] = 0
+            continue
+
+        prefix_codes[i] = _PREFIX_CODES[prefix]
+        if positions.__class__ is not str:
+            _fill_columns(columns, i, prefix, *parsed[2:])
+            continue
+
+        # most variants are single events at a single unparsed position
+        type_codes[i] = _VARIANT_TYPE_CODES[variant_types]
+        if positions.isdigit():
+            starts[i] = int(positions)
+        else:
+            values = position_values.get(positions)
+            if values is None:
+                values = position_values[positions] = _position_values(positions)
+            starts[i], start_intronic[i], start_utr[i], start_refs[i] = values
+        if variant_types == "sub" and prefix != "p":
+            start_refs[i] = ord(sequences[0])
+
+    result = {
+        key: np.frombuffer(columns[key], dtype=dtype) for key, _, dtype in _COLUMN_TYPES
+    }
+    has_end = np.frombuffer(columns["has_end"], dtype=bool)
+    for start_key, end_key in _END_COLUMNS:
+        result[end_key] = np.where(has_end, result[end_key], result[start_key])
+
+    return VariantColumns(variant_strings, targetseq, result, errors)
+
+
+def _reference_codes(references: Any) -> np.ndarray:
+    """Convert reference residues to an array of ASCII codes.
+
+    Parameters
+    ----------
+    references : Any
+        Array-like of ASCII codes, or of single-letter residues or three-letter amino
+        acid codes.
+        Empty strings and 0 denote an unknown reference.
+
+    Returns
+    -------
+    numpy.ndarray
+        The ASCII code of each single-letter reference residue, or 0.
+
+    Raises
+    ------
+    ValueError
+        If any reference residue is not valid.
+
+    """
+    references = np.asarray(references)
+    if references.dtype.kind in "iu":
+        return references.astype(np.uint8)
+    elif references.dtype.kind in "SU":
+        # convert each distinct value once
+        unique, inverse = np.unique(references.astype(str), return_inverse=True)
+        codes = list()
+        for x in unique.tolist():
+            if len(x) == 0:
+                codes.append(0)
+            elif len(x) == 1:
+                codes.append(ord(x))
+            elif x in _AMINO_ACID_REFERENCES:
+                codes.append(_AMINO_ACID_REFERENCES[x])
+            else:
+                raise ValueError(f"invalid reference residue '{x}'")
+        return np.array(codes, dtype=np.uint8)[inverse.reshape(-1)]
+    else:
+        raise ValueError("reference residues must be strings or integer codes")
+
+
+def _target_array(targetseq: Union[str, TargetSequence]) -> np.ndarray:
+    """Return the ASCII code of each residue of a target sequence.
+
+    The array is kept on a :py:class:`TargetSequence`, so the sequence is only encoded
+    once, which matters for sequences that are read from a memory-mapped file.
+
+    Parameters
+    ----------
+    targetseq : Union[str, TargetSequence]
+        The target sequence.
+
+    Returns
+    -------
+    numpy.ndarray
+        Read-only uint8 array of residue codes.
+
+    """
+    if isinstance(targetseq, TargetSequence):
+        if targetseq._residue_array is None:
+            targetseq._residue_array = np.frombuffer(
+                str(targetseq).encode("ascii"), dtype=np.uint8
+            )
+        return targetseq._residue_array
+    return np.frombuffer(str(targetseq).encode("ascii"), dtype=np.uint8)
+
+
+def validate_target(
+    targetseq: Union[str, TargetSequence],
+    positions: Any,
+    references: Optional[Any] = None,
+) -> np.ndarray:
+    """Validate many positions and reference residues against a target sequence.
+
+    This applies the same checks as validating a variant with a target sequence to
+    whole arrays at once, which is much faster for datasets of single substitutions.
+    Positions using the extended syntax cannot be validated and should not be
+    included.
+    Positions less than 1 are out of bounds.
+
+    Parameters
+    ----------
+    targetseq : Union[str, TargetSequence]
+        The target sequence.
+        See the documentation for :py:class:`Variant` for further details.
+    positions : Any
+        Array-like of 1-based positions, such as :py:attr:`VariantColumns.start`.
+    references : Optional[Any]
+        Array-like of the reference residue at each position, which can be ASCII
+        codes (such as :py:attr:`VariantColumns.start_ref`), single-letter residues,
+        or three-letter amino acid codes.
+        Empty strings and 0 denote an unknown reference, which is not checked.
+        If None, only the bounds of the positions are checked.
+
+    Returns
+    -------
+    numpy.ndarray
+        The target validation code for each position, which is one of
+        :py:data:`TARGET_VALID`, :py:data:`TARGET_OUT_OF_BOUNDS`, or
+        :py:data:`TARGET_MISMATCH`.
+
+    Raises
+    ------
+    ValueError
+        If the positions and references have different lengths, any reference
+        residue is not valid, or the target sequence is a :py:class:`TargetRegistry`.
+
+    """
+    if isinstance(targetseq, TargetRegistry):
+        raise ValueError(
+            "target registries are not supported, parse the variants with the "
+            "registry instead"
+        )
+    target = _target_array(targetseq)
+    positions = np.asarray(positions, dtype=np.int64).reshape(-1)
+    codes = np.zeros(len(positions), dtype=np.uint8)
+
+    out_of_bounds = (positions < 1) | (positions > len(target))
+    codes[out_of_bounds] = TARGET_OUT_OF_BOUNDS
+
+    if references is not None:
+        references = _reference_codes(references)
+        if len(references) != len(positions):
+            raise ValueError("positions and references must have the same length")
+        checked = np.flatnonzero((references != 0) & ~out_of_bounds)
+        mismatch = target[positions[checked] - 1] != references[checked]
+        codes[checked[mismatch]] = TARGET_MISMATCH
+
+    return codes
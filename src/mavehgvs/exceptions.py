@@ -1,7 +1,101 @@
-__all__ = ["MaveHgvsParseError"]
+from enum import IntEnum
+from typing import Optional
+
+__all__ = ["MaveHgvsParseError", "ErrorCode"]
+
+
+class ErrorCode(IntEnum):
+    """Reasons that a MAVE-HGVS variant is not valid.
+
+    Each :py:class:`MaveHgvsParseError` has a code, so invalid variants can be
+    counted or grouped without comparing error messages.
+    The :py:attr:`message` of each code is the error message without details such as
+    the invalid value.
+    """
+
+    INVALID = 1
+    REGEX = 2
+    UNEXPECTED_PREFIX = 3
+    POSITION_ORDER = 4
+    INSERTION_POSITIONS = 5
+    VARIANT_ORDER = 6
+    OVERLAP = 7
+    SAME_POSITION = 8
+    MULTI_TARGET_IDENTICAL = 9
+    MULTIPLE_FRAME_SHIFTS = 10
+    FRAME_SHIFT_ORDER = 11
+    OUT_OF_BOUNDS = 12
+    REFERENCE_MISMATCH = 13
+    MISSING_TARGET_ID = 14
+    UNKNOWN_TARGET_ID = 15
+    INVALID_PREFIX = 16
+    INVALID_TARGET_ID = 17
+    INVALID_VARIANT_TYPE = 18
+    INVALID_POSITION = 19
+    INVALID_SEQUENCE = 20
+    INVALID_DICTIONARY = 21
+    INVALID_MULTI_VARIANT = 22
+    INVALID_TARGET = 23
+
+    @property
+    def message(self) -> str:
+        """str: the error message for this code."""
+        return _messages[self]
+
+
+_messages = {
+    ErrorCode.INVALID: "invalid variant",
+    ErrorCode.REGEX: "failed regular expression validation",
+    ErrorCode.UNEXPECTED_PREFIX: "unexpected variant prefix",
+    ErrorCode.POSITION_ORDER: "start position must be before end position",
+    ErrorCode.INSERTION_POSITIONS: "insertion positions must be adjacent",
+    ErrorCode.VARIANT_ORDER: "multi-variants not in sorted order",
+    ErrorCode.OVERLAP: "multi-variant has overlapping changes",
+    ErrorCode.SAME_POSITION: "multi-variant has multiple changes at same position",
+    ErrorCode.MULTI_TARGET_IDENTICAL: "multi-variants cannot contain "
+    "target-identical variants",
+    ErrorCode.MULTIPLE_FRAME_SHIFTS: "maximum of one frame shift is permitted",
+    ErrorCode.FRAME_SHIFT_ORDER: "no variants are permitted to follow a frame shift",
+    ErrorCode.OUT_OF_BOUNDS: "variant coordinate out of bounds",
+    ErrorCode.REFERENCE_MISMATCH: "variant reference does not match target",
+    ErrorCode.MISSING_TARGET_ID: "variant has no target identifier",
+    ErrorCode.UNKNOWN_TARGET_ID: "unknown target identifier",
+    ErrorCode.INVALID_PREFIX: "invalid variant prefix",
+    ErrorCode.INVALID_TARGET_ID: "invalid target identifier",
+    ErrorCode.INVALID_VARIANT_TYPE: "invalid variant type",
+    ErrorCode.INVALID_POSITION: "invalid variant position",
+    ErrorCode.INVALID_SEQUENCE: "invalid variant sequence",
+    ErrorCode.INVALID_DICTIONARY: "invalid variant dictionary",
+    ErrorCode.INVALID_MULTI_VARIANT: "invalid multi-variant",
+    ErrorCode.INVALID_TARGET: "invalid target sequence",
+}
+"""Dict[ErrorCode, str]: the message for each error code.
+"""
 
 
 class MaveHgvsParseError(Exception):
-    """Exception to use when a MAVE-HGVS string is not valid."""
+    """Exception to use when a MAVE-HGVS string is not valid.
+
+    Attributes
+    ----------
+    code : ErrorCode
+        The reason the variant is not valid.
+
+    """
+
+    def __init__(
+        self, message: Optional[str] = None, code: ErrorCode = ErrorCode.INVALID
+    ) -> None:
+        """Create the exception.
+
+        Parameters
+        ----------
+        message : Optional[str]
+            The error message.
+            If None, the message of the error code is used.
+        code : ErrorCode
+            The reason the variant is not valid.
 
-    pass
+        """
+        super().__init__(code.message if message is None else message)
+        self.code = code
@@ -1,14 +1,72 @@
-from mavehgvs.patterns.dna import dna_single_variant as dsv, dna_multi_variant as dmv
-from mavehgvs.patterns.rna import rna_single_variant as rsv, rna_multi_variant as rmv
+from mavehgvs.patterns.dna import (
+    dna_single_variant as dsv,
+    dna_multi_variant as dmv,
+    dna_variant_c,
+    dna_variant_n,
+    dna_variant_gmo,
+)
+from mavehgvs.patterns.rna import (
+    rna_single_variant as rsv,
+    rna_multi_variant as rmv,
+    rna_variant,
+)
 from mavehgvs.patterns.protein import (
     pro_single_variant as psv,
     pro_multi_variant as pmv,
+    pro_variant,
 )
 
+target_id: str = r"[a-zA-Z0-9_.-]+"
+"""str: Pattern matching a target identifier, excluding the trailing ``:``.
+"""
+
 any_variant = (
-    r"(?:(?P<target_id>[a-zA-Z0-9_.-]+):)?"
+    rf"(?:(?P<target_id>{target_id}):)?"
     + r"(?P<variant>"
     + rf"(?P<single_variant>{r'|'.join([dsv, rsv, psv])})|"
     + rf"(?P<multi_variant>{r'|'.join([dmv, rmv, pmv])})"
     + r")"
 )
+
+variant_events = {
+    "c": dna_variant_c,
+    "n": dna_variant_n,
+    "g": dna_variant_gmo,
+    "m": dna_variant_gmo,
+    "o": dna_variant_gmo,
+    "r": rna_variant,
+    "p": pro_variant,
+}
+"""Dict[str, str]: Patterns matching a single variant event for each prefix.
+
+The patterns match the portion of the variant following the prefix and ``.``
+characters.
+"""
+
+multi_variant_events = {
+    prefix: rf"{pattern}(?=[;\]])" for prefix, pattern in variant_events.items()
+}
+"""Dict[str, str]: Patterns matching one event of a multi-variant for each prefix.
+
+The patterns match a single variant event that must be followed by the ``;`` event
+separator or the closing ``]`` of the multi-variant.
+They are used to tokenize the events of a multi-variant in a single pass.
+"""
+
+variant_event_characters = {
+    "c": "*+-0123456789=>ACGT_deilnpsu[;]",
+    "n": "+-0123456789=>ACGT_deilnpsu[;]",
+    "g": "0123456789=>ACGT_deilnpsu[;]",
+    "m": "0123456789=>ACGT_deilnpsu[;]",
+    "o": "0123456789=>ACGT_deilnpsu[;]",
+    "r": "+-0123456789=>_acdegilnpsu[;]",
+    "p": "()0123456789=ACGHILMPSTV_adefghilnoprstuy[;]",
+}
+"""Dict[str, str]: Characters that can appear after the prefix and ``.`` characters
+for each prefix.
+
+These are all the characters that can be matched by the event patterns for the
+prefix, plus the brackets and separators of multi-variants.
+A string containing any other character cannot be a valid variant with that prefix,
+so it can be rejected without trying the patterns.
+"""
@@ -1,7 +1,7 @@
 import re
-from functools import total_ordering
+from typing import Callable, Dict, Optional, Tuple
 
-from mavehgvs.exceptions import MaveHgvsParseError
+from mavehgvs.exceptions import ErrorCode, MaveHgvsParseError
 from mavehgvs.patterns.position import pos
 from mavehgvs.patterns.protein import amino_acid
 
@@ -16,11 +16,15 @@ pos_with_groups: str = (
 """
 
 
-@total_ordering
 class VariantPosition:
     """Class for storing a variant position.
 
     The class includes special fields for variants using the extended position syntax.
+
+    VariantPosition objects are immutable and hashable, so a single object can be shared
+    by every variant at the same position.
+    Use :py:meth:`intern` to retrieve a shared object instead of creating a new one.
+
     Attributes
     ----------
     position : Optional[int]
@@ -38,6 +42,8 @@ class VariantPosition:
         their position is that of the first base of the 3' exon.
     utr : Optional[bool]
         True if the position is in the UTR. None for all other positions.
+    sort_key : Tuple[int, int, int]
+        Key that sorts positions in sequence order.
 
     """
 
@@ -49,6 +55,26 @@ class VariantPosition:
     groups in :py:data:`pos_extended`.
     """
 
+    __slots__ = (
+        "_position",
+        "_amino_acid",
+        "_intronic_position",
+        "_utr",
+        "_sort_key",
+        "_hash",
+    )
+
+    _interned: Dict[str, "VariantPosition"] = dict()
+    """Dict[str, VariantPosition]: shared objects for each interned position string.
+    """
+
+    _intern_maxsize: int = 1_000_000
+    """int: maximum number of interned position strings.
+
+    Once this number is reached, :py:meth:`intern` returns new objects for position
+    strings that have not already been interned.
+    """
+
     def __init__(self, pos_str: str) -> None:
         """Parse a position string into a VariantPosition object.
 
@@ -61,31 +87,175 @@ class VariantPosition:
         try:
             gdict = VariantPosition.fullmatch(pos_str).groupdict()
         except AttributeError:
-            raise MaveHgvsParseError(f"invalid variant position string '{pos_str}'")
-
-        self.position = None
-        self.amino_acid = None
-        self.intronic_position = None
-        self.utr = None
+            raise MaveHgvsParseError(
+                f"invalid variant position string '{pos_str}'",
+                ErrorCode.INVALID_POSITION,
+            )
 
+        utr = None
         if gdict["position"].startswith("*"):  # 3' UTR position
-            self.utr = True
-            self.position = int(gdict["position"][1:])
+            utr = True
+            position = int(gdict["position"][1:])
         else:
             if gdict["position"].startswith("-"):  # 5' UTR position
-                self.utr = True
-            self.position = int(gdict["position"])
+                utr = True
+            position = int(gdict["position"])
 
-        if gdict["position_aa"] is not None:
-            self.amino_acid = gdict["position_aa"]
+        amino_acid = gdict["position_aa"]
 
         if gdict["position_intron"] is not None:
-            self.intronic_position = int(gdict["position_intron"])
+            intronic_position = int(gdict["position_intron"])
+        else:
+            intronic_position = None
 
-        if self.amino_acid is not None and (
-            self.intronic_position is not None or self.utr is not None
+        if amino_acid is not None and (
+            intronic_position is not None or utr is not None
         ):
-            raise MaveHgvsParseError("invalid variant")
+            raise MaveHgvsParseError("invalid variant", ErrorCode.INVALID_POSITION)
+
+        self._set_values(position, amino_acid, intronic_position, utr)
+
+    def _set_values(
+        self,
+        position: int,
+        amino_acid: Optional[str],
+        intronic_position: Optional[int],
+        utr: Optional[bool],
+    ) -> None:
+        """Set the values of the position and compute its sort key.
+
+        Parameters
+        ----------
+        position : int
+            The position as an integer.
+        amino_acid : Optional[str]
+            The amino acid at this position for protein variants.
+        intronic_position : Optional[int]
+            The number of bases into the intron for intronic positions.
+        utr : Optional[bool]
+            True if the position is in the UTR, else None.
+
+        Returns
+        -------
+        None
+
+        """
+        self._position = position
+        self._amino_acid = amino_acid
+        self._intronic_position = intronic_position
+        self._utr = utr
+        self._hash = None
+
+        # 5' UTR < non-UTR < 3' UTR, and intronic positions are never 0 so
+        # non-intronic positions sort between the two halves of the adjacent introns
+        if utr is None:
+            region = 1
+        elif position < 0:
+            region = 0
+        else:
+            region = 2
+        self._sort_key = (region, position, intronic_position or 0)
+
+    @classmethod
+    def _from_values(
+        cls,
+        position: int,
+        amino_acid: Optional[str],
+        intronic_position: Optional[int],
+        utr: Optional[bool],
+    ) -> "VariantPosition":
+        """Create a VariantPosition from its values without parsing a position string.
+
+        The values are not validated, so this should only be used with values taken
+        from another VariantPosition.
+
+        Parameters
+        ----------
+        position : int
+            The position as an integer.
+        amino_acid : Optional[str]
+            The amino acid at this position for protein variants.
+        intronic_position : Optional[int]
+            The number of bases into the intron for intronic positions.
+        utr : Optional[bool]
+            True if the position is in the UTR, else None.
+
+        Returns
+        -------
+        VariantPosition
+            The new object.
+
+        """
+        obj = cls.__new__(cls)
+        obj._set_values(position, amino_acid, intronic_position, utr)
+        return obj
+
+    def __reduce__(self) -> Tuple[Callable[[str], "VariantPosition"], Tuple[str]]:
+        # pickled positions are shared with interned positions when they are loaded
+        return VariantPosition.intern, (repr(self),)
+
+    @classmethod
+    def intern(cls, pos_str: str) -> "VariantPosition":
+        """Return a shared VariantPosition object for a position string.
+
+        The position string is only parsed the first time it is interned.
+        Later calls with the same string return the same object.
+
+        Parameters
+        ----------
+        pos_str : str
+            The string to convert to a VariantPosition object.
+
+        Returns
+        -------
+        VariantPosition
+            The shared object for this position string.
+
+        Raises
+        ------
+        MaveHgvsParseError
+            If the position string is not valid.
+
+        """
+        try:
+            return cls._interned[pos_str]
+        except KeyError:
+            position = cls(pos_str)
+            if len(cls._interned) < cls._intern_maxsize:
+                cls._interned[pos_str] = position
+            return position
+
+    @property
+    def position(self) -> Optional[int]:
+        """The position as an integer."""
+        return self._position
+
+    @property
+    def amino_acid(self) -> Optional[str]:
+        """The amino acid at this position for protein variants."""
+        return self._amino_acid
+
+    @property
+    def intronic_position(self) -> Optional[int]:
+        """The number of bases into the intron for intronic positions."""
+        return self._intronic_position
+
+    @property
+    def utr(self) -> Optional[bool]:
+        """True if the position is in the UTR. None for all other positions."""
+        return self._utr
+
+    @property
+    def sort_key(self) -> Tuple[int, int, int]:
+        """Key that sorts positions in sequence order.
+
+        The key is a tuple of the region (0 for the 5' UTR, 1 for positions outside
+        the UTR, and 2 for the 3' UTR), the position, and the intronic position (0 for
+        non-intronic positions).
+        Positions are equal if and only if their keys are equal, so the key can be
+        used directly for sorting large numbers of positions.
+        """
+        return self._sort_key
 
     def __repr__(self) -> str:
         """The object representation is equivalent to the input string.
@@ -114,9 +284,6 @@ class VariantPosition:
     def __lt__(self, other: "VariantPosition") -> bool:
         """Less than comparison operator.
 
-        Other comparison operators will be filled in using
-        :py:func:`functools.total_ordering`.
-
         Parameters
         ----------
         other : VariantPosition
@@ -129,32 +296,66 @@ class VariantPosition:
             else False.
 
         """
-        if self.utr == other.utr:
-            if self.position == other.position:
-                if (
-                    self.intronic_position == other.intronic_position
-                ):  # pragma: no cover
-                    # this case is covered by __eq__
-                    return False
-                elif self.intronic_position is None:
-                    return other.intronic_position > 0
-                elif other.intronic_position is None:
-                    return self.intronic_position < 0
-                else:
-                    return self.intronic_position < other.intronic_position
-            else:
-                return self.position < other.position
-        else:  # 5' < non-UTR < 3'
-            if self.utr:
-                if self.position < 0:  # self is in 5' UTR
-                    return True
-                else:  # self is in 3' UTR
-                    return False
-            else:
-                if other.position < 0:  # other is in 5' UTR
-                    return False
-                else:  # other is in 3' UTR
-                    return True
+        if not isinstance(other, VariantPosition):
+            return NotImplemented
+        return self._sort_key < other._sort_key
+
+    def __le__(self, other: "VariantPosition") -> bool:
+        """Less than or equal to comparison operator.
+
+        Parameters
+        ----------
+        other : VariantPosition
+            The other VariantPosition to compare to.
+
+        Returns
+        -------
+        bool
+            True if this position evaluates as less than or equal to the other
+            position; else False.
+
+        """
+        if not isinstance(other, VariantPosition):
+            return NotImplemented
+        return self._sort_key <= other._sort_key
+
+    def __gt__(self, other: "VariantPosition") -> bool:
+        """Greater than comparison operator.
+
+        Parameters
+        ----------
+        other : VariantPosition
+            The other VariantPosition to compare to.
+
+        Returns
+        -------
+        bool
+            True if this position evaluates as strictly greater than the other
+            position; else False.
+
+        """
+        if not isinstance(other, VariantPosition):
+            return NotImplemented
+        return self._sort_key > other._sort_key
+
+    def __ge__(self, other: "VariantPosition") -> bool:
+        """Greater than or equal to comparison operator.
+
+        Parameters
+        ----------
+        other : VariantPosition
+            The other VariantPosition to compare to.
+
+        Returns
+        -------
+        bool
+            True if this position evaluates as greater than or equal to the other
+            position; else False.
+
+        """
+        if not isinstance(other, VariantPosition):
+            return NotImplemented
+        return self._sort_key >= other._sort_key
 
     def __eq__(self, other: "VariantPosition") -> bool:
         """Equality comparison operator.
@@ -162,9 +363,6 @@ class VariantPosition:
         Note that the amino acid portion of a protein position is not used in this
         comparison.
 
-        Other comparison operators will be filled in using
-        :py:func:`functools.total_ordering`.
-
         Parameters
         ----------
         other : VariantPosition
@@ -176,11 +374,9 @@ class VariantPosition:
             True if this position is the same as the other position; else False.
 
         """
-        return (self.position, self.intronic_position, self.utr) == (
-            other.position,
-            other.intronic_position,
-            other.utr,
-        )
+        if not isinstance(other, VariantPosition):
+            return NotImplemented
+        return self._sort_key == other._sort_key
 
     def __ne__(self, other: "VariantPosition") -> bool:
         """Not equal comparison operator.
@@ -188,9 +384,6 @@ class VariantPosition:
         Note that the amino acid portion of a protein position is not used in this
         comparison.
 
-        Other comparison operators will be filled in using
-        :py:func:`functools.total_ordering`.
-
         Parameters
         ----------
         other : VariantPosition
@@ -202,11 +395,28 @@ class VariantPosition:
             True if this position is not the same as the other position; else False.
 
         """
-        return (self.position, self.intronic_position, self.utr) != (
-            other.position,
-            other.intronic_position,
-            other.utr,
-        )
+        if not isinstance(other, VariantPosition):
+            return NotImplemented
+        return self._sort_key != other._sort_key
+
+    def __hash__(self) -> int:
+        """Hash function consistent with the equality comparison operator.
+
+        Like the equality comparison, the hash does not use the amino acid portion of a
+        protein position.
+        The hash is only computed the first time it is needed.
+
+        Returns
+        -------
+        int
+            The hash of the position.
+
+        """
+        if self._hash is None:
+            # the sort key only contains integers, so the hash is the same in every
+            # interpreter process
+            self._hash = hash(self._sort_key)
+        return self._hash
 
     def is_utr(self) -> bool:
         """Return whether this is a UTR position.
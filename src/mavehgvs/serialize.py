@@ -0,0 +1,405 @@
+"""Compact binary encoding for parsed variants.
+
+Encoded variants can be decoded without parsing the variant string again, so this is
+much faster than sending variant strings between processes and much smaller than
+pickling the objects directly.
+:py:class:`Variant` objects use this encoding when they are pickled.
+
+The first byte of all encoded data is the format version.
+A single variant is encoded as a variant record, and a list of variants is encoded as
+the number of variants followed by a record for each variant.
+
+A variant record is the prefix code, a flags byte (1 if the variant has a target
+identifier and 2 if it is a multi-variant), the length-prefixed target identifier if
+present, the number of events for a multi-variant, and an event record for each event.
+An event record is a byte containing the variant type code and the number of
+positions, the positions, and the length-prefixed sequences for the event.
+A position is a flags byte (1 for UTR positions, 2 for intronic positions, 4 for
+protein positions, and 8 if the values are 64-bit), the position, the intronic
+position if present, and the amino acid code if present.
+Decoded variants that share a position also share a single
+:py:class:`VariantPosition` object.
+Lengths are a single byte, or the byte 255 followed by a 32-bit length.
+"""
+
+import struct
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from mavehgvs.position import VariantPosition
+from mavehgvs.variant import Variant
+
+__all__ = ["FORMAT_VERSION", "dumps", "loads", "dumps_many", "loads_many"]
+
+FORMAT_VERSION: int = 1
+"""int: version of the binary format written by :py:func:`dumps` and
+:py:func:`dumps_many`.
+"""
+
+# the codes written for these values are the index in each table, so under the
+# current FORMAT_VERSION entries may only be appended; reordering or removing an
+# entry requires a new FORMAT_VERSION
+_PREFIXES = ("c", "g", "m", "n", "o", "p", "r")
+_VARIANT_TYPES = ("equal", "sub", "fs", "del", "dup", "ins", "delins")
+_AMINO_ACIDS = (
+    "Ala",
+    "Arg",
+    "Asn",
+    "Asp",
+    "Cys",
+    "Gln",
+    "Glu",
+    "Gly",
+    "His",
+    "Ile",
+    "Leu",
+    "Lys",
+    "Met",
+    "Phe",
+    "Pro",
+    "Ser",
+    "Thr",
+    "Trp",
+    "Tyr",
+    "Val",
+    "Ter",
+)
+
+_PREFIX_CODES = {x: i for i, x in enumerate(_PREFIXES)}
+_VARIANT_TYPE_CODES = {x: i for i, x in enumerate(_VARIANT_TYPES)}
+_AMINO_ACID_CODES = {x: i for i, x in enumerate(_AMINO_ACIDS)}
+
+_NONE_RECORD = 0xFF  # prefix code for a missing variant in a list of variants
+
+_TARGET_ID_FLAG = 1
+_MULTI_VARIANT_FLAG = 2
+
+_UTR_FLAG = 1
+_INTRONIC_FLAG = 2
+_AMINO_ACID_FLAG = 4
+_WIDE_FLAG = 8
+
+_DECODING_ERRORS = (AttributeError, IndexError, struct.error, UnicodeDecodeError)
+
+_uint32 = struct.Struct("<I")
+
+
+def _position_struct(flags: int) -> struct.Struct:
+    value_format = "q" if flags & _WIDE_FLAG else "i"
+    if flags & _INTRONIC_FLAG:
+        value_format *= 2
+    if flags & _AMINO_ACID_FLAG:
+        value_format += "B"
+    return struct.Struct(f"<B{value_format}")
+
+
+_POSITION_STRUCTS = tuple(_position_struct(flags) for flags in range(16))
+"""Tuple[struct.Struct, ...]: struct for an encoded position with each flags value.
+"""
+
+_decoded_positions: Dict[bytes, VariantPosition] = dict()
+"""Dict[bytes, VariantPosition]: shared objects for each decoded position.
+
+Like interned positions, this is limited to
+:py:attr:`VariantPosition._intern_maxsize` entries.
+"""
+
+
+def _pack_length(n: int) -> bytes:
+    if n < 0xFF:
+        return bytes((n,))
+    else:
+        return b"\xff" + _uint32.pack(n)
+
+
+def _unpack_length(data: bytes, offset: int) -> Tuple[int, int]:
+    n = data[offset]
+    if n < 0xFF:
+        return n, offset + 1
+    else:
+        return _uint32.unpack_from(data, offset + 1)[0], offset + 5
+
+
+@lru_cache(maxsize=4096)
+def _pack_string(s: str) -> bytes:
+    b = s.encode("ascii")
+    return _pack_length(len(b)) + b
+
+
+def _unpack_string(data: bytes, offset: int) -> Tuple[str, int]:
+    n, offset = _unpack_length(data, offset)
+    return data[offset : offset + n].decode("ascii"), offset + n
+
+
+def _pack_position(pos: VariantPosition) -> bytes:
+    flags = _UTR_FLAG if pos.utr else 0
+    values = [pos.position]
+    if pos.intronic_position is not None:
+        flags |= _INTRONIC_FLAG
+        values.append(pos.intronic_position)
+    if pos.amino_acid is not None:
+        flags |= _AMINO_ACID_FLAG
+        values.append(_AMINO_ACID_CODES[pos.amino_acid])
+
+    try:
+        return _POSITION_STRUCTS[flags].pack(flags, *values)
+    except struct.error:  # values do not fit in 32 bits
+        flags |= _WIDE_FLAG
+        return _POSITION_STRUCTS[flags].pack(flags, *values)
+
+
+def _unpack_position(data: bytes, offset: int) -> Tuple[VariantPosition, int]:
+    position_struct = _POSITION_STRUCTS[data[offset]]
+    end = offset + position_struct.size
+
+    # identical positions are decoded into a single shared object
+    key = data[offset:end]
+    try:
+        return _decoded_positions[key], end
+    except KeyError:
+        pass
+
+    flags, position, *values = position_struct.unpack_from(data, offset)
+    intronic_position = values[0] if flags & _INTRONIC_FLAG else None
+    amino_acid = _AMINO_ACIDS[values[-1]] if flags & _AMINO_ACID_FLAG else None
+    utr = True if flags & _UTR_FLAG else None
+
+    pos = VariantPosition._from_values(position, amino_acid, intronic_position, utr)
+    if len(_decoded_positions) < VariantPosition._intern_maxsize:
+        _decoded_positions[key] = pos
+    return pos, end
+
+
+def _pack_event(
+    prefix: str,
+    variant_type: str,
+    positions: Optional[
+        Union[VariantPosition, Tuple[VariantPosition, VariantPosition]]
+    ],
+    sequences: Optional[Union[str, Tuple[str, str]]],
+) -> bytes:
+    code = _VARIANT_TYPE_CODES[variant_type] << 2
+    if positions is None:
+        parts = [bytes((code,))]
+    elif isinstance(positions, tuple):
+        parts = [
+            bytes((code | 2,)),
+            _pack_position(positions[0]),
+            _pack_position(positions[1]),
+        ]
+    else:
+        parts = [bytes((code | 1,)), _pack_position(positions)]
+
+    if variant_type == "sub":
+        if prefix != "p":  # protein reference is the amino acid of the position
+            parts.append(_pack_string(sequences[0]))
+        parts.append(_pack_string(sequences[1]))
+    elif sequences is not None:
+        parts.append(_pack_string(sequences))
+
+    return b"".join(parts)
+
+
+def _unpack_event(
+    data: bytes, offset: int, prefix: str
+) -> Tuple[
+    str,
+    Optional[Union[VariantPosition, Tuple[VariantPosition, VariantPosition]]],
+    Optional[Union[str, Tuple[str, str]]],
+    int,
+]:
+    code = data[offset]
+    offset += 1
+    variant_type = _VARIANT_TYPES[code >> 2]
+    position_count = code & 3
+
+    if position_count == 0:
+        positions = None
+    elif position_count == 1:
+        positions, offset = _unpack_position(data, offset)
+    else:
+        start, offset = _unpack_position(data, offset)
+        end, offset = _unpack_position(data, offset)
+        positions = (start, end)
+
+    if variant_type == "sub":
+        if prefix == "p":
+            ref = positions.amino_acid
+        else:
+            ref, offset = _unpack_string(data, offset)
+        new, offset = _unpack_string(data, offset)
+        sequences = (ref, new)
+    elif variant_type in ("ins", "delins", "equal"):
+        sequences, offset = _unpack_string(data, offset)
+    else:
+        sequences = None
+
+    return variant_type, positions, sequences, offset
+
+
+def _pack_variant(v: Optional[Variant]) -> bytes:
+    if v is None:
+        return bytes((_NONE_RECORD,))
+
+    prefix = v._prefix
+    flags = 0
+    parts = [b""]
+    if v._target_id is not None:
+        flags |= _TARGET_ID_FLAG
+        parts.append(_pack_string(v._target_id))
+    if v._variant_count > 1:
+        flags |= _MULTI_VARIANT_FLAG
+        parts.append(_pack_length(v._variant_count))
+        parts.extend(
+            _pack_event(prefix, *t)
+            for t in zip(v._variant_types, v._positions, v._sequences)
+        )
+    else:
+        parts.append(
+            _pack_event(prefix, v._variant_types, v._single_positions(), v._sequences)
+        )
+    parts[0] = bytes((_PREFIX_CODES[prefix], flags))
+    return b"".join(parts)
+
+
+def _unpack_variant(data: bytes, offset: int) -> Tuple[Optional[Variant], int]:
+    if data[offset] == _NONE_RECORD:
+        return None, offset + 1
+
+    prefix = _PREFIXES[data[offset]]
+    flags = data[offset + 1]
+    offset += 2
+    if flags & _TARGET_ID_FLAG:
+        target_id, offset = _unpack_string(data, offset)
+    else:
+        target_id = None
+
+    v = Variant.__new__(Variant)
+    if flags & _MULTI_VARIANT_FLAG:
+        variant_count, offset = _unpack_length(data, offset)
+        events = list()
+        for _ in range(variant_count):
+            *event, offset = _unpack_event(data, offset, prefix)
+            events.append(event)
+        v._variant_types, v._positions, v._sequences = (tuple(x) for x in zip(*events))
+    else:
+        variant_count = 1
+        (
+            v._variant_types,
+            v._positions,
+            v._sequences,
+            offset,
+        ) = _unpack_event(data, offset, prefix)
+    v._target_id = target_id
+    v._prefix = prefix
+    v._variant_count = variant_count
+    v._sort_key = None
+    v._hash = None
+    return v, offset
+
+
+def _check_version(data: bytes) -> None:
+    if len(data) == 0:
+        raise ValueError("no encoded variant data")
+    if data[0] != FORMAT_VERSION:
+        raise ValueError(f"unsupported encoded variant format version {data[0]}")
+
+
+def dumps(v: Variant) -> bytes:
+    """Encode a variant in the binary format.
+
+    Parameters
+    ----------
+    v : Variant
+        The variant to encode.
+
+    Returns
+    -------
+    bytes
+        The encoded variant.
+
+    """
+    return bytes((FORMAT_VERSION,)) + _pack_variant(v)
+
+
+def loads(data: bytes) -> Variant:
+    """Decode a variant encoded by :py:func:`dumps`.
+
+    Parameters
+    ----------
+    data : bytes
+        The encoded variant.
+
+    Returns
+    -------
+    Variant
+        The decoded variant.
+
+    Raises
+    ------
+    ValueError
+        If the data was encoded with an unsupported format version or is not a
+        single encoded variant.
+
+    """
+    _check_version(data)
+    try:
+        v, offset = _unpack_variant(data, 1)
+    except _DECODING_ERRORS:
+        raise ValueError("invalid encoded variant data")
+    if v is None or offset != len(data):
+        raise ValueError("invalid encoded variant data")
+    return v
+
+
+def dumps_many(variants: Iterable[Optional[Variant]]) -> bytes:
+    """Encode a list of variants in the binary format.
+
+    Parameters
+    ----------
+    variants : Iterable[Optional[Variant]]
+        The variants to encode. None values are allowed, such as the variants that
+        failed validation in the output of :py:func:`parse_variant_strings`.
+
+    Returns
+    -------
+    bytes
+        The encoded variants.
+
+    """
+    records = [_pack_variant(v) for v in variants]
+    return b"".join([bytes((FORMAT_VERSION,)), _pack_length(len(records)), *records])
+
+
+def loads_many(data: bytes) -> List[Optional[Variant]]:
+    """Decode a list of variants encoded by :py:func:`dumps_many`.
+
+    Parameters
+    ----------
+    data : bytes
+        The encoded variants.
+
+    Returns
+    -------
+    List[Optional[Variant]]
+        The decoded variants, with None for any missing variants.
+
+    Raises
+    ------
+    ValueError
+        If the data was encoded with an unsupported format version or is not a list
+        of encoded variants.
+
+    """
+    _check_version(data)
+    variants = list()
+    try:
+        count, offset = _unpack_length(data, 1)
+        for _ in range(count):
+            v, offset = _unpack_variant(data, offset)
+            variants.append(v)
+    except _DECODING_ERRORS:
+        raise ValueError("invalid encoded variant data")
+    if offset != len(data):
+        raise ValueError("invalid encoded variant data")
+    return variants
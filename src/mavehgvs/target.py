@@ -0,0 +1,834 @@
+"""Prepared target sequences for validating many variants.
+
+A :py:class:`TargetSequence` can be passed anywhere a target sequence string is
+accepted. It is checked and prepared once, so validating many variants against the
+same target does not repeat any setup for each variant.
+
+A :py:class:`TargetRegistry` can also be passed anywhere a target sequence string is
+accepted, and validates each variant against the target sequence for its target
+identifier. Registries can load target sequences from FASTA files as they are
+needed.
+"""
+
+import mmap
+import os
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+from fqfa.constants import AA_CODES
+from fqfa.util.infer import infer_all_sequence_types, infer_sequence_type
+
+from mavehgvs.cache import CacheInfo, ParseCache
+from mavehgvs.exceptions import ErrorCode, MaveHgvsParseError
+from mavehgvs.position import VariantPosition
+
+__all__ = ["TargetSequence", "TargetRegistry"]
+
+
+class TargetSequence:
+    """Target sequence prepared for validating variants.
+
+    The sequence is validated and its type is inferred or checked when the object is
+    created.
+    Variants are validated against a prepared target in the same way as they are
+    validated against a target sequence string, as described for
+    :py:class:`Variant`.
+
+    """
+
+    __slots__ = (
+        "_sequence",
+        "_sequence_type",
+        "_length",
+        "_amino_acids",
+        "_residue_array",
+        "_hash",
+    )
+
+    SEQUENCE_TYPES: Tuple[str, ...] = ("dna", "rna", "protein")
+    """Tuple[str, ...]: valid sequence types.
+    """
+
+    def __init__(self, sequence: str, sequence_type: Optional[str] = None) -> None:
+        """Prepare a target sequence.
+
+        Parameters
+        ----------
+        sequence : str
+            The target sequence.
+            This must be an amino acid sequence for protein variants or a nucleotide
+            sequence for coding/noncoding/genomic variants.
+            RNA sequences should be in lowercase, DNA sequences should be in
+            uppercase.
+        sequence_type : Optional[str]
+            The type of the sequence, which must be one of :py:attr:`SEQUENCE_TYPES`.
+            If None, the type is inferred from the sequence, with nucleotide types
+            taking priority over protein.
+
+        Raises
+        ------
+        ValueError
+            If the sequence is empty, if the type is not valid, if the type cannot be
+            inferred, or if the sequence is not valid for the type.
+
+        """
+        if not isinstance(sequence, str):
+            raise ValueError("target sequence must be a string")
+        if len(sequence) == 0:
+            raise ValueError("target sequence cannot be empty")
+
+        # sequence type inference uses uppercase sequences, including for RNA
+        if sequence_type is None:
+            sequence_type = infer_sequence_type(sequence.upper(), report_iupac=False)
+            if sequence_type is None:
+                raise ValueError("unable to infer target sequence type")
+        elif sequence_type not in self.SEQUENCE_TYPES:
+            raise ValueError(f"invalid target sequence type '{sequence_type}'")
+        elif sequence_type not in (
+            infer_all_sequence_types(sequence.upper(), report_iupac=False) or ()
+        ):
+            raise ValueError(f"target sequence is not a valid {sequence_type} sequence")
+
+        self._set_values(sequence, sequence_type)
+
+    def _set_values(self, sequence: str, sequence_type: str) -> None:
+        self._sequence = sequence
+        self._sequence_type = sequence_type
+        self._length = len(sequence)
+        self._amino_acids = None
+        self._residue_array = None  # set by mavehgvs.columnar when first needed
+        self._hash = hash((sequence, sequence_type))
+
+    @classmethod
+    def _from_values(cls, sequence: str, sequence_type: str) -> "TargetSequence":
+        """Create a prepared target from a sequence that has already been checked.
+
+        This is used when unpickling, so a long sequence is not checked again each
+        time it is sent to another process.
+        """
+        target = cls.__new__(cls)
+        target._set_values(sequence, sequence_type)
+        return target
+
+    @property
+    def sequence(self) -> str:
+        """The target sequence."""
+        return self._sequence
+
+    @property
+    def sequence_type(self) -> str:
+        """The type of the target sequence, one of :py:attr:`SEQUENCE_TYPES`."""
+        return self._sequence_type
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __str__(self) -> str:
+        return str(self._sequence)
+
+    def __repr__(self) -> str:
+        return f"TargetSequence({self._sequence!r}, {self._sequence_type!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, TargetSequence):
+            return NotImplemented
+        return (
+            self._sequence_type == other._sequence_type
+            and self._sequence == other._sequence
+        )
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        return TargetSequence._from_values, (self._sequence, self._sequence_type)
+
+    def _three_letter_codes(self) -> Tuple[Optional[str], ...]:
+        """Three-letter amino acid code for each position of the target.
+
+        This is created when a protein variant is first validated, so nucleotide
+        targets do not need it.
+
+        Returns
+        -------
+        Tuple[Optional[str], ...]
+            The three-letter code of each residue, or None for characters that are not
+            amino acids.
+
+        """
+        if self._amino_acids is None:
+            self._amino_acids = tuple(AA_CODES.get(x) for x in self._sequence)
+        return self._amino_acids
+
+    def validate(
+        self,
+        pos: Union[VariantPosition, Tuple[VariantPosition, VariantPosition]],
+        ref: Optional[str],
+    ) -> None:
+        """Determine whether the target portion of a variant matches the target
+        sequence.
+
+        Variants using extended syntax cannot be validated against the target and are
+        interpreted as valid/matching.
+
+        Parameters
+        ----------
+        pos : Union[VariantPosition, Tuple[VariantPosition, VariantPosition]]
+            Single variant position or start/end tuple for an indel.
+        ref : Optional[str]
+            Reference base to validate for nucleotide substitutions.
+            This should be None for amino acid substitutions, since the reference is
+            included in the VariantPosition.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        MaveHgvsParseError
+            If the reference base or amino acid does not match the target at the given
+            position
+        MaveHgvsParseError
+            If the position is outside the bounds of the target.
+
+        """
+        code = self._check(pos, ref)
+        if code is not None:
+            raise MaveHgvsParseError(code=code)
+
+    def _check(  # noqa: max-complexity: 12
+        self,
+        pos: Union[VariantPosition, Tuple[VariantPosition, VariantPosition]],
+        ref: Optional[str],
+    ) -> Optional[ErrorCode]:
+        """Determine whether the target portion of a variant matches the target
+        sequence without raising an exception.
+
+        Parameters
+        ----------
+        pos : Union[VariantPosition, Tuple[VariantPosition, VariantPosition]]
+            Single variant position or start/end tuple for an indel.
+        ref : Optional[str]
+            Reference base to validate for nucleotide substitutions.
+
+        Returns
+        -------
+        Optional[ErrorCode]
+            None if the variant matches the target, otherwise the reason it does not.
+            See :py:meth:`validate` for details.
+
+        """
+        if pos.__class__ is tuple:
+            start, end = pos
+            if (
+                start._utr is not None
+                or start._intronic_position is not None
+                or end._utr is not None
+                or end._intronic_position is not None
+            ):
+                return None
+            if start._position > self._length or end._position > self._length:
+                return ErrorCode.OUT_OF_BOUNDS
+            if start._amino_acid is not None:  # protein variant
+                amino_acids = self._three_letter_codes()
+                if (
+                    amino_acids[start._position - 1] != start._amino_acid
+                    or amino_acids[end._position - 1] != end._amino_acid
+                ):
+                    return ErrorCode.REFERENCE_MISMATCH
+        else:
+            if pos._utr is not None or pos._intronic_position is not None:
+                return None
+            if pos._position > self._length:
+                return ErrorCode.OUT_OF_BOUNDS
+            if ref is not None:  # nucleotide substitution
+                if self._sequence[pos._position - 1] != ref:
+                    return ErrorCode.REFERENCE_MISMATCH
+            elif pos._amino_acid is not None:  # protein variant
+                if self._three_letter_codes()[pos._position - 1] != pos._amino_acid:
+                    return ErrorCode.REFERENCE_MISMATCH
+        return None
+
+
+def _prepare_target(
+    targetseq: Optional[Union[str, TargetSequence, "TargetRegistry"]]
+) -> Optional[Union[str, TargetSequence, "TargetRegistry"]]:
+    """Prepare a target sequence string for validating many variants if possible.
+
+    Parameters
+    ----------
+    targetseq : Optional[Union[str, TargetSequence, TargetRegistry]]
+        The target sequence.
+
+    Returns
+    -------
+    Optional[Union[str, TargetSequence, TargetRegistry]]
+        The prepared target sequence, or the target sequence unchanged if it is None,
+        already prepared, a registry, or cannot be prepared.
+        Variants are validated in the same way against either result.
+
+    """
+    if targetseq is None or isinstance(targetseq, (TargetSequence, TargetRegistry)):
+        return targetseq
+    try:
+        return TargetSequence(targetseq)
+    except ValueError:
+        return targetseq
+
+
+class _FastaRecord(NamedTuple):
+    """Location of the sequence of a FASTA record.
+
+    This uses the same fields as a FASTA index (``.fai``) file.
+    """
+
+    length: int
+    offset: int
+    line_bases: int
+    line_width: int
+
+
+class _MappedSequence:
+    """Read-only sequence stored in a memory-mapped FASTA file.
+
+    Residues are read from the file when they are indexed, so the sequence does not
+    need to fit in memory.
+    Converting the sequence to a string reads the whole sequence.
+    """
+
+    __slots__ = ("_map", "_record")
+
+    def __init__(self, file_map: mmap.mmap, record: _FastaRecord) -> None:
+        self._map = file_map
+        self._record = record
+
+    def __len__(self) -> int:
+        return self._record.length
+
+    def __getitem__(self, i: int) -> str:
+        length, offset, line_bases, line_width = self._record
+        if i < 0:
+            i += length
+        if not 0 <= i < length:
+            raise IndexError("sequence index out of range")
+        j = offset + (i // line_bases) * line_width + i % line_bases
+        return chr(self._map[j])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(str(self))
+
+    def __str__(self) -> str:
+        return _read_sequence(self._map, self._record)
+
+
+def _read_sequence(file_map: mmap.mmap, record: _FastaRecord) -> str:
+    length, offset, line_bases, line_width = record
+    lines = -(-length // line_bases)
+    end = offset + (lines - 1) * line_width + (length - (lines - 1) * line_bases)
+    data = file_map[offset:end]
+    if line_width > line_bases:
+        data = data.replace(b"\r", b"").replace(b"\n", b"")
+    return data.decode("ascii")
+
+
+def _index_fasta(file_map: mmap.mmap) -> Dict[str, _FastaRecord]:
+    """Locate the sequence of each record in a FASTA file.
+
+    Parameters
+    ----------
+    file_map : mmap.mmap
+        The memory-mapped FASTA file.
+
+    Returns
+    -------
+    Dict[str, _FastaRecord]
+        The location of each record, keyed by the first word of the header.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a FASTA file, a record identifier is repeated, or the
+        sequence lines of a record are not all the same length.
+
+    """
+    records = dict()
+    size = len(file_map)
+    if size == 0 or file_map[0:1] != b">":
+        raise ValueError("invalid FASTA file")
+
+    start = 0
+    while start < size:
+        header_end = file_map.find(b"\n", start)
+        if header_end == -1:
+            header_end = size
+        next_start = file_map.find(b"\n>", header_end)
+        end = size if next_start == -1 else next_start + 1
+
+        header = file_map[start + 1 : header_end].decode("ascii").split()
+        if not header:
+            raise ValueError("FASTA record without an identifier")
+        if header[0] in records:
+            raise ValueError(f"duplicate FASTA record '{header[0]}'")
+        records[header[0]] = _locate_sequence(file_map, header_end + 1, end)
+        start = end
+
+    return records
+
+
+def _locate_sequence(file_map: mmap.mmap, offset: int, end: int) -> _FastaRecord:
+    """Determine the layout of the sequence lines of a FASTA record.
+
+    Parameters
+    ----------
+    file_map : mmap.mmap
+        The memory-mapped FASTA file.
+    offset : int
+        The offset of the first sequence line.
+    end : int
+        The offset of the end of the record.
+
+    Returns
+    -------
+    _FastaRecord
+        The location of the sequence.
+
+    Raises
+    ------
+    ValueError
+        If the sequence lines are not all the same length, except for the last line.
+
+    """
+    offset = min(offset, end)
+    data = file_map[offset:end].rstrip(b"\r\n")
+    first_line_end = data.find(b"\n")
+    if first_line_end == -1:  # the sequence is a single line
+        return _FastaRecord(len(data), offset, max(len(data), 1), len(data) + 1)
+
+    crlf = data[first_line_end - 1 : first_line_end] == b"\r"
+    line_width = first_line_end + 1
+    line_bases = first_line_end - crlf
+
+    # the data is full lines with line endings followed by a shorter last line
+    full_lines, last_line = divmod(len(data), line_width)
+    if (
+        not 0 < last_line <= line_bases
+        or data.count(b"\n") != full_lines
+        or data[line_width - 1 :: line_width] != b"\n" * full_lines
+        or data.count(b"\r") != (full_lines if crlf else 0)
+        or (crlf and data[line_width - 2 :: line_width] != b"\r" * full_lines)
+    ):
+        raise ValueError("FASTA sequence lines have different lengths")
+
+    return _FastaRecord(
+        full_lines * line_bases + last_line, offset, line_bases, line_width
+    )
+
+
+class _FastaFile:
+    """Indexed FASTA file whose sequences are loaded as they are needed.
+
+    The file is memory mapped when it is first used, so the object can be pickled and
+    sent to another process before it is used.
+    """
+
+    def __init__(self, path: str, sequence_type: Optional[str]) -> None:
+        self.path = os.fspath(path)
+        self.sequence_type = sequence_type
+        self._map: Optional[mmap.mmap] = None
+        self._records: Optional[Dict[str, _FastaRecord]] = None
+
+    def __getstate__(self):
+        return self.path, self.sequence_type
+
+    def __setstate__(self, state) -> None:
+        self.__init__(*state)
+
+    @property
+    def records(self) -> Dict[str, _FastaRecord]:
+        if self._records is None:
+            with open(self.path, "rb") as handle:
+                if os.fstat(handle.fileno()).st_size == 0:
+                    raise ValueError("invalid FASTA file")
+                self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            self._records = _index_fasta(self._map)
+        return self._records
+
+    def load(self, target_id: str, map_threshold: int) -> TargetSequence:
+        """Load the target sequence of a record.
+
+        Parameters
+        ----------
+        target_id : str
+            The identifier of the record.
+        map_threshold : int
+            Sequences at least this long are read from the memory-mapped file as they
+            are used instead of being loaded into memory.
+
+        Returns
+        -------
+        TargetSequence
+            The target sequence.
+
+        Raises
+        ------
+        ValueError
+            If the sequence is not valid.
+
+        """
+        record = self.records[target_id]
+        if record.length < map_threshold:
+            return TargetSequence(_read_sequence(self._map, record), self.sequence_type)
+
+        # the type of a memory-mapped sequence is inferred from the start of the
+        # sequence, and the whole sequence is not checked
+        sequence = _MappedSequence(self._map, record)
+        sequence_type = self.sequence_type
+        if sequence_type is None:
+            sample = "".join(sequence[i] for i in range(min(len(sequence), 10_000)))
+            sequence_type = TargetSequence(sample).sequence_type
+        return TargetSequence._from_values(sequence, sequence_type)
+
+
+class TargetRegistry:
+    """Target sequences for validating variants with target identifiers.
+
+    A registry can be used anywhere a target sequence string is accepted.
+    Each variant is validated against the target sequence for its target identifier,
+    such as ``NM_001130145.3`` in ``NM_001130145.3:c.832C>T``.
+    Variants without a target identifier are validated against the default target
+    sequence if there is one.
+
+    Target sequences can be added directly or loaded from FASTA files, in which case
+    each sequence is only read when it is first needed.
+    Long sequences are read from a memory-mapped file instead of being loaded into
+    memory.
+
+    """
+
+    def __init__(
+        self,
+        targets: Optional[Mapping[str, Union[str, TargetSequence]]] = None,
+        default: Optional[Union[str, TargetSequence]] = None,
+        cache_size: int = 16,
+        map_threshold: int = 10_000_000,
+    ) -> None:
+        """Create a registry.
+
+        Parameters
+        ----------
+        targets : Optional[Mapping[str, Union[str, TargetSequence]]]
+            Target sequence for each target identifier.
+        default : Optional[Union[str, TargetSequence]]
+            Target sequence for variants without a target identifier.
+        cache_size : int
+            The number of target sequences loaded from FASTA files to keep.
+        map_threshold : int
+            Sequences in FASTA files at least this long are read from a
+            memory-mapped file instead of being loaded into memory.
+
+        Raises
+        ------
+        ValueError
+            If a target sequence is not valid.
+
+        """
+        self._targets: Dict[str, TargetSequence] = dict()
+        self._fasta_files: List[_FastaFile] = list()
+        self._cache_size = cache_size
+        self._loaded = ParseCache(cache_size)
+        self._invalid: Dict[str, str] = dict()
+        self._map_threshold = map_threshold
+        self._last: Tuple[Optional[str], Optional[TargetSequence]] = (None, None)
+        self._version = 0
+        self.default = default
+        if targets is not None:
+            for target_id, targetseq in targets.items():
+                self.add(target_id, targetseq)
+
+    @staticmethod
+    def _prepare(targetseq: Union[str, TargetSequence]) -> TargetSequence:
+        if isinstance(targetseq, TargetSequence):
+            return targetseq
+        return TargetSequence(targetseq)
+
+    @property
+    def default(self) -> Optional[TargetSequence]:
+        """Optional[TargetSequence]: target sequence for variants without a target
+        identifier.
+
+        A target sequence string is prepared as a :py:class:`TargetSequence` when it is
+        assigned.
+        """
+        return self._default
+
+    @default.setter
+    def default(self, targetseq: Optional[Union[str, TargetSequence]]) -> None:
+        self._default = None if targetseq is None else self._prepare(targetseq)
+        self._version += 1
+
+    @classmethod
+    def from_fasta(
+        cls,
+        path: Union[str, os.PathLike],
+        sequence_type: Optional[str] = None,
+        **kwargs,
+    ) -> "TargetRegistry":
+        """Create a registry with the target sequences in a FASTA file.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            Path to the FASTA file.
+        sequence_type : Optional[str]
+            The type of the sequences.
+            See :py:class:`TargetSequence` for details.
+        **kwargs
+            Other arguments for :py:class:`TargetRegistry`.
+
+        Returns
+        -------
+        TargetRegistry
+            The registry.
+
+        """
+        registry = cls(**kwargs)
+        registry.add_fasta(path, sequence_type)
+        return registry
+
+    def add(self, target_id: str, targetseq: Union[str, TargetSequence]) -> None:
+        """Add a target sequence.
+
+        Parameters
+        ----------
+        target_id : str
+            The target identifier.
+        targetseq : Union[str, TargetSequence]
+            The target sequence.
+
+        Raises
+        ------
+        ValueError
+            If the target sequence is not valid.
+
+        """
+        self._targets[target_id] = self._prepare(targetseq)
+        self._last = (None, None)
+        self._version += 1
+
+    def add_fasta(
+        self, path: Union[str, os.PathLike], sequence_type: Optional[str] = None
+    ) -> None:
+        """Add the target sequences in a FASTA file.
+
+        The target identifier of each sequence is the first word of its header.
+        The file is indexed when the registry is first used, and each sequence is
+        loaded when it is first needed.
+        The sequence lines of each record must all be the same length, except for the
+        last line.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike]
+            Path to the FASTA file.
+        sequence_type : Optional[str]
+            The type of the sequences.
+            See :py:class:`TargetSequence` for details.
+
+        """
+        self._fasta_files.append(_FastaFile(path, sequence_type))
+        self._last = (None, None)
+        self._version += 1
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_loaded"]
+        state["_last"] = (None, None)
+        return state
+
+    def __setstate__(self, state) -> None:
+        self.__dict__.update(state)
+        self._loaded = ParseCache(self._cache_size)
+
+    def __contains__(self, target_id: object) -> bool:
+        return target_id in self._targets or any(
+            target_id in x.records for x in self._fasta_files
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.target_ids())
+
+    def __len__(self) -> int:
+        return len(self.target_ids())
+
+    def target_ids(self) -> List[str]:
+        """Return the target identifiers in the registry.
+
+        Returns
+        -------
+        List[str]
+            The target identifiers, including those in FASTA files.
+
+        """
+        target_ids = dict.fromkeys(self._targets)
+        for fasta_file in self._fasta_files:
+            target_ids.update(dict.fromkeys(fasta_file.records))
+        return list(target_ids)
+
+    def __getitem__(self, target_id: str) -> TargetSequence:
+        """Return the target sequence for a target identifier.
+
+        Target sequences that were added directly take priority over FASTA files, and
+        earlier FASTA files take priority over later ones.
+
+        Parameters
+        ----------
+        target_id : str
+            The target identifier.
+
+        Returns
+        -------
+        TargetSequence
+            The target sequence.
+
+        Raises
+        ------
+        KeyError
+            If the target identifier is not in the registry.
+        MaveHgvsParseError
+            If the target sequence in a FASTA file is not valid.
+
+        """
+        target = self._get(target_id)
+        if target is ErrorCode.UNKNOWN_TARGET_ID:
+            raise KeyError(target_id)
+        elif target is ErrorCode.INVALID_TARGET:
+            raise MaveHgvsParseError(self._invalid[target_id], target)
+        return target
+
+    def _get(self, target_id: str) -> Union[TargetSequence, ErrorCode]:
+        """Return the target sequence for a target identifier without raising an
+        exception.
+
+        Parameters
+        ----------
+        target_id : str
+            The target identifier.
+
+        Returns
+        -------
+        Union[TargetSequence, ErrorCode]
+            The target sequence, :py:attr:`ErrorCode.UNKNOWN_TARGET_ID` if the target
+            identifier is not in the registry, or :py:attr:`ErrorCode.INVALID_TARGET`
+            if the target sequence in a FASTA file is not valid.
+
+        """
+        last_id, last_target = self._last
+        if target_id == last_id and last_target is not None:
+            return last_target
+
+        target = self._targets.get(target_id)
+        if target is None:
+            target = self._loaded.get(target_id)
+        if target is None:
+            for fasta_file in self._fasta_files:
+                if target_id in fasta_file.records:
+                    target = self._load(fasta_file, target_id)
+                    if target.__class__ is ErrorCode:
+                        return target
+                    break
+            else:
+                return ErrorCode.UNKNOWN_TARGET_ID
+
+        self._last = (target_id, target)
+        return target
+
+    def _load(
+        self, fasta_file: _FastaFile, target_id: str
+    ) -> Union[TargetSequence, ErrorCode]:
+        """Load a target sequence from a FASTA file and keep it in the cache.
+
+        Records that are not valid are remembered with their error message, so they
+        are not loaded again.
+
+        Parameters
+        ----------
+        fasta_file : _FastaFile
+            The FASTA file containing the record.
+        target_id : str
+            The identifier of the record.
+
+        Returns
+        -------
+        Union[TargetSequence, ErrorCode]
+            The target sequence, or :py:attr:`ErrorCode.INVALID_TARGET` if it is not
+            valid.
+
+        """
+        if target_id in self._invalid:
+            return ErrorCode.INVALID_TARGET
+        try:
+            target = fasta_file.load(target_id, self._map_threshold)
+        except ValueError as error:
+            self._invalid[target_id] = f"invalid target sequence '{target_id}': {error}"
+            return ErrorCode.INVALID_TARGET
+        self._loaded.put(target_id, target)
+        return target
+
+    def cache_info(self) -> CacheInfo:
+        """Report the statistics of the cache of sequences loaded from FASTA files.
+
+        Returns
+        -------
+        CacheInfo
+            The cache statistics.
+
+        """
+        return self._loaded.info()
+
+    def _find(self, target_id: Optional[str]) -> Union[TargetSequence, ErrorCode]:
+        """Return the target sequence for validating a variant without raising an
+        exception.
+
+        Parameters
+        ----------
+        target_id : Optional[str]
+            The target identifier of the variant.
+
+        Returns
+        -------
+        Union[TargetSequence, ErrorCode]
+            The target sequence, or the reason there is no valid target sequence for the
+            variant.
+
+        """
+        if target_id is None:
+            if self._default is None:
+                return ErrorCode.MISSING_TARGET_ID
+            return self._default
+        return self._get(target_id)
+
+    def _lookup_error(self, target_id: Optional[str]) -> str:
+        """Return the error message for a variant whose target sequence was not found.
+
+        Parameters
+        ----------
+        target_id : Optional[str]
+            The target identifier of the variant.
+
+        Returns
+        -------
+        str
+            The error message, including the target identifier.
+
+        """
+        if target_id is None:
+            return ErrorCode.MISSING_TARGET_ID.message
+        return self._invalid.get(target_id, f"unknown target identifier '{target_id}'")
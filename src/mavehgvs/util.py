@@ -1,16 +1,318 @@
-from typing import List, Tuple, Optional, Iterable
+import gc
+import os
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice
+from operator import attrgetter
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Tuple,
+    Optional,
+    Iterable,
+    Union,
+)
 
+from mavehgvs.target import TargetRegistry, TargetSequence, _prepare_target
 from mavehgvs.variant import Variant
-from mavehgvs.exceptions import MaveHgvsParseError
+from mavehgvs.exceptions import ErrorCode, MaveHgvsParseError
+from mavehgvs.patterns.combined import variant_events
+from mavehgvs.patterns.util import remove_named_groups
 
-__all__ = ["parse_variant_strings"]
+__all__ = [
+    "parse_variant_strings",
+    "parse_unique_variant_strings",
+    "DeduplicationInfo",
+    "iter_parse_variant_strings",
+    "is_valid",
+    "sort_variants",
+    "variants_to_records",
+    "variants_to_columns",
+]
+
+_event_fullmatch = {
+    prefix: re.compile(remove_named_groups(pattern), flags=re.ASCII).fullmatch
+    for prefix, pattern in variant_events.items()
+}
+"""Dict[str, Callable[[str, int], Optional[Match[str]]]]: fullmatch callables for a
+single variant event without match groups for each prefix.
+"""
+
+_multi_fullmatch = {
+    prefix: re.compile(
+        rf"\[{remove_named_groups(pattern)}(?:;{remove_named_groups(pattern)})+\]",
+        flags=re.ASCII,
+    ).fullmatch
+    for prefix, pattern in variant_events.items()
+}
+"""Dict[str, Callable[[str, int], Optional[Match[str]]]]: fullmatch callables for the
+bracketed events of a multi-variant without match groups for each prefix.
+"""
+
+_record_columns = (
+    "variant_type",
+    "prefix",
+    "target_id",
+    "position",
+    "target",
+    "start_position",
+    "start_target",
+    "end_position",
+    "end_target",
+    "variant",
+)
+"""Tuple[str, ...]: keys of the variant dictionary format, in column order.
+"""
+
+
+_worker_options: Tuple[
+    Optional[Union[str, TargetSequence, TargetRegistry]], Optional[str], bool
+] = (None, None, False)
+"""Tuple[Optional[Union[str, TargetSequence, TargetRegistry]], Optional[str], bool]:
+target sequence, expected prefix, and error code setting used by batches parsed in a
+worker process created by :py:func:`parse_variant_strings`.
+"""
+
+
+def _init_worker(
+    targetseq: Optional[Union[str, TargetSequence, TargetRegistry]],
+    expected_prefix: Optional[str],
+    error_codes: bool = False,
+) -> None:
+    """Set the options used by :py:func:`_parse_batch` in a worker process.
+
+    Parameters
+    ----------
+    targetseq : Optional[Union[str, TargetSequence, TargetRegistry]]
+        If provided, all variants will be validated for agreement with this sequence.
+    expected_prefix : Optional[str]
+        If provided, all variants will be expected to have the same prefix.
+    error_codes : bool
+        If True, error codes are returned instead of error messages.
+
+    """
+    global _worker_options
+    _worker_options = (targetseq, expected_prefix, error_codes)
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Context manager that disables the cyclic garbage collector if it is enabled.
+
+    Creating many objects that cannot form reference cycles is much faster when the
+    garbage collector does not run repeatedly over all of the objects created so far.
+    The garbage collector is shared by the whole process, so it is left alone if it
+    was already disabled, and is only enabled again afterwards if this disabled it.
+    """
+    if not gc.isenabled():
+        yield
+        return
+
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def _collect_batches(
+    results: Iterable[
+        Tuple[List[Optional[Tuple]], List[Optional[Union[str, ErrorCode]]]]
+    ]
+) -> Tuple[List[Optional[Variant]], List[Optional[Union[str, ErrorCode]]]]:
+    """Combine the results of :py:func:`_parse_batch` in order.
+
+    Parameters
+    ----------
+    results : Iterable[Tuple[List[Optional[Tuple]], \
+    List[Optional[Union[str, ErrorCode]]]]]
+        The result of each batch, which may still be running.
+
+    Returns
+    -------
+    Tuple[List[Optional[Variant]], List[Optional[Union[str, ErrorCode]]]]
+        Returns a pair of lists containing variants or error messages or codes.
+
+    """
+    valid = list()
+    invalid = list()
+    from_parsed = Variant._from_parsed
+    with _gc_paused():
+        for components, errors in results:
+            valid.extend(None if c is None else from_parsed(c) for c in components)
+            invalid.extend(errors)
+
+    return valid, invalid
+
+
+def _parse_batch(
+    variants: List[str],
+    options: Optional[
+        Tuple[Optional[Union[str, TargetSequence, TargetRegistry]], Optional[str], bool]
+    ] = None,
+) -> Tuple[List[Optional[Tuple]], List[Optional[Union[str, ErrorCode]]]]:
+    """Parse a batch of variant strings in a worker.
+
+    Parameters
+    ----------
+    variants : List[str]
+        MAVE-HGVS strings to parse.
+    options : Optional[Tuple[Optional[Union[str, TargetSequence, TargetRegistry]], \
+    Optional[str], bool]]
+        The target sequence, expected prefix, and whether to return error codes.
+        If None, the options set when the worker process was created are used.
+
+    Returns
+    -------
+    Tuple[List[Optional[Tuple]], List[Optional[Union[str, ErrorCode]]]]
+        Returns a pair of lists containing the components of each valid variant or
+        error messages or codes.
+        The components pickle faster than Variant objects and can be converted back
+        without parsing the variant strings again.
+
+    """
+    targetseq, expected_prefix, error_codes = (
+        _worker_options if options is None else options
+    )
+    with _gc_paused():
+        valid, invalid = _parse_variant_strings(
+            variants, targetseq, expected_prefix, error_codes
+        )
+    return [None if v is None else v._parsed_components() for v in valid], invalid
+
+
+def _iter_parsed(
+    variants: Iterable[str],
+    targetseq: Optional[Union[str, TargetSequence, TargetRegistry]],
+    expected_prefix: Optional[str],
+) -> Iterator[Tuple[Optional[Variant], Optional[str]]]:
+    """Parse MAVE-HGVS strings one at a time.
+
+    Parameters
+    ----------
+    variants : Iterable[str]
+        Iterable of MAVE-HGVS strings to parse.
+    targetseq : Optional[Union[str, TargetSequence, TargetRegistry]]
+        If provided, all variants will be validated for agreement with this sequence.
+    expected_prefix : Optional[str]
+        If provided, all variants will be expected to have the same prefix.
+
+    Yields
+    ------
+    Tuple[Optional[Variant], Optional[str]]
+        The Variant and None for a valid variant string, or None and the error
+        message for an invalid one.
+
+    """
+    for s in variants:
+        try:
+            v = Variant(s, targetseq=targetseq)
+        except MaveHgvsParseError as error:
+            yield None, str(error)
+        else:
+            if expected_prefix is not None and v.prefix != expected_prefix:
+                yield None, "unexpected variant prefix"
+            else:
+                yield v, None
+
+
+def _iter_parsed_codes(
+    variants: Iterable[str],
+    targetseq: Optional[Union[str, TargetSequence, TargetRegistry]],
+    expected_prefix: Optional[str],
+) -> Iterator[Tuple[Optional[Variant], Optional[ErrorCode]]]:
+    """Parse MAVE-HGVS strings one at a time, reporting error codes.
+
+    Parameters
+    ----------
+    variants : Iterable[str]
+        Iterable of MAVE-HGVS strings to parse.
+    targetseq : Optional[Union[str, TargetSequence, TargetRegistry]]
+        If provided, all variants will be validated for agreement with this sequence.
+    expected_prefix : Optional[str]
+        If provided, all variants will be expected to have the same prefix.
+
+    Yields
+    ------
+    Tuple[Optional[Variant], Optional[ErrorCode]]
+        The Variant and None for a valid variant string, or None and the reason it is
+        not valid.
+
+    """
+    try_parse = Variant._try_parse
+    from_parsed = Variant._from_parsed
+    for s in variants:
+        # invalid strings are rejected without creating and raising an exception
+        if isinstance(s, str) and Variant._parse_cache is None:
+            components = try_parse(s, targetseq, False)
+        else:
+            try:
+                components = Variant(s, targetseq=targetseq)._parsed_components()
+            except MaveHgvsParseError as error:
+                components = error.code
+
+        if components.__class__ is ErrorCode:
+            yield None, components
+        elif expected_prefix is not None and components[1] != expected_prefix:
+            yield None, ErrorCode.UNEXPECTED_PREFIX
+        else:
+            yield from_parsed(components), None
+
+
+def _parse_variant_strings(
+    variants: Iterable[str],
+    targetseq: Optional[Union[str, TargetSequence, TargetRegistry]],
+    expected_prefix: Optional[str],
+    error_codes: bool = False,
+) -> Tuple[List[Optional[Variant]], List[Optional[Union[str, ErrorCode]]]]:
+    """Parse MAVE-HGVS strings in this process.
+
+    Parameters
+    ----------
+    variants : Iterable[str]
+        Iterable of MAVE-HGVS strings to parse.
+    targetseq : Optional[Union[str, TargetSequence, TargetRegistry]]
+        If provided, all variants will be validated for agreement with this sequence.
+    expected_prefix : Optional[str]
+        If provided, all variants will be expected to have the same prefix.
+    error_codes : bool
+        If True, the second list contains error codes instead of error messages.
+
+    Returns
+    -------
+    Tuple[List[Optional[Variant]], List[Optional[Union[str, ErrorCode]]]]
+        Returns a pair of lists containing variants or error messages or codes.
+
+    """
+    valid = list()
+    invalid = list()
+
+    iter_parsed = _iter_parsed_codes if error_codes else _iter_parsed
+    for v, error in iter_parsed(variants, targetseq, expected_prefix):
+        valid.append(v)
+        invalid.append(error)
+
+    return valid, invalid
 
 
 def parse_variant_strings(
     variants: Iterable[str],
-    targetseq: Optional[str] = None,
+    targetseq: Optional[Union[str, TargetSequence, TargetRegistry]] = None,
     expected_prefix: Optional[str] = None,
-) -> Tuple[List[Optional[Variant]], List[Optional[str]]]:
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    batch_size: Optional[int] = None,
+    deduplicate: bool = False,
+    error_codes: bool = False,
+) -> Union[
+    Tuple[List[Optional[Variant]], List[Optional[str]]],
+    Tuple[List[Optional[Variant]], List[Optional[ErrorCode]]],
+]:
     """Parse a list of MAVE-HGVS strings into Variant objects or error messages.
 
     Parameters
@@ -18,45 +320,429 @@ def parse_variant_strings(
     variants : Iterable[str]
         Iterable of MAVE-HGVS strings to parse.
 
-    targetseq : Optional[str]
+    targetseq : Optional[Union[str, TargetSequence, TargetRegistry]]
         If provided, all variants will be validated for agreement with this sequence.
         See the documentation for :py:class:`Variant` for further details.
+        A target sequence string is prepared once as a :py:class:`TargetSequence`
+        if possible.
 
     expected_prefix : Optional[str]
         If provided, all variants will be expected to have the same single-letter
         prefix.
         Variants that do not have this prefix will be treated as invalid.
 
+    workers : Optional[int]
+        If provided, the variants will be parsed in batches by a pool of this many
+        worker processes.
+        The target sequence is sent to each worker process once when it starts.
+
+    executor : Optional[concurrent.futures.Executor]
+        If provided, the variants will be parsed in batches by this executor, such as
+        an existing :py:class:`concurrent.futures.ProcessPoolExecutor`.
+        The target sequence is sent with each batch.
+        Cannot be used with ``workers``.
+
+    batch_size : Optional[int]
+        The number of variants in each batch when using ``workers`` or ``executor``.
+        By default, the variants are divided into four batches per worker.
+
+    deduplicate : bool
+        If True, each distinct variant string is only parsed once, and the results
+        are shared by all of its occurrences.
+        This is much faster for inputs where the same variants are repeated, such as
+        count tables with several replicates or time points.
+        See :py:func:`parse_unique_variant_strings` for details.
+
+    error_codes : bool
+        If True, the second list contains an :py:class:`ErrorCode` for each invalid
+        variant instead of an error message.
+        This is faster for inputs with many invalid variants, since invalid strings
+        are rejected without creating and raising an exception.
+        The message for a code is available as :py:attr:`ErrorCode.message`, which
+        does not include details such as the unknown target identifier.
+
     Returns
     -------
-    Tuple[List[Optional[Variant]], List[Optional[str]]]
+    Union[Tuple[List[Optional[Variant]], List[Optional[str]]], \
+    Tuple[List[Optional[Variant]], List[Optional[ErrorCode]]]]
         Returns a pair of lists containing variants or error messages.
 
         Both lists have the same length as the input list.
         The first list contains Variant objects if the string was successfully parsed;
         else None.
         The second list contains None if the string was successfully parsed; else the
-        error message.
+        error message, or the error code if ``error_codes`` is True.
+
+    Raises
+    ------
+    ValueError
+        If the expected prefix is not valid, if ``workers`` or ``batch_size`` is not
+        a positive integer, or if both ``workers`` and ``executor`` are provided.
 
     """
     if expected_prefix is not None and expected_prefix not in list("cgmnopr"):
         raise ValueError("invalid expected prefix")
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be a positive integer")
+    if batch_size is not None and batch_size < 1:
+        raise ValueError("batch size must be a positive integer")
+    if workers is not None and executor is not None:
+        raise ValueError("cannot specify both workers and executor")
 
-    valid = list()
-    invalid = list()
+    targetseq = _prepare_target(targetseq)
 
-    for s in variants:
-        try:
-            v = Variant(s, targetseq=targetseq)
-        except MaveHgvsParseError as error:
-            valid.append(None)
-            invalid.append(str(error))
-        else:
-            if expected_prefix is not None and v.prefix != expected_prefix:
-                valid.append(None)
-                invalid.append("unexpected variant prefix")
-            else:
-                valid.append(v)
-                invalid.append(None)
+    if deduplicate:
+        valid, invalid, _ = parse_unique_variant_strings(
+            variants,
+            targetseq,
+            expected_prefix,
+            workers,
+            executor,
+            batch_size,
+            error_codes,
+        )
+        return valid, invalid
 
-    return valid, invalid
+    if executor is None and (workers is None or workers == 1):
+        return _parse_variant_strings(variants, targetseq, expected_prefix, error_codes)
+
+    variants = list(variants)
+    if batch_size is None:
+        batch_count = 4 * (workers if workers is not None else os.cpu_count() or 1)
+        batch_size = max(1, -(-len(variants) // batch_count))
+    batches = [
+        variants[i : i + batch_size] for i in range(0, len(variants), batch_size)
+    ]
+
+    if executor is None:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(targetseq, expected_prefix, error_codes),
+        ) as pool:
+            return _collect_batches(pool.map(_parse_batch, batches))
+    else:
+        parse_batch = partial(
+            _parse_batch, options=(targetseq, expected_prefix, error_codes)
+        )
+        return _collect_batches(executor.map(parse_batch, batches))
+
+
+class DeduplicationInfo(NamedTuple):
+    """Statistics describing the variant strings parsed by
+    :py:func:`parse_unique_variant_strings`."""
+
+    total: int
+    unique: int
+
+    @property
+    def ratio(self) -> float:
+        """float: the number of variant strings for each distinct variant string, or
+        1.0 if there are no variant strings.
+        """
+        return self.total / self.unique if self.unique > 0 else 1.0
+
+
+def parse_unique_variant_strings(
+    variants: Iterable[str],
+    targetseq: Optional[Union[str, TargetSequence, TargetRegistry]] = None,
+    expected_prefix: Optional[str] = None,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    batch_size: Optional[int] = None,
+    error_codes: bool = False,
+) -> Union[
+    Tuple[List[Optional[Variant]], List[Optional[str]], DeduplicationInfo],
+    Tuple[List[Optional[Variant]], List[Optional[ErrorCode]], DeduplicationInfo],
+]:
+    """Parse each distinct MAVE-HGVS string once and share the results between its
+    occurrences.
+
+    The distinct variant strings are found first and parsed using
+    :py:func:`parse_variant_strings`, and the results are then copied back to the
+    position of each occurrence in the input.
+    Occurrences of the same valid variant string share a single Variant object.
+
+    Parameters
+    ----------
+    variants : Iterable[str]
+        Iterable of MAVE-HGVS strings to parse.
+
+    targetseq : Optional[Union[str, TargetSequence, TargetRegistry]]
+        If provided, all variants will be validated for agreement with this sequence.
+        See the documentation for :py:class:`Variant` for further details.
+
+    expected_prefix : Optional[str]
+        If provided, all variants will be expected to have the same single-letter
+        prefix.
+        Variants that do not have this prefix will be treated as invalid.
+
+    workers : Optional[int]
+        If provided, the distinct variants will be parsed in batches by a pool of
+        this many worker processes.
+
+    executor : Optional[concurrent.futures.Executor]
+        If provided, the distinct variants will be parsed in batches by this
+        executor.
+        Cannot be used with ``workers``.
+
+    batch_size : Optional[int]
+        The number of distinct variants in each batch when using ``workers`` or
+        ``executor``.
+
+    error_codes : bool
+        If True, error codes are returned instead of error messages.
+        See :py:func:`parse_variant_strings` for details.
+
+    Returns
+    -------
+    Union[Tuple[List[Optional[Variant]], List[Optional[str]], DeduplicationInfo], \
+    Tuple[List[Optional[Variant]], List[Optional[ErrorCode]], DeduplicationInfo]]
+        Returns the same pair of lists as :py:func:`parse_variant_strings`, followed
+        by the number of variant strings and distinct variant strings.
+
+    Raises
+    ------
+    ValueError
+        If the expected prefix is not valid, if ``workers`` or ``batch_size`` is not
+        a positive integer, or if both ``workers`` and ``executor`` are provided.
+
+    """
+    # the index of each distinct string is its position in insertion order
+    unique: Dict[str, int] = dict()
+    indexes = [unique.setdefault(s, len(unique)) for s in variants]
+
+    valid, invalid = parse_variant_strings(
+        list(unique),
+        targetseq,
+        expected_prefix,
+        workers,
+        executor,
+        batch_size,
+        error_codes=error_codes,
+    )
+    return (
+        [valid[i] for i in indexes],
+        [invalid[i] for i in indexes],
+        DeduplicationInfo(len(indexes), len(unique)),
+    )
+
+
+def iter_parse_variant_strings(
+    variants: Iterable[str],
+    targetseq: Optional[Union[str, TargetSequence, TargetRegistry]] = None,
+    expected_prefix: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+) -> Union[
+    Iterator[Tuple[int, Optional[Variant], Optional[str]]],
+    Iterator[List[Tuple[int, Optional[Variant], Optional[str]]]],
+]:
+    """Lazily parse MAVE-HGVS strings into Variant objects or error messages.
+
+    This is the streaming counterpart of :py:func:`parse_variant_strings`.
+    Variant strings are read from the input only as results are requested, so any
+    iterable (such as the lines of a file) can be validated in constant memory.
+
+    Parameters
+    ----------
+    variants : Iterable[str]
+        Iterable of MAVE-HGVS strings to parse.
+
+    targetseq : Optional[Union[str, TargetSequence, TargetRegistry]]
+        If provided, all variants will be validated for agreement with this sequence.
+        See the documentation for :py:class:`Variant` for further details.
+        A target sequence string is prepared once as a :py:class:`TargetSequence`
+        if possible.
+
+    expected_prefix : Optional[str]
+        If provided, all variants will be expected to have the same single-letter
+        prefix.
+        Variants that do not have this prefix will be treated as invalid.
+
+    chunk_size : Optional[int]
+        If provided, results are yielded as lists of up to this many results instead
+        of one at a time.
+
+    Returns
+    -------
+    Union[Iterator[Tuple[int, Optional[Variant], Optional[str]]], \
+    Iterator[List[Tuple[int, Optional[Variant], Optional[str]]]]]
+        Iterator over a 3-tuple for each variant string containing the index of the
+        variant string in the input, the Variant object if the string was
+        successfully parsed or else None, and None if the string was successfully
+        parsed or else the error message.
+
+        If ``chunk_size`` is provided, the iterator yields lists of these tuples.
+
+    Raises
+    ------
+    ValueError
+        If the expected prefix is not valid or ``chunk_size`` is not a positive
+        integer.
+
+    """
+    if expected_prefix is not None and expected_prefix not in list("cgmnopr"):
+        raise ValueError("invalid expected prefix")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk size must be a positive integer")
+
+    targetseq = _prepare_target(targetseq)
+
+    results = (
+        (i, v, error)
+        for i, (v, error) in enumerate(
+            _iter_parsed(variants, targetseq, expected_prefix)
+        )
+    )
+    if chunk_size is None:
+        return results
+    else:
+        return iter(lambda: list(islice(results, chunk_size)), [])
+
+
+def is_valid(
+    s: str,
+    targetseq: Optional[Union[str, TargetSequence, TargetRegistry]] = None,
+    expected_prefix: Optional[str] = None,
+) -> bool:
+    """Check whether a string is a valid MAVE-HGVS variant without creating a
+    :py:class:`Variant`.
+
+    The string is first checked with a pattern without match groups.
+    The variant components are only parsed for the variants that need further
+    validation, which are multi-variants, variants with start and end positions, and
+    any variant when a target sequence is provided.
+
+    Parameters
+    ----------
+    s : str
+        MAVE-HGVS string to validate.
+        Values that are not strings are treated as invalid.
+
+    targetseq : Optional[Union[str, TargetSequence, TargetRegistry]]
+        If provided, the variant will be validated for agreement with this sequence.
+        See the documentation for :py:class:`Variant` for further details.
+
+    expected_prefix : Optional[str]
+        If provided, the variant is expected to have this single-letter prefix.
+        Variants that do not have this prefix will be treated as invalid.
+
+    Returns
+    -------
+    bool
+        True if the string is a valid variant; else False.
+
+    """
+    if expected_prefix is not None and expected_prefix not in list("cgmnopr"):
+        raise ValueError("invalid expected prefix")
+
+    if not isinstance(s, str):
+        return False
+
+    prefix_tuple = Variant._read_prefix(s)
+    if prefix_tuple is None or expected_prefix not in (None, prefix_tuple[1]):
+        return False
+    _, prefix, event_index = prefix_tuple
+
+    if s.startswith("[", event_index):
+        if _multi_fullmatch[prefix](s, event_index) is None:
+            return False
+    else:
+        if _event_fullmatch[prefix](s, event_index) is None:
+            return False
+        elif targetseq is None and s.find("_", event_index) == -1:
+            return True
+
+    return Variant._try_parse(s, targetseq, False).__class__ is not ErrorCode
+
+
+def sort_variants(variants: Iterable[Variant], reverse: bool = False) -> List[Variant]:
+    """Sort variants in position order.
+
+    Variants are sorted using :py:attr:`Variant.sort_key`, which orders them by
+    prefix, target identifier, the position of the first event, variant type, and
+    sequence.
+    Each variant's key is computed once and cached, so sorting large numbers of
+    variants or sorting the same variants again is fast.
+
+    Parameters
+    ----------
+    variants : Iterable[Variant]
+        The variants to sort.
+    reverse : bool
+        If True, the variants are sorted in descending order.
+
+    Returns
+    -------
+    List[Variant]
+        A new list containing the sorted variants.
+
+    """
+    return sorted(variants, key=attrgetter("sort_key"), reverse=reverse)
+
+
+def variants_to_records(
+    variants: Iterable[Optional[Variant]],
+) -> List[Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]]:
+    """Convert variants into the dictionary format used for dictionary input.
+
+    Each record can be converted back into a variant using :py:class:`Variant` or
+    :py:meth:`Variant.from_dict`.
+
+    Parameters
+    ----------
+    variants : Iterable[Optional[Variant]]
+        The variants to convert. None values are allowed, such as the variants that
+        failed validation in the output of :py:func:`parse_variant_strings`.
+
+    Returns
+    -------
+    List[Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]]
+        The output of :py:meth:`Variant.to_dict` for each variant, or None.
+
+    """
+    return [None if v is None else v.to_dict() for v in variants]
+
+
+def variants_to_columns(variants: Iterable[Optional[Variant]]) -> Dict[str, List[Any]]:
+    """Convert variants into columns of the dictionary format used for dictionary
+    input.
+
+    There is one row for each event, so a multi-variant uses one row for each of its
+    events.
+    The "variant_index" column gives the position of the variant that each row belongs
+    to in the input, and the remaining columns have the keys of the dictionary format,
+    with None for keys that are not used by an event.
+    Removing the "variant_index" column and the None values from a row gives a
+    dictionary that can be converted back into a variant, or combined with the other
+    rows with the same index for a multi-variant.
+
+    Parameters
+    ----------
+    variants : Iterable[Optional[Variant]]
+        The variants to convert. None values are allowed and are skipped, such as the
+        variants that failed validation in the output of
+        :py:func:`parse_variant_strings`.
+
+    Returns
+    -------
+    Dict[str, List[Any]]
+        Dictionary of column names and values.
+
+    """
+    index_column = list()
+    columns = {key: list() for key in _record_columns}
+    column_items = list(columns.items())
+
+    for i, v in enumerate(variants):
+        if v is None:
+            continue
+        records = v.to_dict()
+        if isinstance(records, dict):
+            records = (records,)
+        for record in records:
+            index_column.append(i)
+            for key, column in column_items:
+                column.append(record.get(key))
+
+    return {"variant_index": index_column, **columns}
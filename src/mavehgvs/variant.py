@@ -1,12 +1,33 @@
 import re
-import itertools
-from typing import Optional, Union, List, Tuple, Mapping, Any, Sequence, Dict, Generator
+from functools import partial
+from typing import (
+    Optional,
+    Union,
+    List,
+    Tuple,
+    Mapping,
+    Any,
+    Sequence,
+    Dict,
+    Generator,
+    Match,
+    Callable,
+    NamedTuple,
+)
 
 from fqfa.constants import AA_CODES
 
 from mavehgvs.position import VariantPosition
-from mavehgvs.patterns.combined import any_variant
-from mavehgvs.exceptions import MaveHgvsParseError
+from mavehgvs.patterns.combined import (
+    any_variant,
+    target_id,
+    variant_events,
+    variant_event_characters,
+    multi_variant_events,
+)
+from mavehgvs.exceptions import ErrorCode, MaveHgvsParseError
+from mavehgvs.cache import ParseCache, CacheInfo
+from mavehgvs.target import TargetRegistry, TargetSequence
 
 __all__ = ["Variant"]
 
@@ -14,8 +35,128 @@ AA_3_TO_1 = {value: key for key, value in AA_CODES.items()}
 """Dict[str, str]: for converting three-letter amino acid codes to single-letter codes.
 """
 
+_GROUP_FIELDS = ("position", "start", "end", "ref", "new", "seq", "equal", "equal_sy")
+"""Tuple[str]: suffixes of the named groups nested inside each variant type group.
+"""
+
+
+class _EventParser(NamedTuple):
+    """Compiled patterns and group index table for variants with a single prefix."""
+
+    single: Callable[[str, int], Optional[Match[str]]]
+    multi: Callable[[str, int], Optional[Match[str]]]
+    groups: Dict[int, Tuple[str, Dict[str, int]]]
+    characters: Callable[[str, int], Optional[Match[str]]]
+
+
+def _tokenize_multi_variant(
+    s: str, pos: int, parser: _EventParser
+) -> Optional[List[Match[str]]]:
+    """Match each event of a multi-variant in a single pass over the string.
+
+    Parameters
+    ----------
+    s : str
+        The variant string.
+    pos : int
+        Index of the opening ``[`` of the multi-variant.
+    parser : _EventParser
+        Patterns for the prefix of the variant.
+
+    Returns
+    -------
+    Optional[List[Match[str]]]
+        List of match objects for each event, or None if the bracketed portion of the
+        string is not a valid multi-variant.
+
+    """
+    matches = list()
+    while True:
+        event_match = parser.multi(s, pos + 1)
+        if event_match is None:
+            return None
+        matches.append(event_match)
+        pos = event_match.end()
+        if s[pos] == "]":
+            break
+
+    if pos + 1 != len(s) or len(matches) < 2:
+        return None
+    else:
+        return matches
+
+
+def _compile_event_parsers(vtypes: Sequence[str]) -> Dict[str, _EventParser]:
+    """Compile the single variant and multi-variant event patterns for each prefix.
+
+    Both patterns for a prefix have the same match groups, so a single group table is
+    used for matches from either of them.
+
+    The group table maps the index of each variant type group to the variant type and
+    a dictionary mapping the field names in :py:data:`_GROUP_FIELDS` to their group
+    index.
+    Fields that do not exist for a variant type are omitted from the dictionary.
+
+    Parameters
+    ----------
+    vtypes : Sequence[str]
+        Variant type tags used in the variant type group names.
+
+    Returns
+    -------
+    Dict[str, _EventParser]
+        Dictionary with an entry for each variant prefix.
+
+    """
+    parsers = dict()
+    compiled = dict()
+    for prefix, pattern in variant_events.items():
+        if pattern in compiled:  # the genomic-style prefixes share the same pattern
+            parsers[prefix] = compiled[pattern]
+            continue
+
+        if prefix == "p":
+            pattern_groups = [(f"pro_{t}", t) for t in vtypes]
+        elif prefix == "r":
+            pattern_groups = [(f"rna_{t}", t) for t in vtypes if t != "fs"]
+        elif prefix in "cn":
+            pattern_groups = [(f"dna_{t}_{prefix}", t) for t in vtypes if t != "fs"]
+        else:
+            pattern_groups = [(f"dna_{t}_gmo", t) for t in vtypes if t != "fs"]
+
+        single = re.compile(pattern, flags=re.ASCII)
+        groups = dict()
+        for pg, vtype in pattern_groups:
+            fields = {
+                f: single.groupindex[f"{pg}_{f}"]
+                for f in _GROUP_FIELDS
+                if f"{pg}_{f}" in single.groupindex
+            }
+            groups[single.groupindex[pg]] = (vtype, fields)
+
+        characters = re.escape(variant_event_characters[prefix])
+        parsers[prefix] = compiled[pattern] = _EventParser(
+            single=single.fullmatch,
+            multi=re.compile(multi_variant_events[prefix], flags=re.ASCII).match,
+            groups=groups,
+            characters=re.compile(rf"\.[{characters}]+", flags=re.ASCII).fullmatch,
+        )
+
+    return parsers
+
 
 class Variant:
+    __slots__ = (
+        "_target_id",
+        "_prefix",
+        "_variant_count",
+        "_variant_types",
+        "_positions",
+        "_sequences",
+        "_sort_key",
+        "_hash",
+    )
+
     fullmatch = re.compile(any_variant, flags=re.ASCII).fullmatch
     """Callable[[str, int, int], Optional[Match[str]]]: fullmatch callable for parsing a
     single MAVE-HGVS variant
@@ -37,10 +178,30 @@ class Variant:
     """Tuple[str]: variant type tags used in MAVE-HGVS patterns and variant type names.
     """
 
+    _event_parsers = _compile_event_parsers(VTYPES)
+    """Dict[str, _EventParser]: compiled single variant and multi-variant event
+    patterns for each variant prefix.
+
+    Variant strings are dispatched to these smaller patterns based on their prefix
+    rather than being matched against :py:attr:`fullmatch`.
+    """
+
+    _target_id_fullmatch = re.compile(target_id, flags=re.ASCII).fullmatch
+    """Callable[[str, int, int], Optional[Match[str]]]: fullmatch callable for
+    validating target identifiers.
+    """
+
+    _parse_cache: Optional[ParseCache] = None
+    """Optional[ParseCache]: cache of parsing results shared by all variants, or None if
+    caching is disabled.
+
+    Use :py:meth:`enable_cache` and :py:meth:`disable_cache` to configure the cache.
+    """
+
     def __init__(  # noqa: max-complexity: 37
         self,
         s: Union[str, Mapping[str, Any], Sequence[Mapping[str, Any]]],
-        targetseq: Optional[str] = None,
+        targetseq: Optional[Union[str, TargetSequence, TargetRegistry]] = None,
         relaxed_ordering: bool = False,
     ):
         """Convert a MAVE-HGVS variant string into a corresponding object with named
@@ -53,7 +214,7 @@ class Variant:
             containing key-value pairs corresponding to a MAVE-HGVS object, or
             list/tuple of dictionary type objects for a variant with multiple events.
 
-        targetseq : Optional[str]
+        targetseq : Optional[Union[str, TargetSequence, TargetRegistry]]
             If provided, the variant will be validated for agreement with this sequence.
             Target sequence validation is not supported for variants using the extended
             position syntax.
@@ -61,6 +222,11 @@ class Variant:
             This must be an amino acid sequence for protein variants or a nucleotide
             sequence for coding/noncoding/genomic variants.
             DNA and amino acid sequences should be in uppercase, RNA in lowercase.
+            When validating many variants against the same sequence, pass a
+            :py:class:`TargetSequence` to avoid preparing the sequence for each
+            variant.
+            Pass a :py:class:`TargetRegistry` to validate the variant against the
+            target sequence for its target identifier.
 
         relaxed_ordering : bool
             If True, variants that do not observe the 3-prime rule for variant position
@@ -79,145 +245,862 @@ class Variant:
             try:
                 all_prefixes = [v["prefix"] for v in s]
             except KeyError:
-                raise MaveHgvsParseError("variant dictionary missing required keys")
+                raise MaveHgvsParseError(
+                    "variant dictionary missing required keys",
+                    ErrorCode.INVALID_DICTIONARY,
+                )
             if len(set(all_prefixes)) != 1:
                 raise MaveHgvsParseError(
-                    "cannot combine variants with different prefixes"
+                    "cannot combine variants with different prefixes",
+                    ErrorCode.INVALID_MULTI_VARIANT,
+                )
+            all_target_ids = set(v.get("target_id") for v in s)
+            if len(all_target_ids) != 1:
+                raise MaveHgvsParseError(
+                    "cannot combine variants with different target identifiers",
+                    ErrorCode.INVALID_MULTI_VARIANT,
                 )
             multivariants = ";".join(
                 self._variant_dictionary_to_string(v, include_prefix=False) for v in s
             )
             variant_string = f"{s[0]['prefix']}.[{multivariants}]"
+            if s[0].get("target_id") is not None:
+                variant_string = f"{s[0]['target_id']}:{variant_string}"
         else:
             raise ValueError("can only create Variants from string or Mapping objects")
 
-        variant_match = self.fullmatch(variant_string)
-        if variant_match is None:
-            raise MaveHgvsParseError("failed regular expression validation")
+        cache = Variant._parse_cache
+        if cache is None:
+            components = self._parse(variant_string, targetseq, relaxed_ordering)
         else:
-            match_dict = variant_match.groupdict()
+            key = (variant_string, targetseq, relaxed_ordering)
+            if targetseq.__class__ is TargetRegistry:
+                # registries can change, so results are only reused for the same
+                # version of the registry
+                key += (targetseq._version,)
+            components = cache.get(key)
+            if components is None:
+                try:
+                    components = self._parse(
+                        variant_string, targetseq, relaxed_ordering
+                    )
+                except MaveHgvsParseError as error:
+                    # only the message and code are kept, since the exception's
+                    # traceback would keep its frames and the target alive
+                    cache.put(key, (str(error), error.code))
+                    raise
+                cache.put(key, components)
+            elif len(components) == 2:
+                raise MaveHgvsParseError(*components)
+
+        (
+            self._target_id,
+            self._prefix,
+            self._variant_count,
+            self._variant_types,
+            self._positions,
+            self._sequences,
+        ) = components
+        self._sort_key = None
+        self._hash = None
 
-            # set target id if present
-            if match_dict["target_id"] is not None:
-                self._target_id = match_dict["target_id"]
-            else:
-                self._target_id = None
-
-            # set prefix and determine if this is a multi-variant
-            if match_dict["single_variant"] is not None:
-                self.variant_count = 1
-                self._prefix = match_dict["single_variant"][0]
-            elif match_dict["multi_variant"] is not None:
-                self.variant_count = len(variant_string.split(";"))
-                self._prefix = match_dict["multi_variant"][0]
-            else:  # pragma: no cover
-                raise ValueError("invalid match type")
-
-            if self.variant_count == 1:
-                (
-                    self._variant_types,
-                    self._positions,
-                    self._sequences,
-                ) = self._process_string_variant(
-                    match_dict, relaxed_ordering=relaxed_ordering
+    @classmethod
+    def _from_parsed(
+        cls, components: Tuple[Optional[str], str, int, Any, Any, Any]
+    ) -> "Variant":
+        """Create a variant from the components of a parsed variant string.
+
+        The components are not validated.
+
+        Parameters
+        ----------
+        components : Tuple[Optional[str], str, int, Any, Any, Any]
+            The 6-tuple returned by :py:meth:`_parse` or :py:meth:`_parsed_components`.
+
+        Returns
+        -------
+        Variant
+            The variant.
+
+        """
+        variant = cls.__new__(cls)
+        (
+            variant._target_id,
+            variant._prefix,
+            variant._variant_count,
+            variant._variant_types,
+            variant._positions,
+            variant._sequences,
+        ) = components
+        variant._sort_key = None
+        variant._hash = None
+        return variant
+
+    def _parsed_components(self) -> Tuple[Optional[str], str, int, Any, Any, Any]:
+        """Return the components of the variant in the format returned by
+        :py:meth:`_parse`.
+
+        Returns
+        -------
+        Tuple[Optional[str], str, int, Any, Any, Any]
+            The target identifier, prefix, variant count, variant type(s), position(s),
+            and sequence(s).
+
+        """
+        return (
+            self._target_id,
+            self._prefix,
+            self._variant_count,
+            self._variant_types,
+            self._positions,
+            self._sequences,
+        )
+
+    @classmethod
+    def from_components(
+        cls,
+        prefix: str,
+        variant_type: Union[str, Sequence[str]],
+        positions: Union[
+            Optional[Union[VariantPosition, Tuple[VariantPosition, VariantPosition]]],
+            Sequence[Union[VariantPosition, Tuple[VariantPosition, VariantPosition]]],
+        ],
+        sequence: Union[
+            Optional[Union[str, Tuple[str, str]]],
+            Sequence[Optional[Union[str, Tuple[str, str]]]],
+        ] = None,
+        target_id: Optional[str] = None,
+        targetseq: Optional[Union[str, TargetSequence, TargetRegistry]] = None,
+        relaxed_ordering: bool = False,
+    ) -> "Variant":
+        """Create a variant directly from its components.
+
+        This is a faster alternative to dictionary input for variants that are built
+        programmatically, since the components are not formatted as a string and
+        validated with the regular expressions.
+        Only the semantic checks are performed: the variant type and positions must be
+        valid for the prefix, start positions must be before end positions, insertion
+        positions must be adjacent, and the events of a multi-variant must be ordered,
+        must not overlap, and may only end with a frame shift.
+        Sequences are not checked, so they must only contain valid bases or amino acid
+        codes.
+
+        The components have the same form as the :py:attr:`variant_type`,
+        :py:attr:`positions`, and :py:attr:`sequence` properties, so
+        ``Variant.from_components(v.prefix, v.variant_type, v.positions, v.sequence,
+        target_id=v.target_id)`` creates a variant equal to ``v``.
+        Multi-variants are created using a list for each component.
+
+        Parameters
+        ----------
+        prefix : str
+            The prefix of the variant.
+        variant_type : Union[str, Sequence[str]]
+            The variant type, or a list of variant types for a multi-variant.
+        positions : Union[Optional[Union[VariantPosition, Tuple[VariantPosition, \
+        VariantPosition]]], Sequence[Union[VariantPosition, Tuple[VariantPosition, \
+        VariantPosition]]]]
+            The variant position or start/end tuple, or a list of them for a
+            multi-variant.
+            Position strings are also accepted.
+        sequence : Union[Optional[Union[str, Tuple[str, str]]], \
+        Sequence[Optional[Union[str, Tuple[str, str]]]]]
+            The reference and new sequences for substitutions, the inserted sequence,
+            or the equality symbol for target-identical variants, or a list of them for
+            a multi-variant.
+        target_id : Optional[str]
+            The optional target identifier.
+        targetseq : Optional[Union[str, TargetSequence, TargetRegistry]]
+            If provided, the variant will be validated for agreement with this sequence.
+            Target sequence validation is not supported for variants using the extended
+            position syntax.
+        relaxed_ordering : bool
+            If True, variants that do not observe the 3-prime rule for variant position
+            ordering are allowed.
+
+        Returns
+        -------
+        Variant
+            The new variant.
+
+        Raises
+        ------
+        MaveHgvsParseError
+            If the components do not describe a valid variant.
+
+        """
+        if prefix not in cls._event_parsers:
+            raise MaveHgvsParseError(
+                f"invalid variant prefix '{prefix}'", ErrorCode.INVALID_PREFIX
+            )
+        if target_id is not None and cls._target_id_fullmatch(target_id) is None:
+            raise MaveHgvsParseError(
+                f"invalid target identifier '{target_id}'", ErrorCode.INVALID_TARGET_ID
+            )
+
+        if isinstance(variant_type, str):
+            variant_count = 1
+            variant_list = [
+                cls._check_components(
+                    prefix, variant_type, positions, sequence, relaxed_ordering
+                )
+            ]
+            variant_types, positions, sequences = variant_list[0]
+        else:
+            variant_count = len(variant_type)
+            if sequence is None:
+                sequence = [None] * variant_count
+            if variant_count < 2 or not (
+                len(positions) == len(sequence) == variant_count
+            ):
+                raise MaveHgvsParseError(
+                    "invalid multi-variant components", ErrorCode.INVALID_MULTI_VARIANT
                 )
-            elif self.variant_count > 1:
-                self._variant_types = list()
-                self._positions = list()
-                self._sequences = list()
-
-                # format each individual variant event as a single variant and parse it
-                for variant_substring in match_dict["multi_variant"][3:-1].split(";"):
-                    groupdict = self.fullmatch(
-                        f"{self._prefix}.{variant_substring}"
-                    ).groupdict()
-                    vt, p, s = self._process_string_variant(
-                        groupdict, relaxed_ordering=relaxed_ordering
-                    )
-                    if vt == "equal":
-                        raise MaveHgvsParseError(
-                            "multi-variants cannot contain target-identical variants"
-                        )
-
-                    self._variant_types.append(vt)
-                    self._positions.append(p)
-                    self._sequences.append(s)
-
-                # ensure that multiple variants aren't defined for the same positions
-                for vp1, vp2 in itertools.combinations(self._positions, 2):
-                    if isinstance(vp1, VariantPosition) and isinstance(
-                        vp2, VariantPosition
-                    ):  # both single position
-                        if vp1 == vp2:
-                            raise MaveHgvsParseError(
-                                "multi-variant has multiple changes at same position"
-                            )
-                    elif isinstance(vp1, VariantPosition) and isinstance(vp2, Tuple):
-                        if vp2[0] <= vp1 <= vp2[1]:
-                            raise MaveHgvsParseError(
-                                "multi-variant has overlapping changes"
-                            )
-                    elif isinstance(vp1, Tuple) and isinstance(vp2, VariantPosition):
-                        if vp1[0] <= vp2 <= vp1[1]:
-                            raise MaveHgvsParseError(
-                                "multi-variant has overlapping changes"
-                            )
-                    elif isinstance(vp1, Tuple) and isinstance(vp2, Tuple):
-                        if (
-                            vp1[0] <= vp2[0] <= vp1[1]
-                            or vp1[0] <= vp2[1] <= vp1[1]
-                            or vp2[0] <= vp1[0] <= vp2[1]
-                            or vp2[0] <= vp1[1] <= vp2[1]
-                        ):
-                            raise MaveHgvsParseError(
-                                "multi-variant has overlapping changes"
-                            )
-                    else:  # pragma: no cover
-                        raise ValueError("invalid position type")
-
-                # re-order variants and validate
-                def sort_key(x):
-                    if isinstance(x[1], VariantPosition):
-                        return x[1]
-                    elif isinstance(x[1], Tuple):
-                        return x[1][0]
-                    else:  # pragma: no cover
-                        raise ValueError("invalid position type")
-
-                variant_list = list(self.variant_tuples())
-                ordered_list = sorted(variant_list, key=sort_key)
-                if variant_list != ordered_list:
-                    if relaxed_ordering:
-                        self._variant_types = [x[0] for x in ordered_list]
-                        self._positions = [x[1] for x in ordered_list]
-                        self._sequences = [x[2] for x in ordered_list]
-                    else:
-                        raise MaveHgvsParseError("multi-variants not in sorted order")
-
-                # make sure there is at most one frame shift
-                if sum(x == "fs" for x in self._variant_types) > 1:
-                    raise MaveHgvsParseError("maximum of one frame shift is permitted")
-
-                # make sure the frame shift is last if present
-                if any(x == "fs" for x in self._variant_types):
-                    if self._variant_types[-1] != "fs":
-                        raise MaveHgvsParseError(
-                            "no variants are permitted to follow a frame shift"
-                        )
 
-            else:  # pragma: no cover
-                raise ValueError("invalid variant count")
+            variant_list = cls._check_multi_variant(
+                [
+                    cls._check_components(prefix, *t, relaxed_ordering)
+                    for t in zip(variant_type, positions, sequence)
+                ],
+                relaxed_ordering,
+            )
+            if variant_list.__class__ is ErrorCode:
+                raise MaveHgvsParseError(code=variant_list)
+            variant_types, positions, sequences = (tuple(x) for x in zip(*variant_list))
 
         if targetseq is not None:
-            for vtype, pos, seq in self.variant_tuples():
-                if self._prefix != "p" and vtype == "sub":
-                    self._target_validate(pos, seq[0], targetseq)
-                elif (
-                    pos is None and vtype == "equal"
-                ):  # special case for full-length target identical variants
-                    pass
-                else:
-                    self._target_validate(pos, None, targetseq)
+            code = cls._target_validate_events(
+                variant_list, prefix, targetseq, target_id
+            )
+            if code is not None:
+                raise cls._parse_error(code, target_id, targetseq)
+
+        return cls._from_parsed(
+            (target_id, prefix, variant_count, variant_types, positions, sequences)
+        )
+
+    @classmethod
+    def from_dict(
+        cls,
+        vdict: Union[Mapping[str, Any], Sequence[Mapping[str, Any]]],
+        targetseq: Optional[Union[str, TargetSequence, TargetRegistry]] = None,
+        relaxed_ordering: bool = False,
+    ) -> "Variant":
+        """Create a variant from the dictionary format without formatting a variant
+        string.
+
+        The dictionary format is the same as for dictionary input to
+        :py:class:`Variant` and the output of :py:meth:`to_dict`, but the variant is
+        created using :py:meth:`from_components`.
+        As with :py:meth:`from_components`, sequences are not checked.
+
+        Parameters
+        ----------
+        vdict : Union[Mapping[str, Any], Sequence[Mapping[str, Any]]]
+            Dictionary describing a single variant, or list of dictionaries for a
+            multi-variant.
+        targetseq : Optional[Union[str, TargetSequence, TargetRegistry]]
+            If provided, the variant will be validated for agreement with this sequence.
+        relaxed_ordering : bool
+            If True, variants that do not observe the 3-prime rule for variant position
+            ordering are allowed.
+
+        Returns
+        -------
+        Variant
+            The new variant.
+
+        Raises
+        ------
+        MaveHgvsParseError
+            If the dictionaries do not describe a valid variant.
+
+        """
+        if isinstance(vdict, Mapping):
+            return cls.from_components(
+                vdict.get("prefix"),
+                *cls._variant_dictionary_to_components(vdict),
+                target_id=vdict.get("target_id"),
+                targetseq=targetseq,
+                relaxed_ordering=relaxed_ordering,
+            )
+        elif isinstance(vdict, Sequence):
+            if not all(isinstance(v, Mapping) for v in vdict):
+                raise ValueError("multi-variant iterable must contain Mapping objects")
+            if len(set(v.get("prefix") for v in vdict)) != 1:
+                raise MaveHgvsParseError(
+                    "cannot combine variants with different prefixes",
+                    ErrorCode.INVALID_MULTI_VARIANT,
+                )
+            if len(set(v.get("target_id") for v in vdict)) != 1:
+                raise MaveHgvsParseError(
+                    "cannot combine variants with different target identifiers",
+                    ErrorCode.INVALID_MULTI_VARIANT,
+                )
+            variant_types, positions, sequences = zip(
+                *(cls._variant_dictionary_to_components(v) for v in vdict)
+            )
+            return cls.from_components(
+                vdict[0]["prefix"],
+                list(variant_types),
+                list(positions),
+                list(sequences),
+                target_id=vdict[0].get("target_id"),
+                targetseq=targetseq,
+                relaxed_ordering=relaxed_ordering,
+            )
+        else:
+            raise ValueError("can only create Variants from Mapping objects")
+
+    @classmethod
+    def _check_components(  # noqa: max-complexity: 20
+        cls,
+        prefix: str,
+        variant_type: str,
+        positions: Optional[
+            Union[
+                VariantPosition,
+                str,
+                Tuple[Union[VariantPosition, str], Union[VariantPosition, str]],
+            ]
+        ],
+        sequence: Optional[Union[str, Tuple[str, str]]],
+        relaxed_ordering: bool,
+    ) -> Tuple[
+        str,
+        Optional[Union[VariantPosition, Tuple[VariantPosition, VariantPosition]]],
+        Optional[Union[str, Tuple[str, str]]],
+    ]:
+        """Validate the components of a single variant event without using the regular
+        expressions.
+
+        Parameters
+        ----------
+        prefix : str
+            The prefix of the variant.
+        variant_type : str
+            The variant type.
+        positions : Optional[Union[VariantPosition, str, Tuple[Union[VariantPosition, \
+        str], Union[VariantPosition, str]]]]
+            The variant position or start/end tuple.
+        sequence : Optional[Union[str, Tuple[str, str]]]
+            The variant sequence(s).
+        relaxed_ordering : bool
+            If True, the start and end positions will be swapped if they are out of
+            order.
+
+        Returns
+        -------
+        Tuple[str, Optional[Union[VariantPosition, Tuple[VariantPosition, \
+        VariantPosition]]], Optional[Union[str, Tuple[str, str]]]]
+            The variant type, position(s), and sequence(s) for the event.
+
+        Raises
+        ------
+        MaveHgvsParseError
+            If the components do not describe a valid event.
+
+        """
+        if variant_type not in cls.VTYPES or (variant_type == "fs" and prefix != "p"):
+            raise MaveHgvsParseError(
+                f"invalid variant type '{variant_type}'", ErrorCode.INVALID_VARIANT_TYPE
+            )
+
+        if positions is None:
+            if variant_type != "equal":
+                raise MaveHgvsParseError(
+                    "variant position not found", ErrorCode.INVALID_POSITION
+                )
+            position_list = []
+        elif isinstance(positions, (VariantPosition, str)):
+            if variant_type == "ins" or (variant_type == "equal" and prefix == "n"):
+                raise MaveHgvsParseError(
+                    "invalid variant position", ErrorCode.INVALID_POSITION
+                )
+            if isinstance(positions, str):
+                positions = VariantPosition.intern(positions)
+            position_list = [positions]
+        elif len(positions) == 2 and variant_type not in ("sub", "fs"):
+            if prefix in "np" and variant_type == "equal":
+                raise MaveHgvsParseError(
+                    "invalid variant position", ErrorCode.INVALID_POSITION
+                )
+            position_list = [
+                VariantPosition.intern(x) if isinstance(x, str) else x
+                for x in positions
+            ]
+            positions = cls._check_range(variant_type, *position_list, relaxed_ordering)
+            if positions.__class__ is ErrorCode:
+                raise MaveHgvsParseError(code=positions)
+        else:
+            raise MaveHgvsParseError(
+                "invalid variant position", ErrorCode.INVALID_POSITION
+            )
+
+        for pos in position_list:
+            if (
+                pos.is_protein() != (prefix == "p")
+                or (pos.utr is not None and prefix != "c")
+                or (pos.intronic_position is not None and prefix not in "cnr")
+            ):
+                raise MaveHgvsParseError(
+                    f"invalid variant position '{pos}'", ErrorCode.INVALID_POSITION
+                )
+
+        if variant_type == "sub":
+            if not isinstance(sequence, tuple) or len(sequence) != 2:
+                raise MaveHgvsParseError(
+                    "substitutions require a pair of sequences",
+                    ErrorCode.INVALID_SEQUENCE,
+                )
+        elif variant_type in ("ins", "delins", "equal"):
+            if not isinstance(sequence, str) or not sequence:
+                raise MaveHgvsParseError(
+                    f"{variant_type} variants require a sequence",
+                    ErrorCode.INVALID_SEQUENCE,
+                )
+            elif variant_type == "equal" and sequence not in ("=", "(=)"):
+                raise MaveHgvsParseError(
+                    "invalid target-identical variant", ErrorCode.INVALID_SEQUENCE
+                )
+            elif sequence == "(=)" and (prefix != "p" or positions is not None):
+                raise MaveHgvsParseError(
+                    "invalid target-identical variant", ErrorCode.INVALID_SEQUENCE
+                )
+        elif sequence is not None:
+            raise MaveHgvsParseError(
+                f"{variant_type} variants do not have a sequence",
+                ErrorCode.INVALID_SEQUENCE,
+            )
+
+        return variant_type, positions, sequence
+
+    @classmethod
+    def _read_prefix(
+        cls, variant_string: str
+    ) -> Optional[Tuple[Optional[str], str, int]]:
+        """Read the optional target identifier and the prefix of a variant string.
+
+        Parameters
+        ----------
+        variant_string : str
+            MAVE-HGVS variant string.
+
+        Returns
+        -------
+        Optional[Tuple[Optional[str], str, int]]
+            Returns a 3-tuple containing the target identifier (or None), the prefix,
+            and the index of the first character after the prefix and ``.``.
+            Returns None if the string does not begin with a valid target identifier
+            and prefix, or if the rest of the string is empty or contains a character
+            that cannot appear in a variant with that prefix.
+
+        """
+        prefix_index = variant_string.find(":") + 1
+        if prefix_index == 0:
+            target_id = None
+        elif cls._target_id_fullmatch(variant_string, 0, prefix_index - 1):
+            target_id = variant_string[: prefix_index - 1]
+        else:
+            return None
+
+        # the rest of the string is checked for characters that cannot appear in a
+        # variant with this prefix, which is much faster than a failed pattern match
+        parser = cls._event_parsers.get(variant_string[prefix_index : prefix_index + 1])
+        if (
+            parser is None
+            or parser.characters(variant_string, prefix_index + 1) is None
+        ):
+            return None
+        return target_id, variant_string[prefix_index], prefix_index + 2
+
+    @classmethod
+    def _parse(
+        cls,
+        variant_string: str,
+        targetseq: Optional[Union[str, TargetSequence, TargetRegistry]],
+        relaxed_ordering: bool,
+    ) -> Tuple[Optional[str], str, int, Any, Any, Any]:
+        """Parse a variant string into its components.
+
+        Parameters
+        ----------
+        variant_string : str
+            MAVE-HGVS variant string to parse.
+        targetseq : Optional[Union[str, TargetSequence, TargetRegistry]]
+            If provided, the variant will be validated for agreement with this sequence.
+        relaxed_ordering : bool
+            If True, variants that do not observe the 3-prime rule for variant position
+            ordering are allowed.
+
+        Returns
+        -------
+        Tuple[Optional[str], str, int, Any, Any, Any]
+            Returns a 6-tuple containing the target identifier, prefix, variant count,
+            variant type(s), position(s), and sequence(s).
+            The variant types, positions, and sequences of a multi-variant are tuples
+            with an element for each event.
+
+        Raises
+        ------
+        MaveHgvsParseError
+            If the variant string is not a valid MAVE-HGVS variant or does not agree
+            with the target sequence.
+
+        """
+        components = cls._try_parse(variant_string, targetseq, relaxed_ordering)
+        if components.__class__ is ErrorCode:
+            prefix_tuple = cls._read_prefix(variant_string)
+            target_id = None if prefix_tuple is None else prefix_tuple[0]
+            raise cls._parse_error(components, target_id, targetseq)
+        return components
+
+    @staticmethod
+    def _parse_error(
+        code: ErrorCode,
+        target_id: Optional[str],
+        targetseq: Optional[Union[str, TargetSequence, TargetRegistry]],
+    ) -> MaveHgvsParseError:
+        """Create the exception for an error code returned while parsing a variant.
+
+        Parameters
+        ----------
+        code : ErrorCode
+            The reason the variant is not valid.
+        target_id : Optional[str]
+            The target identifier of the variant.
+        targetseq : Optional[Union[str, TargetSequence, TargetRegistry]]
+            The target sequence the variant was validated against.
+
+        Returns
+        -------
+        MaveHgvsParseError
+            The exception, whose message includes the target identifier if the variant
+            could not be validated against a registry.
+
+        """
+        if code in (ErrorCode.UNKNOWN_TARGET_ID, ErrorCode.INVALID_TARGET):
+            return MaveHgvsParseError(targetseq._lookup_error(target_id), code)
+        return MaveHgvsParseError(code=code)
+
+    @classmethod
+    def _try_parse(
+        cls,
+        variant_string: str,
+        targetseq: Optional[Union[str, TargetSequence, TargetRegistry]],
+        relaxed_ordering: bool,
+    ) -> Union[Tuple[Optional[str], str, int, Any, Any, Any], ErrorCode]:
+        """Parse a variant string into its components, or return an error code if it
+        is not valid.
+
+        Invalid strings are rejected without the cost of creating and raising an
+        exception.
+
+        Parameters
+        ----------
+        variant_string : str
+            MAVE-HGVS variant string to parse.
+        targetseq : Optional[Union[str, TargetSequence, TargetRegistry]]
+            If provided, the variant will be validated for agreement with this sequence.
+        relaxed_ordering : bool
+            If True, variants that do not observe the 3-prime rule for variant position
+            ordering are allowed.
+
+        Returns
+        -------
+        Union[Tuple[Optional[str], str, int, Any, Any, Any], ErrorCode]
+            Returns the same 6-tuple as :py:meth:`_parse`, or the reason the variant
+            string is not a valid MAVE-HGVS variant or does not agree with the target
+            sequence.
+
+        """
+        # read the target id and prefix to select the patterns for this variant type
+        prefix_tuple = cls._read_prefix(variant_string)
+        if prefix_tuple is None:
+            return ErrorCode.REGEX
+        target_id, prefix, event_index = prefix_tuple
+        parser = cls._event_parsers[prefix]
+
+        if not variant_string.startswith("[", event_index):
+            variant_match = parser.single(variant_string, event_index)
+            if variant_match is None:
+                return ErrorCode.REGEX
+
+            variant_count = 1
+            variant_tuple = cls._process_string_variant(
+                variant_match,
+                prefix,
+                relaxed_ordering=relaxed_ordering,
+                lazy=targetseq is None,
+            )
+            if variant_tuple.__class__ is ErrorCode:
+                return variant_tuple
+            variant_list = [variant_tuple]
+            variant_types, positions, sequences = variant_tuple
+        else:
+            event_matches = _tokenize_multi_variant(variant_string, event_index, parser)
+            if event_matches is None:
+                return ErrorCode.REGEX
+
+            variant_count = len(event_matches)
+            variant_list = cls._process_multi_variant(
+                event_matches, prefix, relaxed_ordering=relaxed_ordering
+            )
+            if variant_list.__class__ is ErrorCode:
+                return variant_list
+
+            # components are stored as tuples so parsed results can be shared
+            variant_types, positions, sequences = (tuple(x) for x in zip(*variant_list))
+
+        if targetseq is not None:
+            code = cls._target_validate_events(
+                variant_list, prefix, targetseq, target_id
+            )
+            if code is not None:
+                return code
+
+        return target_id, prefix, variant_count, variant_types, positions, sequences
+
+    @classmethod
+    def _target_validate_events(
+        cls,
+        variant_list: Sequence[
+            Tuple[
+                str,
+                Optional[
+                    Union[VariantPosition, Tuple[VariantPosition, VariantPosition]]
+                ],
+                Optional[Union[str, Tuple[str, str]]],
+            ]
+        ],
+        prefix: str,
+        targetseq: Union[str, TargetSequence, TargetRegistry],
+        target_id: Optional[str] = None,
+    ) -> Optional[ErrorCode]:
+        """Validate each event of a variant against the target sequence.
+
+        Parameters
+        ----------
+        variant_list : Sequence[Tuple[str, Optional[Union[VariantPosition, \
+        Tuple[VariantPosition, VariantPosition]]], Optional[Union[str, \
+        Tuple[str, str]]]]]
+            Variant type, position, and sequence tuples for each event.
+        prefix : str
+            The prefix of the variant.
+        targetseq : Union[str, TargetSequence, TargetRegistry]
+            The target sequence, or a registry containing the target sequence for the
+            target identifier.
+        target_id : Optional[str]
+            The target identifier of the variant.
+
+        Returns
+        -------
+        Optional[ErrorCode]
+            None if every event agrees with the target sequence, otherwise the reason
+            an event does not agree or the registry does not have a valid target
+            sequence for the variant.
+
+        """
+        if isinstance(targetseq, TargetRegistry):
+            targetseq = targetseq._find(target_id)
+            if targetseq.__class__ is ErrorCode:
+                return targetseq
+        if isinstance(targetseq, TargetSequence):
+            check = targetseq._check
+        else:
+            check = partial(cls._target_validate, target=targetseq)
+
+        for vtype, pos, seq in variant_list:
+            if prefix != "p" and vtype == "sub":
+                code = check(pos, seq[0])
+            elif (
+                pos is None and vtype == "equal"
+            ):  # special case for full-length target identical variants
+                code = None
+            else:
+                code = check(pos, None)
+            if code is not None:
+                return code
+
+        return None
+
+    @classmethod
+    def _process_multi_variant(
+        cls, event_matches: Sequence[Match[str]], prefix: str, relaxed_ordering: bool
+    ) -> Union[
+        List[
+            Tuple[
+                str,
+                Union[VariantPosition, Tuple[VariantPosition, VariantPosition]],
+                Optional[Union[str, Tuple[str, str]]],
+            ]
+        ],
+        ErrorCode,
+    ]:
+        """Process and validate the matches for each event of a multi-variant.
+
+        Parameters
+        ----------
+        event_matches : Sequence[Match[str]]
+            Match objects for each event from the multi-variant event pattern.
+        prefix : str
+            The prefix of the variant.
+        relaxed_ordering : bool
+            If True, variants that do not observe the 3-prime rule for variant position
+            ordering are allowed and the events will be sorted.
+
+        Returns
+        -------
+        Union[List[Tuple[str, Union[VariantPosition, Tuple[VariantPosition, \
+        VariantPosition]], Optional[Union[str, Tuple[str, str]]]]], ErrorCode]
+            List of variant type, position, and sequence tuples for each event, or the
+            reason the events are not valid as a multi-variant.
+
+        """
+        variant_list = list()
+        for event_match in event_matches:
+            variant_tuple = cls._process_string_variant(
+                event_match, prefix, relaxed_ordering=relaxed_ordering
+            )
+            if variant_tuple.__class__ is ErrorCode:
+                return variant_tuple
+            if variant_tuple[0] == "equal":
+                return ErrorCode.MULTI_TARGET_IDENTICAL
+            variant_list.append(variant_tuple)
+
+        return cls._check_multi_variant(variant_list, relaxed_ordering)
+
+    @staticmethod
+    def _check_multi_variant(
+        variant_list: List[
+            Tuple[
+                str,
+                Union[VariantPosition, Tuple[VariantPosition, VariantPosition]],
+                Optional[Union[str, Tuple[str, str]]],
+            ]
+        ],
+        relaxed_ordering: bool,
+    ) -> Union[
+        List[
+            Tuple[
+                str,
+                Union[VariantPosition, Tuple[VariantPosition, VariantPosition]],
+                Optional[Union[str, Tuple[str, str]]],
+            ]
+        ],
+        ErrorCode,
+    ]:
+        """Validate the events of a multi-variant as a group.
+
+        Parameters
+        ----------
+        variant_list : List[Tuple[str, Union[VariantPosition, Tuple[VariantPosition, \
+        VariantPosition]], Optional[Union[str, Tuple[str, str]]]]]
+            Variant type, position, and sequence tuples for each event.
+        relaxed_ordering : bool
+            If True, variants that do not observe the 3-prime rule for variant position
+            ordering are allowed and the events will be sorted.
+
+        Returns
+        -------
+        Union[List[Tuple[str, Union[VariantPosition, Tuple[VariantPosition, \
+        VariantPosition]], Optional[Union[str, Tuple[str, str]]]]], ErrorCode]
+            List of variant type, position, and sequence tuples for each event, or the
+            reason the events are not valid as a multi-variant.
+
+        """
+        if any(x[0] == "equal" for x in variant_list):
+            return ErrorCode.MULTI_TARGET_IDENTICAL
+
+        # re-order variants and validate
+        def sort_key(x):
+            if isinstance(x[1], VariantPosition):
+                return x[1].sort_key
+            elif isinstance(x[1], tuple):
+                return x[1][0].sort_key
+            else:  # pragma: no cover
+                raise ValueError("invalid position type")
+
+        ordered_list = sorted(variant_list, key=sort_key)
+
+        # ensure that multiple variants aren't defined for the same positions
+        code = Variant._check_overlaps([x[1] for x in ordered_list])
+        if code is not None:
+            return code
+
+        if any(x is not y for x, y in zip(variant_list, ordered_list)):
+            if relaxed_ordering:
+                variant_list = ordered_list
+            else:
+                return ErrorCode.VARIANT_ORDER
+
+        variant_types = [x[0] for x in variant_list]
+
+        # make sure there is at most one frame shift
+        frame_shifts = variant_types.count("fs")
+        if frame_shifts > 1:
+            return ErrorCode.MULTIPLE_FRAME_SHIFTS
+
+        # make sure the frame shift is last if present
+        if frame_shifts == 1 and variant_types[-1] != "fs":
+            return ErrorCode.FRAME_SHIFT_ORDER
+
+        return variant_list
+
+    @classmethod
+    def enable_cache(cls, maxsize: int = 4096) -> None:
+        """Enable caching of parsing results for variants created from strings or
+        dictionaries.
+
+        Results are cached using the variant string, target sequence, and ordering
+        setting as the key, so repeated variant strings are only parsed once.
+        Results for a :py:class:`TargetRegistry` are not reused after target sequences
+        are added to it or its default target sequence is changed.
+        Variant strings that fail validation are also cached, and will raise a new
+        :py:class:`MaveHgvsParseError` with the same message.
+
+        Calling this method while the cache is enabled replaces the existing cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of cached results.
+            The least recently used result is discarded when the cache is full.
+
+        Returns
+        -------
+        None
+
+        """
+        cls._parse_cache = ParseCache(maxsize)
+
+    @classmethod
+    def disable_cache(cls) -> None:
+        """Disable caching of parsing results and discard the cache.
+
+        Returns
+        -------
+        None
+
+        """
+        cls._parse_cache = None
+
+    @classmethod
+    def cache_info(cls) -> Optional[CacheInfo]:
+        """Report the hits, misses, maximum size, and current size of the parsing
+        cache.
+
+        Returns
+        -------
+        Optional[CacheInfo]
+            Named tuple containing the cache statistics, or None if caching is
+            disabled.
+
+        """
+        if cls._parse_cache is None:
+            return None
+        else:
+            return cls._parse_cache.info()
 
     def variant_tuples(
         self,
@@ -245,123 +1128,282 @@ class Variant:
             ):
                 yield vtype, pos, seq
         else:
-            yield self._variant_types, self._positions, self._sequences
+            yield self._variant_types, self._single_positions(), self._sequences
+
+    def _single_positions(
+        self,
+    ) -> Optional[Union[VariantPosition, Tuple[VariantPosition, VariantPosition]]]:
+        """Get the position(s) of a single variant, creating the
+        :py:class:`VariantPosition` if the position was not parsed during validation.
+
+        Single positions that are not needed to validate the variant are stored as
+        position strings, and are only parsed the first time they are accessed.
+
+        Returns
+        -------
+        Optional[Union[VariantPosition, Tuple[VariantPosition, VariantPosition]]]
+            Variant position or tuple of start/end positions.
+
+        """
+        if isinstance(self._positions, str):
+            self._positions = VariantPosition.intern(self._positions)
+        return self._positions
+
+    @classmethod
+    def _process_string_variant(  # noqa: max-complexity: 20
+        cls,
+        match: Match[str],
+        prefix: str,
+        relaxed_ordering: bool,
+        lazy: bool = False,
+    ) -> Union[
+        Tuple[
+            str,
+            Optional[
+                Union[VariantPosition, Tuple[VariantPosition, VariantPosition], str]
+            ],
+            Optional[Union[str, Tuple[str, str]]],
+        ],
+        ErrorCode,
+    ]:
+        """Process the match from a single variant into its components.
+
+        Match groups are accessed using the precomputed indices in
+        :py:attr:`_event_parsers` rather than by name.
+
+        Parameters
+        ----------
+        match : Match[str]
+            Match object from the event pattern for the variant's prefix.
+        prefix : str
+            The prefix of the variant.
+        relaxed_ordering : bool
+            If True, variants that do not observe the 3-prime rule for variant position
+            ordering are allowed.
+        lazy : bool
+            If True, a single position is returned as the unparsed position string.
+            Start and end positions are always parsed, since they must be validated.
+
+        Returns
+        -------
+        Union[Tuple[str, Optional[Union[VariantPosition, Tuple[VariantPosition, \
+        VariantPosition], str]], Optional[Union[str, Tuple[str, str]]]], ErrorCode]
+            Returns a 3-tuple containing the variant type, optional position (or
+            start/end positions), and optional before/after substitution sequences or
+            inserted sequence, or the reason the start and end positions are not valid.
+
+        """
+        positions = None
+        sequences = None
+
+        # set the variant type using the outermost group, which is the last to close
+        variant_type, fields = cls._event_parsers[prefix].groups[match.lastindex]
+
+        # set the position and sequence
+        if variant_type == "sub":
+            position_string = match.group(fields["position"])
+            if lazy:
+                positions = position_string
+            else:
+                positions = VariantPosition.intern(position_string)
+            if prefix == "p":  # amino acid codes are always three letters
+                sequences = (position_string[:3], match.group(fields["new"]))
+            else:
+                sequences = (match.group(fields["ref"]), match.group(fields["new"]))
+        else:
+            # set position
+            if (
+                "position" in fields and match.start(fields["position"]) != -1
+            ):  # ins pattern doesn't have pos
+                positions = match.group(fields["position"])
+                if not lazy:
+                    positions = VariantPosition.intern(positions)
+            elif "start" in fields and match.start(fields["start"]) != -1:
+                positions = cls._check_range(
+                    variant_type,
+                    VariantPosition.intern(match.group(fields["start"])),
+                    VariantPosition.intern(match.group(fields["end"])),
+                    relaxed_ordering,
+                )
+                if positions.__class__ is ErrorCode:
+                    return positions
+            else:  # pragma: no cover
+                if variant_type != "equal":
+                    return ErrorCode.INVALID_POSITION
+
+            # set sequence if needed
+            if variant_type in ("ins", "delins"):
+                sequences = match.group(fields["seq"])
+            elif variant_type == "equal":
+                if (
+                    match.start(fields["equal"]) != -1
+                ):  # special case for target identity
+                    sequences = match.group(fields["equal"])
+                else:
+                    sequences = match.group(fields["equal_sy"])
+
+        return variant_type, positions, sequences
+
+    @staticmethod
+    def _check_range(
+        variant_type: str,
+        start: VariantPosition,
+        end: VariantPosition,
+        relaxed_ordering: bool,
+    ) -> Union[Tuple[VariantPosition, VariantPosition], ErrorCode]:
+        """Validate the start and end positions of an event.
+
+        Parameters
+        ----------
+        variant_type : str
+            The variant type of the event.
+        start : VariantPosition
+            The start position.
+        end : VariantPosition
+            The end position.
+        relaxed_ordering : bool
+            If True, the start and end positions will be swapped if they are out of
+            order.
+
+        Returns
+        -------
+        Union[Tuple[VariantPosition, VariantPosition], ErrorCode]
+            The start and end positions, or :py:attr:`ErrorCode.POSITION_ORDER` if the
+            start position is not before the end position, or
+            :py:attr:`ErrorCode.INSERTION_POSITIONS` if the positions of an insertion
+            are not adjacent.
+
+        """
+        if start >= end:
+            if relaxed_ordering:
+                start, end = end, start
+            else:
+                return ErrorCode.POSITION_ORDER
+        if variant_type == "ins" and not start.is_adjacent(end):
+            return ErrorCode.INSERTION_POSITIONS
+
+        return start, end
+
+    @staticmethod
+    def _check_overlaps(
+        positions: Sequence[
+            Union[VariantPosition, Tuple[VariantPosition, VariantPosition]]
+        ]
+    ) -> Optional[ErrorCode]:
+        """Check that the events of a multi-variant do not overlap.
+
+        The check is a single sweep over the events in order of their start position,
+        comparing each start position to the furthest end position seen so far.
+
+        Parameters
+        ----------
+        positions : Sequence[Union[VariantPosition, Tuple[VariantPosition, \
+        VariantPosition]]]
+            Single positions or start/end tuples for each event, sorted by start
+            position.
+
+        Returns
+        -------
+        Optional[ErrorCode]
+            None if the events do not overlap, :py:attr:`ErrorCode.SAME_POSITION` if two
+            events are at the same single position, or :py:attr:`ErrorCode.OVERLAP` if
+            any other events overlap.
+
+        """
+        furthest = None  # position or start/end tuple with the furthest end position
+        for pos in positions:
+            if furthest is None:
+                furthest = pos
+                continue
+
+            if isinstance(pos, tuple):
+                start, end = pos
+            else:
+                start = end = pos
+            furthest_end = furthest[1] if isinstance(furthest, tuple) else furthest
+
+            if start <= furthest_end:
+                if not isinstance(pos, tuple) and not isinstance(furthest, tuple):
+                    return ErrorCode.SAME_POSITION
+                else:
+                    return ErrorCode.OVERLAP
+            elif end > furthest_end:
+                furthest = pos
+
+        return None
 
-    def _process_string_variant(  # noqa: max-complexity: 23
-        self, match_dict: Dict[str, str], relaxed_ordering: bool
-    ) -> Tuple[
-        str,
-        Optional[Union[VariantPosition, Tuple[VariantPosition, VariantPosition]]],
-        Optional[Union[str, Tuple[str, str]]],
-    ]:
-        """Process the match dictionary from a single variant into its components.
+    # TODO: API documentation for the dictionary objects
+    @staticmethod
+    def _check_dictionary_keys(  # noqa: max-complexity: 14
+        vdict: Mapping[str, Any]
+    ) -> Tuple[str, str]:
+        """Check that a dictionary describing a single variant has the expected keys
+        for its variant type.
+
+        The optional "target_id" key is ignored.
 
         Parameters
         ----------
-        match_dict : Dict[str, str]
-            Match dictionary from the MAVE-HGVS regular expression.
-        relaxed_ordering : bool
-            If True, variants that do not observe the 3-prime rule for variant position
-            ordering are allowed.
+        vdict : Mapping[str, Any]
+            Key-value pairs describing a single variant.
 
         Returns
         -------
-        Tuple[str, Optional[Union[VariantPosition, Tuple[VariantPosition, \
-        VariantPosition]]], Optional[Union[str, Tuple[str, str]]]]
-            Returns a 3-tuple containing the variant type, optional position (or
-            start/end positions), and optional before/after substitution sequences or
-            inserted sequence.
-
-        """
-        variant_type = None
-        positions = None
-        sequences = None
+        Tuple[str, str]
+            The variant type and prefix.
 
-        # determine which named groups to check
-        if self._prefix == "p":
-            pattern_group_tuples = [(f"pro_{t}", t) for t in self.VTYPES]
-        elif self._prefix == "r":
-            pattern_group_tuples = [(f"rna_{t}", t) for t in self.VTYPES if t != "fs"]
-        elif self._prefix in tuple("cn"):
-            pattern_group_tuples = [
-                (f"dna_{t}_{self._prefix}", t) for t in self.VTYPES if t != "fs"
-            ]
-        elif self._prefix in tuple("gmo"):
-            pattern_group_tuples = [
-                (f"dna_{t}_gmo", t) for t in self.VTYPES if t != "fs"
-            ]
-        else:  # pragma: no cover
-            raise ValueError("unexpected prefix")
-
-        # set the variant type
-        vtype_set = False
-        pattern_group = None
-        for pg, vtype in pattern_group_tuples:
-            if match_dict[pg] is not None:
-                if vtype_set:  # pragma: no cover
-                    raise ValueError(f"ambiguous match: '{pg}' and '{pattern_group}'")
-                variant_type = vtype
-                pattern_group = pg
-                vtype_set = True
+        Raises
+        ------
+        MaveHgvsParseError
+            If the dictionary does not have a valid set of keys.
 
-        # set the position and sequence
-        if variant_type == "sub":
-            positions = VariantPosition(match_dict[f"{pattern_group}_position"])
-            if self._prefix == "p":
-                sequences = (positions.amino_acid, match_dict[f"{pattern_group}_new"])
-            elif self._prefix in tuple("gmocnr"):
-                sequences = (
-                    match_dict[f"{pattern_group}_ref"],
-                    match_dict[f"{pattern_group}_new"],
-                )
-            else:  # pragma: no cover
-                raise ValueError("unexpected prefix")
-        elif variant_type in ("equal", "fs", "del", "dup", "ins", "delins"):
-            # set position
-            if (
-                match_dict.get(f"{pattern_group}_position") is not None
-            ):  # use get() since ins pattern doesn't have pos
-                positions = VariantPosition(match_dict[f"{pattern_group}_position"])
-            elif (
-                match_dict.get(f"{pattern_group}_start") is not None
-                and match_dict.get(f"{pattern_group}_end") is not None
-            ):
-                positions = (
-                    VariantPosition(match_dict[f"{pattern_group}_start"]),
-                    VariantPosition(match_dict[f"{pattern_group}_end"]),
-                )
-                # extra validation on positions
-                if positions[0] >= positions[1]:
-                    if relaxed_ordering:
-                        positions = (positions[1], positions[0])
-                    else:
-                        raise MaveHgvsParseError(
-                            "start position must be before end position"
-                        )
-                if variant_type == "ins":
-                    if not positions[0].is_adjacent(positions[1]):
-                        raise MaveHgvsParseError("insertion positions must be adjacent")
-            else:  # pragma: no cover
-                if variant_type != "equal":
-                    raise MaveHgvsParseError("variant position not found")
+        """
+        try:
+            variant_type = vdict["variant_type"]
+            prefix = vdict["prefix"]
+        except KeyError:
+            raise MaveHgvsParseError(
+                "variant dictionary missing required keys", ErrorCode.INVALID_DICTIONARY
+            )
 
-            # set sequence if needed
+        expected_keys = ["variant_type", "prefix"]
+        if variant_type == "equal":
+            if "variant" in vdict:  # special case for full-length target identity
+                expected_keys.append("variant")
+            elif prefix == "p":
+                expected_keys.extend(["position", "target"])
+            else:
+                expected_keys.extend(["start_position", "end_position"])
+        elif variant_type == "sub":
+            expected_keys.extend(["position", "target", "variant"])
+        elif variant_type == "fs":
+            expected_keys.extend(["position", "target"])
+        elif variant_type in ("del", "dup", "ins", "delins"):
+            expected_keys.extend(["start_position", "end_position"])
+            if prefix == "p":
+                expected_keys.extend(["start_target", "end_target"])
             if variant_type in ("ins", "delins"):
-                sequences = match_dict[f"{pattern_group}_seq"]
-            elif variant_type == "equal":
-                if (
-                    match_dict[f"{pattern_group}_equal"] is not None
-                ):  # special case for target identity
-                    sequences = match_dict[f"{pattern_group}_equal"]
-                elif match_dict["pro_equal_equal_sy"] is not None:
-                    sequences = match_dict["pro_equal_equal_sy"]
+                expected_keys.append("variant")
+        else:
+            raise MaveHgvsParseError(
+                "invalid variant type", ErrorCode.INVALID_VARIANT_TYPE
+            )
 
-        return variant_type, positions, sequences
+        if vdict.keys() - {"target_id"} != set(expected_keys):
+            raise MaveHgvsParseError(
+                "variant dictionary contains invalid keys", ErrorCode.INVALID_DICTIONARY
+            )
+        if variant_type == "fs" and prefix != "p":
+            raise MaveHgvsParseError(
+                "frame shifts are only supported for protein variants",
+                ErrorCode.INVALID_VARIANT_TYPE,
+            )
 
-    # TODO: API documentation for the dictionary objects
-    @staticmethod
-    def _variant_dictionary_to_string(  # noqa: max-complexity: 25
-        vdict: Mapping[str, Any], include_prefix: bool
+        return variant_type, prefix
+
+    @classmethod
+    def _variant_dictionary_to_string(  # noqa: max-complexity: 12
+        cls, vdict: Mapping[str, Any], include_prefix: bool
     ) -> str:
         """Convert a match dictionary from a single variant into a string for further
         validation.
@@ -375,8 +1417,8 @@ class Variant:
         vdict : Mapping[str, Any]
             Key-value pairs describing a single variant.
         include_prefix: bool
-            If True, the variant prefix and '.' will be included in the string; else it
-            is omitted (for use with multi-variants).
+            If True, the target identifier (if present), variant prefix and '.' will be
+            included in the string; else it is omitted (for use with multi-variants).
 
         Returns
         -------
@@ -389,31 +1431,18 @@ class Variant:
             If the dictionary does not have a valid set of keys.
 
         """
-        try:
-            variant_type = vdict["variant_type"]
-            prefix = vdict["prefix"]
-        except KeyError:
-            raise MaveHgvsParseError("variant dictionary missing required keys")
+        variant_type, prefix = cls._check_dictionary_keys(vdict)
 
         if variant_type == "equal":
-            expected_keys = ["variant_type", "prefix"]
-            if prefix == "p":
-                expected_keys.extend(["position", "target"])
-            else:
-                expected_keys.extend(["start_position", "end_position"])
-            if sorted(vdict.keys()) != sorted(expected_keys):
-                raise MaveHgvsParseError("variant dictionary contains invalid keys")
-            if prefix == "p":
+            if "variant" in vdict:
+                variant_string = f"{vdict['variant']}"
+            elif prefix == "p":
                 variant_string = f"{vdict['target']}{vdict['position']}="
             elif vdict["start_position"] == vdict["end_position"]:
                 variant_string = f"{vdict['start_position']}="
             else:
                 variant_string = f"{vdict['start_position']}_{vdict['end_position']}="
         elif variant_type == "sub":
-            if sorted(vdict.keys()) != sorted(
-                ["variant_type", "prefix", "position", "target", "variant"]
-            ):
-                raise MaveHgvsParseError("variant dictionary contains invalid keys")
             if prefix == "p":
                 variant_string = (
                     f"{vdict['target']}{vdict['position']}{vdict['variant']}"
@@ -423,61 +1452,93 @@ class Variant:
                     f"{vdict['position']}{vdict['target']}>{vdict['variant']}"
                 )
         elif variant_type == "fs":
-            if sorted(vdict.keys()) != sorted(
-                ["variant_type", "prefix", "position", "target"]
-            ):
-                raise MaveHgvsParseError("variant dictionary contains invalid keys")
-            if prefix == "p":
-                variant_string = f"{vdict['target']}{vdict['position']}fs"
-            else:
-                raise MaveHgvsParseError(
-                    "frame shifts are only supported for protein variants"
-                )
-        elif variant_type in ("del", "dup"):
-            expected_keys = ["variant_type", "prefix", "start_position", "end_position"]
-            if prefix == "p":
-                expected_keys.extend(["start_target", "end_target"])
-            if sorted(vdict.keys()) != sorted(expected_keys):
-                raise MaveHgvsParseError("variant dictionary contains invalid keys")
+            variant_string = f"{vdict['target']}{vdict['position']}fs"
+        else:
             if prefix == "p":
                 start = f"{vdict['start_target']}{vdict['start_position']}"
                 end = f"{vdict['end_target']}{vdict['end_position']}"
             else:
                 start = vdict["start_position"]
                 end = vdict["end_position"]
-            if start == end:
-                variant_string = f"{start}{variant_type}"
+            if variant_type in ("ins", "delins"):
+                sequence = vdict["variant"]
             else:
-                variant_string = f"{start}_{end}{variant_type}"
-        elif variant_type in ("ins", "delins"):
-            expected_keys = [
-                "variant_type",
-                "prefix",
-                "start_position",
-                "end_position",
-                "variant",
-            ]
+                sequence = ""
+            if start == end and variant_type != "ins":
+                variant_string = f"{start}{variant_type}{sequence}"
+            else:
+                variant_string = f"{start}_{end}{variant_type}{sequence}"
+
+        if not include_prefix:
+            return variant_string
+        elif vdict.get("target_id") is not None:
+            return f"{vdict['target_id']}:{prefix}.{variant_string}"
+        else:
+            return f"{prefix}.{variant_string}"
+
+    @classmethod
+    def _variant_dictionary_to_components(
+        cls, vdict: Mapping[str, Any]
+    ) -> Tuple[
+        str,
+        Optional[Union[VariantPosition, Tuple[VariantPosition, VariantPosition]]],
+        Optional[Union[str, Tuple[str, str]]],
+    ]:
+        """Convert a dictionary describing a single variant into its components without
+        formatting a variant string.
+
+        Parameters
+        ----------
+        vdict : Mapping[str, Any]
+            Key-value pairs describing a single variant.
+
+        Returns
+        -------
+        Tuple[str, Optional[Union[VariantPosition, Tuple[VariantPosition, \
+        VariantPosition]]], Optional[Union[str, Tuple[str, str]]]]
+            The variant type, position(s), and sequence(s) in the form expected by
+            :py:meth:`from_components`.
+
+        Raises
+        ------
+        MaveHgvsParseError
+            If the dictionary does not have a valid set of keys.
+        MaveHgvsParseError
+            If a position is not valid.
+
+        """
+        variant_type, prefix = cls._check_dictionary_keys(vdict)
+
+        if "position" in vdict:
             if prefix == "p":
-                expected_keys.extend(["start_target", "end_target"])
-            if sorted(vdict.keys()) != sorted(expected_keys):
-                raise MaveHgvsParseError("variant dictionary contains invalid keys")
+                positions = f"{vdict['target']}{vdict['position']}"
+            else:
+                positions = f"{vdict['position']}"
+        elif "start_position" in vdict:
             if prefix == "p":
                 start = f"{vdict['start_target']}{vdict['start_position']}"
                 end = f"{vdict['end_target']}{vdict['end_position']}"
             else:
-                start = vdict["start_position"]
-                end = vdict["end_position"]
-            if start == end and variant_type == "delins":
-                variant_string = f"{start}{variant_type}{vdict['variant']}"
+                start = f"{vdict['start_position']}"
+                end = f"{vdict['end_position']}"
+            if start == end and variant_type != "ins":
+                positions = start
             else:
-                variant_string = f"{start}_{end}{variant_type}{vdict['variant']}"
+                positions = (VariantPosition.intern(start), VariantPosition.intern(end))
         else:
-            raise MaveHgvsParseError("invalid variant type")
+            positions = None
 
-        if include_prefix:
-            return f"{vdict['prefix']}.{variant_string}"
+        if isinstance(positions, str):
+            positions = VariantPosition.intern(positions)
+
+        if variant_type == "sub":
+            sequences = (vdict["target"], vdict["variant"])
+        elif variant_type == "equal":
+            sequences = vdict.get("variant", "=")
         else:
-            return variant_string
+            sequences = vdict.get("variant")
+
+        return variant_type, positions, sequences
 
     def _format_component_variants(self) -> List[str]:  # noqa: max-complexity: 14
         """Format each of the component variants of this variant into a variant string.
@@ -544,7 +1605,13 @@ class Variant:
             else:  # pragma: no cover
                 raise ValueError("invalid variant type")
 
-        return [format_variant(*t) for t in self.variant_tuples()]
+        # use the stored components, since unparsed position strings format the same
+        if self.is_multi_variant():
+            variant_tuples = zip(self._variant_types, self._positions, self._sequences)
+        else:
+            variant_tuples = [(self._variant_types, self._positions, self._sequences)]
+
+        return [format_variant(*t) for t in variant_tuples]
 
     def __eq__(self, other: "Variant") -> bool:
         """Equality comparison operator.
@@ -560,22 +1627,127 @@ class Variant:
             True if this variant is the same as the other position; else False.
 
         """
+        if not isinstance(other, Variant):
+            return NotImplemented
         return (
             self._target_id,
-            self.variant_count,
+            self._variant_count,
             self._prefix,
             self._variant_types,
-            self._positions,
+            self.positions,
             self._sequences,
         ) == (
             other._target_id,
-            other.variant_count,
+            other._variant_count,
             other._prefix,
             other._variant_types,
-            other._positions,
+            other.positions,
             other._sequences,
         )
 
+    def __lt__(self, other: "Variant") -> bool:
+        """Less than comparison operator.
+
+        Variants are ordered by :py:attr:`sort_key`.
+
+        Parameters
+        ----------
+        other : Variant
+            The other Variant to compare to.
+
+        Returns
+        -------
+        bool
+            True if this variant sorts strictly before the other variant; else False.
+
+        """
+        if not isinstance(other, Variant):
+            return NotImplemented
+        return self.sort_key < other.sort_key
+
+    def __le__(self, other: "Variant") -> bool:
+        """Less than or equal to comparison operator.
+
+        Variants are ordered by :py:attr:`sort_key`.
+
+        Parameters
+        ----------
+        other : Variant
+            The other Variant to compare to.
+
+        Returns
+        -------
+        bool
+            True if this variant sorts before or is equal to the other variant;
+            else False.
+
+        """
+        if not isinstance(other, Variant):
+            return NotImplemented
+        return self.sort_key <= other.sort_key
+
+    def __gt__(self, other: "Variant") -> bool:
+        """Greater than comparison operator.
+
+        Variants are ordered by :py:attr:`sort_key`.
+
+        Parameters
+        ----------
+        other : Variant
+            The other Variant to compare to.
+
+        Returns
+        -------
+        bool
+            True if this variant sorts strictly after the other variant; else False.
+
+        """
+        if not isinstance(other, Variant):
+            return NotImplemented
+        return self.sort_key > other.sort_key
+
+    def __ge__(self, other: "Variant") -> bool:
+        """Greater than or equal to comparison operator.
+
+        Variants are ordered by :py:attr:`sort_key`.
+
+        Parameters
+        ----------
+        other : Variant
+            The other Variant to compare to.
+
+        Returns
+        -------
+        bool
+            True if this variant sorts after or is equal to the other variant;
+            else False.
+
+        """
+        if not isinstance(other, Variant):
+            return NotImplemented
+        return self.sort_key >= other.sort_key
+
+    def __hash__(self) -> int:
+        """Hash function consistent with the equality comparison operator.
+
+        The hash is only computed the first time it is needed.
+
+        Returns
+        -------
+        int
+            The hash of the variant.
+
+        """
+        if self._hash is None:
+            self._hash = hash(self.sort_key)
+        return self._hash
+
+    def __reduce__(self) -> Tuple[Callable[[bytes], "Variant"], Tuple[bytes]]:
+        # pickle using the compact binary encoding
+        from mavehgvs import serialize
+
+        return serialize.loads, (serialize.dumps(self),)
+
     def __repr__(self) -> str:
         """The object representation is equivalent to the input string.
 
@@ -603,7 +1775,7 @@ class Variant:
         pos: Union[VariantPosition, Tuple[VariantPosition, VariantPosition]],
         ref: Optional[str],
         target: str,
-    ) -> None:
+    ) -> Optional[ErrorCode]:
         """Determine whether the target portion of a variant matches the target
         sequence.
 
@@ -626,36 +1798,30 @@ class Variant:
 
         Returns
         -------
-        None
-
-        Raises
-        ------
-        MaveHgvsParseError
-            If the reference base or amino acid does not match the target at the given
-            position
-        MaveHgvsParseError
-            If the position is outside the bounds of the target.
+        Optional[ErrorCode]
+            None if the variant matches the target,
+            :py:attr:`ErrorCode.REFERENCE_MISMATCH` if the reference base or amino acid
+            does not match the target at the given position, or
+            :py:attr:`ErrorCode.OUT_OF_BOUNDS` if the position is outside the bounds of
+            the target.
 
         """
         if not isinstance(pos, tuple):
             pos = (pos,)
 
         if any(p.is_extended() for p in pos):
-            return
+            return None
         elif any(p.position > len(target) for p in pos):
-            raise MaveHgvsParseError("variant coordinate out of bounds")
+            return ErrorCode.OUT_OF_BOUNDS
         else:
             if ref is not None and len(pos) == 1:  # nucleotide substitution
                 if target[pos[0].position - 1] != ref:
-                    raise MaveHgvsParseError("variant reference does not match target")
+                    return ErrorCode.REFERENCE_MISMATCH
             elif pos[0].amino_acid is not None:  # protein variant
                 for p in pos:
                     if target[p.position - 1] != AA_3_TO_1[p.amino_acid]:
-                        raise MaveHgvsParseError(
-                            "variant reference does not match target"
-                        )
-            else:
-                return
+                        return ErrorCode.REFERENCE_MISMATCH
+            return None
 
     def is_target_identical(self) -> bool:
         """Return whether the variant describes the "wild-type" sequence or is the
@@ -708,7 +1874,19 @@ class Variant:
             True if the variant is a multi-variant; else False.
 
         """
-        return self.variant_count > 1
+        return self._variant_count > 1
+
+    @property
+    def variant_count(self) -> int:
+        """The number of variant events described by this variant.
+
+        Returns
+        -------
+        int
+            The number of events, which is greater than one for a multi-variant.
+
+        """
+        return self._variant_count
 
     @property
     def prefix(self) -> str:
@@ -748,7 +1926,10 @@ class Variant:
             multi-variant.
 
         """
-        return self._variant_types
+        if self.is_multi_variant():
+            return list(self._variant_types)
+        else:
+            return self._variant_types
 
     def uses_extended_positions(self) -> bool:
         """Return whether the variant uses the extended position notation to describe
@@ -810,7 +1991,10 @@ class Variant:
             Returns a list of positions or start/end tuples for a multi-variant.
 
         """
-        return self._positions
+        if self.is_multi_variant():
+            return list(self._positions)
+        else:
+            return self._single_positions()
 
     @property
     def sequence(
@@ -835,7 +2019,10 @@ class Variant:
             deletions or duplications.
 
         """
-        return self._sequences
+        if self.is_multi_variant():
+            return list(self._sequences)
+        else:
+            return self._sequences
 
     @property
     def target_id(self) -> Optional[str]:
@@ -853,6 +2040,156 @@ class Variant:
         """
         return self._target_id
 
+    @property
+    def sort_key(self) -> Tuple[Any, ...]:
+        """Key that sorts variants in position order.
+
+        Variants are sorted by prefix, then target identifier, then the position of
+        the first event, then variant type and sequence.
+        Variants without a target identifier sort before those with one, and
+        target-identical variants without a position sort before other variants with
+        the same prefix.
+        Variants are equal if and only if their keys are equal.
+
+        The key is only computed the first time it is needed.
+
+        Returns
+        -------
+        Tuple[Any, ...]
+            The sort key for the variant.
+
+        """
+        if self._sort_key is None:
+            if self.is_multi_variant():
+                variant_tuples = zip(
+                    self._variant_types, self._positions, self._sequences
+                )
+            else:
+                variant_tuples = [
+                    (self._variant_types, self._single_positions(), self._sequences)
+                ]
+
+            types = list()
+            positions = list()
+            sequences = list()
+            for vtype, pos, seq in variant_tuples:
+                types.append(vtype)
+                if pos is None:
+                    positions.append(((-1, 0, 0),))
+                elif isinstance(pos, tuple):
+                    positions.append((pos[0].sort_key, pos[1].sort_key))
+                else:
+                    positions.append((pos.sort_key,))
+                if seq is None:
+                    sequences.append(())
+                elif isinstance(seq, tuple):
+                    sequences.append(seq)
+                else:
+                    sequences.append((seq,))
+
+            self._sort_key = (
+                self._prefix,
+                "" if self._target_id is None else self._target_id,
+                positions[0][0],
+                tuple(types),
+                tuple(sequences),
+                tuple(positions),
+            )
+        return self._sort_key
+
+    def to_dict(self) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Convert the variant into the dictionary format used for dictionary input.
+
+        Positions that use the extended syntax are represented as strings, and other
+        positions are represented as integers.
+        The "target_id" key is only included if the variant has a target identifier.
+
+        Returns
+        -------
+        Union[Dict[str, Any], List[Dict[str, Any]]]
+            Dictionary describing the variant, or a list of dictionaries describing each
+            event for a multi-variant.
+
+        """
+        if self.is_multi_variant():
+            return [
+                self._event_to_dict(self._prefix, self._target_id, *t)
+                for t in zip(self._variant_types, self._positions, self._sequences)
+            ]
+        else:
+            return self._event_to_dict(
+                self._prefix,
+                self._target_id,
+                self._variant_types,
+                self._single_positions(),
+                self._sequences,
+            )
+
+    @staticmethod
+    def _event_to_dict(
+        prefix: str,
+        target_id: Optional[str],
+        variant_type: str,
+        positions: Optional[
+            Union[VariantPosition, Tuple[VariantPosition, VariantPosition]]
+        ],
+        sequences: Optional[Union[str, Tuple[str, str]]],
+    ) -> Dict[str, Any]:
+        """Convert the components of a single event into the dictionary format.
+
+        Parameters
+        ----------
+        prefix : str
+            The prefix of the variant.
+        target_id : Optional[str]
+            The target identifier of the variant.
+        variant_type : str
+            The variant type of the event.
+        positions : Optional[Union[VariantPosition, Tuple[VariantPosition, \
+        VariantPosition]]]
+            The position or start/end positions of the event.
+        sequences : Optional[Union[str, Tuple[str, str]]]
+            The sequence(s) of the event.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Dictionary describing the event.
+
+        """
+
+        def position_value(pos: VariantPosition) -> Union[int, str]:
+            return repr(pos) if pos.is_extended() else pos.position
+
+        vdict = {"variant_type": variant_type, "prefix": prefix}
+        if target_id is not None:
+            vdict["target_id"] = target_id
+
+        if positions is None:  # full-length target identity
+            vdict["variant"] = sequences
+        elif variant_type in ("sub", "fs") or (
+            variant_type == "equal" and prefix == "p"
+        ):
+            vdict["position"] = position_value(positions)
+            if prefix == "p":
+                vdict["target"] = positions.amino_acid
+            else:
+                vdict["target"] = sequences[0]
+            if variant_type == "sub":
+                vdict["variant"] = sequences[1]
+        else:
+            if not isinstance(positions, tuple):
+                positions = (positions, positions)
+            vdict["start_position"] = position_value(positions[0])
+            vdict["end_position"] = position_value(positions[1])
+            if prefix == "p":
+                vdict["start_target"] = positions[0].amino_acid
+                vdict["end_target"] = positions[1].amino_acid
+            if variant_type in ("ins", "delins"):
+                vdict["variant"] = sequences
+
+        return vdict
+
     def components(self) -> Tuple[str, ...]:
         """The component substrings of a variant.
 
@@ -0,0 +1,148 @@
+import unittest
+
+from mavehgvs.cache import ParseCache, CacheInfo
+from mavehgvs.exceptions import ErrorCode, MaveHgvsParseError
+from mavehgvs.target import TargetRegistry
+from mavehgvs.variant import Variant
+
+
+class TestParseCache(unittest.TestCase):
+    def test_invalid_maxsize(self) -> None:
+        for maxsize in (0, -1):
+            with self.subTest(maxsize=maxsize):
+                with self.assertRaises(ValueError):
+                    ParseCache(maxsize)
+
+    def test_hits_and_misses(self) -> None:
+        cache = ParseCache(4)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(
+            cache.info(), CacheInfo(hits=2, misses=1, maxsize=4, currsize=1)
+        )
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = ParseCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_clear(self) -> None:
+        cache = ParseCache(2)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+        self.assertEqual(
+            cache.info(), CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+        )
+
+
+class TestVariantCache(unittest.TestCase):
+    def setUp(self) -> None:
+        Variant.enable_cache(maxsize=8)
+
+    def tearDown(self) -> None:
+        Variant.disable_cache()
+
+    def test_disabled_by_default(self) -> None:
+        Variant.disable_cache()
+        self.assertIsNone(Variant.cache_info())
+        Variant("p.Glu27Trp")
+        self.assertIsNone(Variant.cache_info())
+
+    def test_repeated_variants(self) -> None:
+        variant_strings = [
+            "p.Glu27Trp",
+            "c.122-6T>A",
+            "c.[1_35del;78+5_78+10del;122T>A]",
+            "NM_002002.3:c.[1_35del;78+5_78+10del;122T>A]",
+            "p.(=)",
+        ]
+
+        for s in variant_strings:
+            with self.subTest(s=s):
+                v1 = Variant(s)
+                v2 = Variant(s)
+                self.assertEqual(v1, v2)
+                self.assertEqual(str(v2), s)
+                self.assertEqual(v1.variant_type, v2.variant_type)
+                self.assertEqual(v1.positions, v2.positions)
+                self.assertEqual(v1.sequence, v2.sequence)
+
+        info = Variant.cache_info()
+        self.assertEqual(info.hits, len(variant_strings))
+        self.assertEqual(info.misses, len(variant_strings))
+
+    def test_multi_variant_lists_are_copies(self) -> None:
+        v1 = Variant("p.[Glu27Trp;Ter345Lys]")
+        v1.variant_type.append("del")
+        v1.positions.clear()
+        v2 = Variant("p.[Glu27Trp;Ter345Lys]")
+        self.assertEqual(v2.variant_type, ["sub", "sub"])
+        self.assertEqual(len(v2.positions), 2)
+
+    def test_invalid_variants(self) -> None:
+        for _ in range(2):
+            with self.assertRaisesRegex(MaveHgvsParseError, "regular expression"):
+                Variant("p.Glu27Trp;")
+        self.assertEqual(Variant.cache_info().hits, 1)
+
+    def test_invalid_variants_keep_no_exception(self) -> None:
+        with self.assertRaises(MaveHgvsParseError) as cm:
+            Variant("c.5A>T", targetseq="ACGT")
+        first = cm.exception
+        with self.assertRaises(MaveHgvsParseError) as cm:
+            Variant("c.5A>T", targetseq="ACGT")
+        self.assertIsNot(cm.exception, first)
+        self.assertEqual(str(cm.exception), str(first))
+        self.assertEqual(cm.exception.code, ErrorCode.OUT_OF_BOUNDS)
+        for entry in Variant._parse_cache._entries.values():
+            self.assertNotIsInstance(entry, BaseException)
+
+    def test_key_includes_options(self) -> None:
+        Variant("c.1A>T", targetseq="ACGT")
+        with self.assertRaises(MaveHgvsParseError):
+            Variant("c.1A>T", targetseq="TCGA")
+        with self.assertRaises(MaveHgvsParseError):
+            Variant("c.[3G>C;1A>T]")
+        self.assertEqual(
+            str(Variant("c.[3G>C;1A>T]", relaxed_ordering=True)), "c.[1A>T;3G>C]"
+        )
+        self.assertEqual(Variant.cache_info().hits, 0)
+
+    def test_registry_changes(self) -> None:
+        registry = TargetRegistry({"tx1": "ACGT"})
+        for _ in range(2):
+            with self.assertRaises(MaveHgvsParseError) as cm:
+                Variant("tx2:c.1A>T", targetseq=registry)
+            self.assertEqual(cm.exception.code, ErrorCode.UNKNOWN_TARGET_ID)
+            with self.assertRaises(MaveHgvsParseError) as cm:
+                Variant("c.1A>T", targetseq=registry)
+            self.assertEqual(cm.exception.code, ErrorCode.MISSING_TARGET_ID)
+        self.assertEqual(Variant.cache_info().hits, 2)
+
+        registry.add("tx2", "ACGT")
+        self.assertEqual(str(Variant("tx2:c.1A>T", targetseq=registry)), "tx2:c.1A>T")
+        registry.default = "ACGT"
+        self.assertEqual(str(Variant("c.1A>T", targetseq=registry)), "c.1A>T")
+
+        registry.add("tx2", "TTTT")
+        with self.assertRaises(MaveHgvsParseError) as cm:
+            Variant("tx2:c.1A>T", targetseq=registry)
+        self.assertEqual(cm.exception.code, ErrorCode.REFERENCE_MISMATCH)
+
+    def test_maxsize(self) -> None:
+        for i in range(1, 20):
+            Variant(f"c.{i}A>T")
+        self.assertEqual(Variant.cache_info().currsize, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+import csv
+import gzip
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from mavehgvs import cli
+from mavehgvs.cli import main, validate_file
+
+SCORES = """accession,hgvs_nt,hgvs_pro,score
+x1,c.1A>T,p.Met1Leu,0.1
+x2,c.2T>G,NA,0.2
+x3,c.2X>G,p.Met1Leu,0.3
+x4,c.4A>T,p.Glu2=,0.4
+x5,,p.Thr2Pro,0.5
+x6,c.[1A>T;2T>G],p.Met1Trp,0.6
+"""
+
+
+class TestValidateFile(unittest.TestCase):
+    def validate(self, data: str, **kwargs):
+        report = io.StringIO()
+        stats = validate_file(io.StringIO(data), report, ",", **kwargs)
+        report.seek(0)
+        return stats, list(csv.reader(report))
+
+    def test_default_columns(self) -> None:
+        stats, report = self.validate(SCORES)
+        self.assertDictEqual(stats, {"rows": 6, "variants": 10, "invalid": 1})
+        self.assertListEqual(
+            report,
+            [
+                ["row", "column", "variant", "error"],
+                ["3", "hgvs_nt", "c.2X>G", "failed regular expression validation"],
+            ],
+        )
+
+    def test_columns(self) -> None:
+        stats, report = self.validate(SCORES, columns=["hgvs_pro"])
+        self.assertDictEqual(stats, {"rows": 6, "variants": 5, "invalid": 0})
+        self.assertEqual(len(report), 1)
+
+    def test_targets(self) -> None:
+        stats, report = self.validate(
+            SCORES, targets={"hgvs_nt": "ATG", "hgvs_pro": "MT"}
+        )
+        self.assertDictEqual(stats, {"rows": 6, "variants": 10, "invalid": 3})
+        self.assertListEqual(
+            [row[:3] for row in report[1:]],
+            [
+                ["3", "hgvs_nt", "c.2X>G"],
+                ["4", "hgvs_nt", "c.4A>T"],
+                ["4", "hgvs_pro", "p.Glu2="],
+            ],
+        )
+
+    def test_batches(self) -> None:
+        expected = self.validate(SCORES, targets={"hgvs_nt": "ATG"})
+        for workers, batch_size in ((1, 1), (1, 4), (2, 1), (2, 100)):
+            with self.subTest(workers=workers, batch_size=batch_size):
+                stats, report = self.validate(
+                    SCORES,
+                    targets={"hgvs_nt": "ATG"},
+                    workers=workers,
+                    batch_size=batch_size,
+                )
+                self.assertDictEqual(stats, expected[0])
+                self.assertListEqual(sorted(report), sorted(expected[1]))
+
+    def test_short_rows(self) -> None:
+        stats, report = self.validate("hgvs_nt,score\nc.1A>T,1\n\nc.2A>T\nx\n")
+        self.assertDictEqual(stats, {"rows": 4, "variants": 3, "invalid": 1})
+
+    def test_invalid_files(self) -> None:
+        for data in ("", "accession,score\nx1,0.1\n"):
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    self.validate(data)
+        with self.assertRaises(ValueError):
+            self.validate(SCORES, columns=["hgvs_splice"])
+        with self.assertRaises(ValueError):
+            self.validate(SCORES, targets={"hgvs_splice": "ATG"})
+        with self.assertRaisesRegex(ValueError, "'hgvs_nt' not validated"):
+            self.validate(SCORES, columns=["hgvs_pro"], targets={"hgvs_nt": "ATG"})
+
+    def test_serial_targets_not_global(self) -> None:
+        self.validate(SCORES, targets={"hgvs_nt": "ATG"})
+        self.assertDictEqual(cli._targets, {})
+
+
+class TestMain(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def run_main(self, *args: str):
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            status = main(list(args))
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_csv(self) -> None:
+        with open(self.path("scores.csv"), "w") as f:
+            f.write(SCORES)
+        status, stdout, stderr = self.run_main(self.path("scores.csv"))
+        self.assertEqual(status, 1)
+        self.assertEqual(len(stdout.splitlines()), 2)
+        self.assertIn("6 rows, 10 variants, 1 invalid", stderr)
+
+    def test_tsv_gzip(self) -> None:
+        with gzip.open(self.path("scores.tsv.gz"), "wt") as f:
+            f.write(SCORES.replace(",", "\t"))
+        status, _, _ = self.run_main(
+            self.path("scores.tsv.gz"),
+            "--column",
+            "hgvs_pro",
+            "--output",
+            self.path("errors.tsv"),
+            "--quiet",
+        )
+        self.assertEqual(status, 0)
+        with open(self.path("errors.tsv")) as f:
+            self.assertEqual(f.read(), "row\tcolumn\tvariant\terror\n")
+
+    def test_delimiter(self) -> None:
+        with open(self.path("scores.txt"), "w") as f:
+            f.write(SCORES.replace(",", "|"))
+        status, stdout, _ = self.run_main(
+            self.path("scores.txt"), "-d", "|", "-t", "hgvs_nt=ATG", "-j", "2"
+        )
+        self.assertEqual(status, 1)
+        self.assertEqual(len(stdout.splitlines()), 3)
+
+    def test_fasta(self) -> None:
+        with open(self.path("targets.fa"), "w") as f:
+            f.write(">tx1\nATGGAA\n>tx2\nMET\n")
+        with open(self.path("scores.csv"), "w") as f:
+            f.write(
+                "hgvs_nt,hgvs_pro\n"
+                "tx1:c.1A>T,tx2:p.Met1Leu\n"
+                "tx1:c.7A>T,tx2:p.Glu2Leu\n"
+                "c.1A>T,tx3:p.Met1Leu\n"
+            )
+        status, stdout, _ = self.run_main(
+            self.path("scores.csv"), "-f", self.path("targets.fa"), "-j", "2"
+        )
+        self.assertEqual(status, 1)
+        self.assertListEqual(
+            [row[:2] + row[3:] for row in csv.reader(io.StringIO(stdout))][1:],
+            [
+                ["2", "hgvs_nt", "variant coordinate out of bounds"],
+                ["3", "hgvs_nt", "variant has no target identifier"],
+                ["3", "hgvs_pro", "unknown target identifier 'tx3'"],
+            ],
+        )
+
+        status, _, stderr = self.run_main(
+            self.path("scores.csv"), "-f", self.path("missing.fa")
+        )
+        self.assertEqual(status, 2)
+
+    def test_fasta_invalid_record(self) -> None:
+        with open(self.path("targets.fa"), "w") as f:
+            f.write(">tx1\nATGGAA\n>E\n>N1\nAC-GT\n")
+        with open(self.path("scores.csv"), "w") as f:
+            f.write("hgvs_nt\ntx1:c.1A>T\nE:c.1A>G\nN1:c.1A>G\ntx1:c.7A>T\n")
+        status, stdout, _ = self.run_main(
+            self.path("scores.csv"), "-f", self.path("targets.fa")
+        )
+        self.assertEqual(status, 1)
+        self.assertListEqual(
+            [row[:3] for row in csv.reader(io.StringIO(stdout))][1:],
+            [
+                ["2", "hgvs_nt", "E:c.1A>G"],
+                ["3", "hgvs_nt", "N1:c.1A>G"],
+                ["4", "hgvs_nt", "tx1:c.7A>T"],
+            ],
+        )
+        self.assertIn("invalid target sequence 'E'", stdout)
+        self.assertIn("invalid target sequence 'N1'", stdout)
+
+    def test_errors(self) -> None:
+        status, _, stderr = self.run_main(self.path("missing.csv"))
+        self.assertEqual(status, 2)
+        self.assertIn("error", stderr)
+
+        with open(self.path("scores.csv"), "w") as f:
+            f.write(SCORES)
+        status, _, stderr = self.run_main(self.path("scores.csv"), "-c", "hgvs_x")
+        self.assertEqual(status, 2)
+        self.assertIn("column 'hgvs_x' not found", stderr)
+
+        status, _, stderr = self.run_main(
+            self.path("scores.csv"), "-c", "hgvs_pro", "-t", "hgvs_nt=ATG"
+        )
+        self.assertEqual(status, 2)
+        self.assertIn("column 'hgvs_nt' not validated", stderr)
+
+        for args in (("-t", "ATG"), ("-j", "-1"), ("--batch-size", "0")):
+            with self.subTest(args=args):
+                with self.assertRaises(SystemExit):
+                    self.run_main(self.path("scores.csv"), *args)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,266 @@
+import unittest
+from unittest.mock import patch
+
+from mavehgvs.target import TargetRegistry, TargetSequence
+from mavehgvs.util import parse_variant_strings
+from mavehgvs.variant import Variant
+
+try:
+    import numpy as np
+    from mavehgvs.columnar import (
+        PREFIXES,
+        VARIANT_TYPES,
+        TARGET_ERRORS,
+        TARGET_MISMATCH,
+        TARGET_OUT_OF_BOUNDS,
+        TARGET_VALID,
+        parse_variant_columns,
+        validate_target,
+    )
+except ImportError:  # pragma: no cover
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestParseVariantColumns(unittest.TestCase):
+    def test_matches_variants(self):
+        variant_strings = [
+            "p.Glu27Trp",
+            "p.(=)",
+            "p.Ile71_Cys80delinsSer",
+            "p.[Glu27Trp;Lys212fs]",
+            "c.=",
+            "c.122-6T>A",
+            "c.*33del",
+            "c.-12_*5dup",
+            "c.43-6_595+12delinsCTT",
+            "c.[1_35del;78+5_78+10del;122T>A]",
+            "n.12_13insC",
+            "g.44dup",
+            "r.22g>u",
+            "c.12A>T",
+        ]
+        columns = parse_variant_columns(variant_strings)
+        self.assertEqual(len(columns), len(variant_strings))
+        self.assertTrue(columns.valid.all())
+        self.assertEqual(columns.errors, [None] * len(variant_strings))
+
+        for i, s in enumerate(variant_strings):
+            with self.subTest(s=s):
+                v = Variant(s)
+                self.assertEqual(PREFIXES[columns.prefix[i]], v.prefix)
+                self.assertEqual(columns.event_count[i], v.variant_count)
+                if v.is_multi_variant():
+                    self.assertEqual(VARIANT_TYPES[columns.variant_type[i]], "multi")
+                    first, last = v.positions[0], v.positions[-1]
+                else:
+                    self.assertEqual(
+                        VARIANT_TYPES[columns.variant_type[i]], v.variant_type
+                    )
+                    first = last = v.positions
+                if isinstance(first, tuple):
+                    first = first[0]
+                if isinstance(last, tuple):
+                    last = last[1]
+
+                if first is None:
+                    self.assertEqual(columns.start[i], 0)
+                    self.assertEqual(columns.end[i], 0)
+                else:
+                    self.assertEqual(columns.start[i], first.position)
+                    self.assertEqual(columns.end[i], last.position)
+                    self.assertEqual(
+                        columns.start_intronic[i], first.intronic_position or 0
+                    )
+                    self.assertEqual(
+                        columns.end_intronic[i], last.intronic_position or 0
+                    )
+                    self.assertEqual(columns.start_utr[i], bool(first.utr))
+                    self.assertEqual(columns.end_utr[i], bool(last.utr))
+
+                self.assertEqual(columns.variant(i), v)
+
+        self.assertEqual(columns.start[1], 0)
+        self.assertEqual(columns.start[5], 122)
+        self.assertEqual(columns.start_intronic[5], -6)
+        self.assertEqual(columns.end[9], 122)
+        self.assertTrue(columns.end_utr[7])
+        self.assertFalse(columns.start_utr[5])
+
+    def test_invalid(self):
+        variant_strings = ["c.12A>T", "c.12A>A", "g.44dup", "p.Glu27Trp"]
+        columns = parse_variant_columns(
+            variant_strings, targetseq="ACGTACGTACGTACGT", expected_prefix="c"
+        )
+        _, errors = parse_variant_strings(
+            variant_strings, targetseq="ACGTACGTACGTACGT", expected_prefix="c"
+        )
+        self.assertListEqual(columns.valid.tolist(), [False, False, False, False])
+        self.assertListEqual(columns.errors, errors)
+        self.assertListEqual(columns.variants(), [None] * 4)
+        self.assertEqual(columns.start.sum(), 0)
+
+    def test_mixed(self):
+        variant_strings = ["c.12A>T", "c.12X>T", "c.44dup"]
+        columns = parse_variant_columns(variant_strings, expected_prefix="c")
+        self.assertListEqual(columns.valid.tolist(), [True, False, True])
+        self.assertListEqual(columns.start.tolist(), [12, 0, 44])
+        self.assertIsNone(columns.variant(1))
+        self.assertListEqual(
+            columns.variants(), [Variant("c.12A>T"), None, Variant("c.44dup")]
+        )
+
+    def test_dtypes(self):
+        columns = parse_variant_columns(["c.12A>T"])
+        dtypes = {k: v.dtype for k, v in columns.columns().items()}
+        self.assertEqual(dtypes["valid"], np.bool_)
+        self.assertEqual(dtypes["prefix"], np.uint8)
+        self.assertEqual(dtypes["variant_type"], np.uint8)
+        self.assertEqual(dtypes["start"], np.int64)
+        self.assertEqual(dtypes["start_utr"], np.bool_)
+
+    def test_empty(self):
+        columns = parse_variant_columns([])
+        self.assertEqual(len(columns), 0)
+        for value in columns.columns().values():
+            self.assertEqual(value.shape, (0,))
+
+    def test_references(self):
+        columns = parse_variant_columns(
+            ["c.12A>T", "c.12del", "p.Glu27Trp", "p.Ile71_Cys80del", "c.[1A>T;3del]"]
+        )
+        self.assertListEqual(
+            columns.start_ref.tolist(), [ord("A"), 0, ord("E"), ord("I"), ord("A")]
+        )
+        self.assertListEqual(
+            columns.end_ref.tolist(), [ord("A"), 0, ord("E"), ord("C"), 0]
+        )
+
+    def test_invalid_expected_prefix(self):
+        with self.assertRaises(ValueError):
+            parse_variant_columns(["c.12A>T"], expected_prefix="x")
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestValidateTarget(unittest.TestCase):
+    def test_validate_target(self):
+        positions = [1, 2, 3, 4, 5, 3]
+        self.assertListEqual(
+            validate_target("ACGT", positions).tolist(),
+            [TARGET_VALID] * 4 + [TARGET_OUT_OF_BOUNDS, TARGET_VALID],
+        )
+        self.assertListEqual(
+            validate_target("ACGT", positions, ["A", "T", "", "T", "A", "G"]).tolist(),
+            [
+                TARGET_VALID,
+                TARGET_MISMATCH,
+                TARGET_VALID,
+                TARGET_VALID,
+                TARGET_OUT_OF_BOUNDS,
+                TARGET_VALID,
+            ],
+        )
+        self.assertListEqual(
+            validate_target(
+                TargetSequence("MTK"), [1, 2, 3], ["Met", "Lys", "K"]
+            ).tolist(),
+            [TARGET_VALID, TARGET_MISMATCH, TARGET_VALID],
+        )
+        self.assertListEqual(
+            validate_target("acgu", [1, 1], [ord("a"), ord("u")]).tolist(),
+            [TARGET_VALID, TARGET_MISMATCH],
+        )
+
+    def test_positions_before_target(self):
+        self.assertListEqual(
+            validate_target("ACGT", [0, -1, 5, 1], ["T", "G", "A", "A"]).tolist(),
+            [
+                TARGET_OUT_OF_BOUNDS,
+                TARGET_OUT_OF_BOUNDS,
+                TARGET_OUT_OF_BOUNDS,
+                TARGET_VALID,
+            ],
+        )
+        self.assertListEqual(
+            validate_target("ACGT", [0, -4]).tolist(), [TARGET_OUT_OF_BOUNDS] * 2
+        )
+
+    def test_target_array_reused(self):
+        target = TargetSequence("ACGT")
+        validate_target(target, [1], ["A"])
+        array = target._residue_array
+        self.assertIsNotNone(array)
+        validate_target(target, [2], ["C"])
+        self.assertIs(target._residue_array, array)
+        self.assertFalse(array.flags.writeable)
+
+    def test_multi_variants_do_not_raise_errors(self):
+        columns = parse_variant_columns(["c.[1A>T;3T>C]", "c.[1A>T;12del]"])
+        with patch.object(Variant, "_parse_error", side_effect=AssertionError):
+            codes = columns.validate_target("ACGT")
+        self.assertListEqual(codes.tolist(), [TARGET_MISMATCH, TARGET_OUT_OF_BOUNDS])
+
+    def test_invalid_references(self):
+        with self.assertRaises(ValueError):
+            validate_target("ACGT", [1, 2], ["A"])
+        with self.assertRaises(ValueError):
+            validate_target("ACGT", [1], ["Xyz"])
+        with self.assertRaises(ValueError):
+            validate_target("ACGT", [1], [1.5])
+
+    def test_registry(self):
+        registry = TargetRegistry({"tx1": "ACGT"})
+        columns = parse_variant_columns(
+            ["tx1:c.1A>T", "tx1:c.5A>T", "tx2:c.1A>T"], targetseq=registry
+        )
+        self.assertListEqual(columns.valid.tolist(), [True, False, False])
+        self.assertListEqual(
+            columns.errors,
+            [
+                None,
+                "variant coordinate out of bounds",
+                "unknown target identifier 'tx2'",
+            ],
+        )
+        with self.assertRaises(ValueError):
+            columns.validate_target(registry)
+
+    def test_columns_agree_with_variants(self):
+        variant_strings = [
+            "c.1A>T",
+            "c.2A>T",
+            "c.9A>T",
+            "c.2_3del",
+            "c.3_9del",
+            "c.=",
+            "c.2_3=",
+            "c.*33del",
+            "c.122-6T>A",
+            "c.[1A>T;3G>C]",
+            "c.[1A>T;3T>C]",
+            "c.[1A>T;12del]",
+            "c.12X>T",
+            "p.Met1Trp",
+            "p.Met1_Lys3del",
+            "p.Met1_Glu3del",
+            "p.Lys3_Thr5del",
+            "p.(=)",
+        ]
+        messages = {message: code for code, message in TARGET_ERRORS.items()}
+        for targetseq in ("ACGTA", "MTK"):
+            with self.subTest(targetseq=targetseq):
+                codes = parse_variant_columns(variant_strings).validate_target(
+                    targetseq
+                )
+                _, errors = parse_variant_strings(variant_strings, targetseq)
+                for s, code, error in zip(variant_strings, codes.tolist(), errors):
+                    if s == "c.12X>T":
+                        self.assertEqual(code, TARGET_VALID)
+                    elif error is None:
+                        self.assertEqual(code, TARGET_VALID, s)
+                    else:
+                        self.assertEqual(code, messages[error], s)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+import random
+import sys
+import unittest
+
+if sys.version_info >= (3, 11):
+    from re import _constants as sre_constants, _parser as sre_parse
+else:
+    import sre_constants
+    import sre_parse
+
+from mavehgvs.patterns.combined import (
+    multi_variant_events,
+    variant_event_characters,
+    variant_events,
+)
+from mavehgvs.variant import Variant
+
+
+def set_characters(items):
+    """Return every character in a character set of a parsed pattern."""
+    characters = set()
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            characters.add(chr(av))
+        elif op is sre_constants.RANGE:
+            characters.update(map(chr, range(av[0], av[1] + 1)))
+        else:
+            raise ValueError(f"unsupported set item {op}")
+    return characters
+
+
+def add_characters(characters, items):
+    """Add every character that can be matched by a parsed pattern to a set."""
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            characters.add(chr(av))
+        elif op is sre_constants.IN:
+            characters.update(set_characters(av))
+        elif op is sre_constants.SUBPATTERN:
+            add_characters(characters, av[-1])
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            add_characters(characters, av[2])
+        elif op is sre_constants.BRANCH:
+            for branch in av[1]:
+                add_characters(characters, branch)
+        elif op is sre_constants.ASSERT:
+            add_characters(characters, av[1])
+        elif op not in (sre_constants.AT, sre_constants.ASSERT_NOT):
+            raise ValueError(f"unsupported pattern item {op}")
+
+
+def pattern_characters(pattern):
+    """Return every character that can be matched by a pattern.
+
+    Raises an error for any construct that can match characters not listed in the
+    pattern, so the result is always complete.
+    """
+    characters = set()
+    add_characters(characters, sre_parse.parse(pattern))
+    return characters
+
+
+class TestVariantEventCharacters(unittest.TestCase):
+    def test_characters_cover_patterns(self):
+        for prefix, pattern in variant_events.items():
+            with self.subTest(prefix=prefix):
+                characters = pattern_characters(pattern)
+                characters |= pattern_characters(multi_variant_events[prefix])
+                characters |= set("[;]")
+                self.assertSetEqual(characters, set(variant_event_characters[prefix]))
+
+
+class TestPrefilter(unittest.TestCase):
+    alphabet = "ACGTNacgun0123456789_.:;[]()*+-=>? ,/\t→" + "delinsdupfsTerMetLys"
+
+    def random_variant(self, rng):
+        prefix = rng.choice("cgmnopr")
+        if prefix == "p":
+            events = [
+                f"{rng.choice(('Met', 'Lys', 'Ter'))}{rng.randint(1, 99)}"
+                f"{rng.choice(('Leu', '=', 'del', 'fs', 'dup', 'Ter'))}"
+                for _ in range(rng.randint(1, 3))
+            ]
+        else:
+            bases = "acgu" if prefix == "r" else "ACGT"
+            events = [
+                rng.choice(
+                    (
+                        f"{rng.randint(1, 99)}{rng.choice(bases)}>"
+                        f"{rng.choice(bases)}",
+                        f"{rng.randint(1, 9)}_{rng.randint(10, 99)}del",
+                        f"{rng.randint(1, 9)}_{rng.randint(1, 9) + 1}ins"
+                        f"{rng.choice(bases) * rng.randint(1, 4)}",
+                        f"{rng.randint(1, 99)}=",
+                    )
+                )
+                for _ in range(rng.randint(1, 3))
+            ]
+        body = events[0] if len(events) == 1 else f"[{';'.join(events)}]"
+        target_id = rng.choice(("", "", "NM_001130145.3:", "tx-1:"))
+        return f"{target_id}{prefix}.{body}"
+
+    def mutate(self, rng, s):
+        for _ in range(rng.randint(0, 3)):
+            i = rng.randint(0, len(s))
+            edit = rng.random()
+            if edit < 0.4:
+                s = s[:i] + rng.choice(self.alphabet) + s[i:]
+            elif edit < 0.7:
+                s = s[:i] + s[i + 1 :]
+            else:
+                s = s[:i] + rng.choice(self.alphabet) + s[i + 1 :]
+        return s
+
+    def test_never_rejects_valid_strings(self):
+        rng = random.Random(0)
+        accepted = 0
+        for _ in range(20_000):
+            s = self.mutate(rng, self.random_variant(rng))
+            if Variant.fullmatch(s) is not None:
+                accepted += 1
+                self.assertIsNotNone(Variant._read_prefix(s), s)
+
+        # make sure that the test covers many strings that match the pattern
+        self.assertGreater(accepted, 5_000)
+
+    def test_rejects_invalid_characters(self):
+        invalid_strings = [
+            "c.1A>T ",
+            "c. 1A>T",
+            "c.1A>T\n",
+            "c.1A→T",
+            "c.[1A>T,2G>C]",
+            "c.1A>T (het)",
+            "c.Met1Leu",
+            "p.1A>T",
+            "r.1A>T",
+            "c.",
+            "NM_001130145.3:c.1A>T?",
+        ]
+
+        for s in invalid_strings:
+            with self.subTest(s=s):
+                self.assertIsNone(Variant._read_prefix(s))
+                self.assertIsNone(Variant.fullmatch(s))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 import itertools
+import pickle
 import random
 from mavehgvs.position import VariantPosition
 from mavehgvs.exceptions import MaveHgvsParseError
@@ -154,6 +155,43 @@ class TestObjectCreation(unittest.TestCase):
         self.assertTrue(v.is_extended())
 
 
+class TestInterning(unittest.TestCase):
+    def test_same_object(self) -> None:
+        position_strings = ("8", "Gly8", "-45-1", "*73-105", "99+88")
+
+        for s in position_strings:
+            with self.subTest(s=s):
+                v = VariantPosition.intern(s)
+                self.assertIs(v, VariantPosition.intern(s))
+                self.assertEqual(v, VariantPosition(s))
+                self.assertEqual(repr(v), s)
+
+    def test_invalid_strings(self) -> None:
+        for s in ("08", "Gly-8", ""):
+            with self.subTest(s=s):
+                with self.assertRaises(MaveHgvsParseError):
+                    VariantPosition.intern(s)
+                self.assertNotIn(s, VariantPosition._interned)
+
+    def test_no_instance_dict(self) -> None:
+        self.assertFalse(hasattr(VariantPosition("Gly8"), "__dict__"))
+
+    def test_pickle(self) -> None:
+        for s in ("8", "Gly8", "-45-1", "*73-105", "99+88"):
+            with self.subTest(s=s):
+                v = VariantPosition(s)
+                w = pickle.loads(pickle.dumps(v))
+                self.assertEqual(v, w)
+                self.assertEqual(repr(v), repr(w))
+
+    def test_immutable(self) -> None:
+        v = VariantPosition.intern("99+88")
+        for attr in ("position", "amino_acid", "intronic_position", "utr"):
+            with self.subTest(attr=attr):
+                with self.assertRaises(AttributeError):
+                    setattr(v, attr, 1)
+
+
 class TestObjectRepresentation(unittest.TestCase):
     def test_repr(self) -> None:
         position_strings = (
@@ -226,6 +264,50 @@ class TestComparisons(unittest.TestCase):
                     random.shuffle(shuffled_variants)
                 self.assertListEqual(self.sorted_variants, sorted(shuffled_variants))
 
+    def test_gt(self) -> None:
+        for v1, v2 in self.sorted_variant_pairs:
+            with self.subTest(v1=v1, v2=v2):
+                self.assertGreater(v2, v1)
+                self.assertGreaterEqual(v2, v1)
+                self.assertLessEqual(v1, v2)
+                self.assertFalse(v1 >= v2)
+
+    def test_sort_key(self) -> None:
+        keys = [v.sort_key for v in self.sorted_variants]
+        self.assertListEqual(keys, sorted(keys))
+        self.assertEqual(len(set(keys)), len(keys))
+        self.assertTupleEqual(VariantPosition("-45-1").sort_key, (0, -45, -1))
+        self.assertTupleEqual(VariantPosition("Gly8").sort_key, (1, 8, 0))
+        self.assertTupleEqual(VariantPosition("*73-105").sort_key, (2, 73, -105))
+
+        shuffled_variants = self.sorted_variants.copy()
+        random.shuffle(shuffled_variants)
+        self.assertListEqual(
+            self.sorted_variants,
+            sorted(shuffled_variants, key=lambda v: v.sort_key),
+        )
+
+    def test_hash(self) -> None:
+        self.assertEqual(len(set(self.sorted_variants)), len(self.sorted_variants))
+        for v in self.sorted_variants:
+            with self.subTest(v=v):
+                w = VariantPosition(repr(v))
+                self.assertIsNot(v, w)
+                self.assertEqual(hash(v), hash(w))
+                self.assertIn(w, set(self.sorted_variants))
+
+    def test_hash_ignores_amino_acid(self) -> None:
+        v1 = VariantPosition("Gly8")
+        v2 = VariantPosition("Ala8")
+        self.assertEqual(v1, v2)
+        self.assertEqual(hash(v1), hash(v2))
+        self.assertEqual(len({v1, v2, VariantPosition("8")}), 1)
+
+    def test_compare_other_type(self) -> None:
+        v = VariantPosition("8")
+        self.assertNotEqual(v, "8")
+        self.assertNotEqual(v, 8)
+
 
 # TODO: add amino acid variants
 class TestAdjacency(unittest.TestCase):
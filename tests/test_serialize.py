@@ -0,0 +1,151 @@
+import pickle
+import unittest
+
+from mavehgvs import serialize
+from mavehgvs.position import VariantPosition
+from mavehgvs.variant import Variant
+
+VARIANT_STRINGS = [
+    "p.Glu27Trp",
+    "p.Ter345Lys",
+    "p.Cys22=",
+    "p.(=)",
+    "p.=",
+    "p.Glu27fs",
+    "p.Ile71_Cys80delinsSer",
+    "p.His7_Gln8insSer",
+    "p.[Glu27Trp;Lys212fs]",
+    "c.=",
+    "c.1_3=",
+    "c.122-6T>A",
+    "c.*33del",
+    "c.-12_*5dup",
+    "c.43-6_595+12delinsCTT",
+    "c.[1_35del;78+5_78+10del;122T>A]",
+    "n.12_13insC",
+    "g.44dup",
+    "g.3000000000del",
+    "m.[12A>T;15del]",
+    "o.7C>G",
+    "r.22g>u",
+    "r.123_127del",
+    "NM_001130145.3:c.832C>T",
+    "GeneX:r.[22g>u;35del]",
+]
+
+
+class TestEncoding(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        for s in VARIANT_STRINGS:
+            with self.subTest(s=s):
+                v = Variant(s)
+                w = serialize.loads(serialize.dumps(v))
+                self.assertEqual(v, w)
+                self.assertEqual(s, str(w))
+                self.assertTupleEqual(v.sort_key, w.sort_key)
+                self.assertEqual(v.positions, w.positions)
+                self.assertEqual(repr(v.positions), repr(w.positions))
+
+    def test_round_trip_many(self) -> None:
+        variants = [Variant(s) for s in VARIANT_STRINGS]
+        variants.insert(3, None)
+        decoded = serialize.loads_many(serialize.dumps_many(variants))
+        self.assertListEqual(decoded, variants)
+        self.assertListEqual(
+            [None if v is None else str(v) for v in decoded],
+            [None if v is None else str(v) for v in variants],
+        )
+
+    def test_many_events(self) -> None:
+        s = f"c.[{';'.join(f'{i * 3}del' for i in range(1, 301))}]"
+        v = Variant(s)
+        self.assertEqual(str(serialize.loads(serialize.dumps(v))), s)
+
+    def test_empty_list(self) -> None:
+        self.assertListEqual(serialize.loads_many(serialize.dumps_many([])), [])
+
+    def test_shared_positions(self) -> None:
+        decoded = serialize.loads_many(
+            serialize.dumps_many([Variant("c.122-6T>A"), Variant("c.122-6T>C")])
+        )
+        self.assertIs(decoded[0].positions, decoded[1].positions)
+        self.assertIsInstance(decoded[0].positions, VariantPosition)
+
+    def test_version(self) -> None:
+        data = serialize.dumps(Variant("p.Glu27Trp"))
+        self.assertEqual(data[0], serialize.FORMAT_VERSION)
+        with self.assertRaises(ValueError):
+            serialize.loads(bytes((serialize.FORMAT_VERSION + 1,)) + data[1:])
+        with self.assertRaises(ValueError):
+            serialize.loads_many(bytes((0,)) + data[1:])
+
+    def test_code_tables(self) -> None:
+        # changing existing codes breaks data written by earlier releases
+        self.assertEqual(serialize.FORMAT_VERSION, 1)
+        self.assertTupleEqual(
+            serialize._PREFIXES[:7], ("c", "g", "m", "n", "o", "p", "r")
+        )
+        self.assertTupleEqual(
+            serialize._VARIANT_TYPES[:7],
+            ("equal", "sub", "fs", "del", "dup", "ins", "delins"),
+        )
+        self.assertEqual(
+            "".join(serialize._AMINO_ACIDS[:21]),
+            "AlaArgAsnAspCysGlnGluGlyHisIleLeuLysMetPheProSerThrTrpTyrValTer",
+        )
+        self.assertEqual(
+            serialize.dumps(Variant("p.Glu27Trp")),
+            b"\x01\x05\x00\x05\x04\x1b\x00\x00\x00\x06\x03Trp",
+        )
+        self.assertEqual(
+            serialize.loads(
+                b"\x01\x00\x03\x03tx1\x02\x05\x02z\x00\x00\x00\xfa\xff\xff\xff"
+                b"\x01T\x01A\r\x01!\x00\x00\x00"
+            ),
+            Variant("tx1:c.[122-6T>A;*33del]"),
+        )
+
+    def test_invalid_data(self) -> None:
+        data = serialize.dumps(Variant("c.[1_35del;78+5_78+10del;122T>A]"))
+        invalid_data = [
+            b"",
+            data[:1],
+            data[:-1],
+            data + b"\x00",
+            serialize.dumps_many([None]),
+            bytes((serialize.FORMAT_VERSION, 200, 0)),
+        ]
+
+        for d in invalid_data:
+            with self.subTest(d=d):
+                with self.assertRaises(ValueError):
+                    serialize.loads(d)
+
+        with self.assertRaises(ValueError):
+            serialize.loads_many(serialize.dumps_many([None]) + b"\x00")
+
+
+class TestPickle(unittest.TestCase):
+    def test_pickle_uses_encoding(self) -> None:
+        v = Variant("c.[1_35del;78+5_78+10del;122T>A]")
+        self.assertIn(serialize.dumps(v), pickle.dumps(v))
+
+    def test_pickle_variants(self) -> None:
+        variants = [Variant(s) for s in VARIANT_STRINGS]
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                decoded = pickle.loads(pickle.dumps(variants, protocol=protocol))
+                self.assertListEqual(decoded, variants)
+                self.assertListEqual(
+                    [str(v) for v in decoded], [str(v) for v in variants]
+                )
+
+    def test_pickle_lazy_position(self) -> None:
+        v = Variant("c.122-6T>A")
+        w = pickle.loads(pickle.dumps(v))
+        self.assertEqual(v, w)
+        self.assertEqual(hash(v), hash(w))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,353 @@
+import itertools
+import os
+import pickle
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from mavehgvs.exceptions import ErrorCode, MaveHgvsParseError
+from mavehgvs.target import TargetRegistry, TargetSequence, _prepare_target
+from mavehgvs.util import parse_variant_strings
+from mavehgvs.variant import Variant
+
+
+class TestTargetSequence(unittest.TestCase):
+    def test_infer_type(self) -> None:
+        sequence_tuples = [
+            ("ACGT", "dna"),
+            ("acgu", "rna"),
+            ("MTKLV*", "protein"),
+            ("ACGU", "rna"),
+        ]
+
+        for sequence, sequence_type in sequence_tuples:
+            with self.subTest(sequence=sequence):
+                target = TargetSequence(sequence)
+                self.assertEqual(target.sequence, sequence)
+                self.assertEqual(target.sequence_type, sequence_type)
+                self.assertEqual(len(target), len(sequence))
+                self.assertEqual(str(target), sequence)
+
+    def test_declared_type(self) -> None:
+        target = TargetSequence("ACGT", "protein")
+        self.assertEqual(target.sequence_type, "protein")
+        self.assertEqual(repr(target), "TargetSequence('ACGT', 'protein')")
+
+    def test_invalid(self) -> None:
+        invalid_tuples = [
+            ("", None),
+            ("AC GT", None),
+            ("ACGT", "DNA"),
+            ("ACGT", "rna"),
+            ("MTKLE", "dna"),
+        ]
+
+        for sequence, sequence_type in invalid_tuples:
+            with self.subTest(sequence=sequence, sequence_type=sequence_type):
+                with self.assertRaises(ValueError):
+                    TargetSequence(sequence, sequence_type)
+
+        with self.assertRaises(ValueError):
+            TargetSequence(None)
+
+    def test_equality(self) -> None:
+        target = TargetSequence("ACGT")
+        self.assertEqual(target, TargetSequence("ACGT"))
+        self.assertEqual(hash(target), hash(TargetSequence("ACGT")))
+        self.assertNotEqual(target, TargetSequence("ACGT", "protein"))
+        self.assertNotEqual(target, TargetSequence("ACGA"))
+        self.assertNotEqual(target, "ACGT")
+
+    def test_pickle(self) -> None:
+        target = TargetSequence("MTKLV", "protein")
+        self.assertEqual(pickle.loads(pickle.dumps(target)), target)
+
+    def test_prepare_target(self) -> None:
+        self.assertIsNone(_prepare_target(None))
+        self.assertEqual(_prepare_target("ACGT"), TargetSequence("ACGT"))
+        target = TargetSequence("ACGT")
+        self.assertIs(_prepare_target(target), target)
+        self.assertEqual(_prepare_target("not a sequence"), "not a sequence")
+
+
+class TestTargetSequenceValidation(unittest.TestCase):
+    def assertValidationAgrees(self, variant_strings, targetseq) -> None:
+        target = TargetSequence(targetseq)
+        for s in variant_strings:
+            with self.subTest(s=s, targetseq=targetseq):
+                try:
+                    expected = Variant(s, targetseq=targetseq)
+                except MaveHgvsParseError as error:
+                    with self.assertRaises(MaveHgvsParseError) as context:
+                        Variant(s, targetseq=target)
+                    self.assertEqual(str(context.exception), str(error))
+                else:
+                    self.assertEqual(Variant(s, targetseq=target), expected)
+
+    def test_dna(self) -> None:
+        targetseq = "ACGTTGCA"
+        variant_strings = [
+            f"c.{i}{ref}>T" for i, ref in itertools.product(range(1, 11), "ACGT")
+        ]
+        variant_strings.extend(
+            f"c.{start}_{start + 2}{vtype}"
+            for start, vtype in itertools.product(range(1, 10), ("del", "dup", "="))
+        )
+        variant_strings.extend(
+            [
+                "c.=",
+                "c.4del",
+                "c.9del",
+                "c.1_2insA",
+                "c.8_9insA",
+                "c.2_3delinsTT",
+                "c.[1A>T;3G>C]",
+                "c.[1A>T;3T>C]",
+                "c.[1A>T;9del]",
+                "c.*33del",
+                "c.-12_*5dup",
+                "c.122-6T>A",
+                "c.4+1G>A",
+                "g.3000000000del",
+                "n.5T>A",
+            ]
+        )
+        self.assertValidationAgrees(variant_strings, targetseq)
+
+    def test_rna(self) -> None:
+        self.assertValidationAgrees(
+            ["r.1a>u", "r.1c>u", "r.2_3del", "r.4del", "r.5del", "r.=", "r.4u>a"],
+            "acgu",
+        )
+
+    def test_protein(self) -> None:
+        targetseq = "MTKLV*"
+        variant_strings = [
+            f"p.{aa}{i}Trp"
+            for i, aa in itertools.product(range(1, 8), ("Met", "Thr", "Lys", "Ter"))
+        ]
+        variant_strings.extend(
+            [
+                "p.=",
+                "p.(=)",
+                "p.Thr2=",
+                "p.Met1_Lys3del",
+                "p.Met1_Thr3del",
+                "p.Thr2_Lys3insGly",
+                "p.Lys3_Val5delinsGly",
+                "p.Leu4_Ter6dup",
+                "p.Leu4_Ter7dup",
+                "p.Lys3fs",
+                "p.Leu3fs",
+                "p.[Met1Trp;Leu4fs]",
+                "p.[Met1Trp;Val4fs]",
+            ]
+        )
+        self.assertValidationAgrees(variant_strings, targetseq)
+
+    def test_from_components(self) -> None:
+        v = Variant("c.3G>C")
+        target = TargetSequence("ACGT")
+        self.assertEqual(
+            Variant.from_components(
+                v.prefix, v.variant_type, v.positions, v.sequence, targetseq=target
+            ),
+            v,
+        )
+        with self.assertRaises(MaveHgvsParseError):
+            Variant.from_components(
+                v.prefix,
+                v.variant_type,
+                v.positions,
+                v.sequence,
+                targetseq=TargetSequence("ACTT"),
+            )
+
+    def test_parse_variant_strings(self) -> None:
+        variant_strings = ["c.1A>T", "c.3G>C", "c.1C>T", "c.5A>G"]
+        self.assertEqual(
+            parse_variant_strings(variant_strings, targetseq=TargetSequence("ACGT")),
+            parse_variant_strings(variant_strings, targetseq="ACGT"),
+        )
+
+
+class TestTargetRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write_fasta(self, data: str, name: str = "targets.fa") -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", newline="") as f:
+            f.write(data)
+        return path
+
+    def test_targets(self) -> None:
+        registry = TargetRegistry({"tx1": "ACGT", "tx2": TargetSequence("MTK")})
+        self.assertEqual(registry["tx1"], TargetSequence("ACGT"))
+        self.assertEqual(registry["tx2"].sequence_type, "protein")
+        self.assertIn("tx1", registry)
+        self.assertNotIn("tx3", registry)
+        self.assertListEqual(list(registry), ["tx1", "tx2"])
+        self.assertEqual(len(registry), 2)
+        with self.assertRaises(KeyError):
+            registry["tx3"]
+        with self.assertRaises(ValueError):
+            registry.add("tx3", "AC GT")
+
+    def test_validation(self) -> None:
+        registry = TargetRegistry({"tx1": "ACGT", "tx2": "TTTTTT"})
+
+        valid_strings = ["tx1:c.1A>T", "tx2:c.6T>G", "tx2:c.5_6del", "tx1:c.3="]
+        for s in valid_strings:
+            with self.subTest(s=s):
+                self.assertEqual(Variant(s, targetseq=registry), Variant(s))
+
+        invalid_tuples = [
+            ("tx1:c.5A>T", "variant coordinate out of bounds"),
+            ("tx2:c.1A>T", "variant reference does not match target"),
+            ("tx3:c.1A>T", "unknown target identifier 'tx3'"),
+            ("c.1A>T", "variant has no target identifier"),
+        ]
+        for s, message in invalid_tuples:
+            with self.subTest(s=s):
+                with self.assertRaisesRegex(MaveHgvsParseError, message):
+                    Variant(s, targetseq=registry)
+
+        valid, invalid = parse_variant_strings(
+            valid_strings + [s for s, _ in invalid_tuples], targetseq=registry
+        )
+        self.assertListEqual(valid[:4], [Variant(s) for s in valid_strings])
+        self.assertListEqual(invalid[4:], [message for _, message in invalid_tuples])
+
+    def test_default(self) -> None:
+        registry = TargetRegistry({"tx1": "ACGT"}, default="TTTT")
+        self.assertEqual(Variant("c.4T>A", targetseq=registry), Variant("c.4T>A"))
+        self.assertEqual(
+            Variant("tx1:c.4T>A", targetseq=registry), Variant("tx1:c.4T>A")
+        )
+        with self.assertRaises(MaveHgvsParseError):
+            Variant("c.1A>T", targetseq=registry)
+
+    def test_fasta(self) -> None:
+        data = ">tx1 first target\nACGTAC\nGTACGT\nAC\n>tx2\nMTKLV\n>tx3\nACG"
+        for newline in ("\n", "\r\n"):
+            with self.subTest(newline=newline):
+                path = self.write_fasta(data.replace("\n", newline))
+                registry = TargetRegistry.from_fasta(path)
+                self.assertListEqual(registry.target_ids(), ["tx1", "tx2", "tx3"])
+                self.assertEqual(registry["tx1"], TargetSequence("ACGTACGTACGTAC"))
+                self.assertEqual(registry["tx2"], TargetSequence("MTKLV"))
+                self.assertEqual(registry["tx3"], TargetSequence("ACG"))
+                self.assertEqual(
+                    Variant("tx1:c.14C>T", targetseq=registry), Variant("tx1:c.14C>T")
+                )
+                with self.assertRaises(MaveHgvsParseError):
+                    Variant("tx1:c.15C>T", targetseq=registry)
+
+    def test_fasta_priority(self) -> None:
+        first = self.write_fasta(">tx1\nACGT\n>tx2\nAAAA\n", "first.fa")
+        second = self.write_fasta(">tx2\nCCCC\n>tx3\nGGGG\n", "second.fa")
+        registry = TargetRegistry({"tx1": "TTTT"})
+        registry.add_fasta(first)
+        registry.add_fasta(second)
+        self.assertListEqual(list(registry), ["tx1", "tx2", "tx3"])
+        self.assertEqual(str(registry["tx1"]), "TTTT")
+        self.assertEqual(str(registry["tx2"]), "AAAA")
+        self.assertEqual(str(registry["tx3"]), "GGGG")
+
+    def test_invalid_fasta(self) -> None:
+        invalid_files = [
+            "",
+            "ACGT\n",
+            ">\nACGT\n",
+            ">tx1\nACGT\n>tx1\nACGT\n",
+            ">tx1\nACG\nACGT\n",
+            ">tx1\nACGT\nAC\nACGT\n",
+        ]
+        for data in invalid_files:
+            with self.subTest(data=data):
+                registry = TargetRegistry.from_fasta(self.write_fasta(data))
+                with self.assertRaises(ValueError):
+                    registry.target_ids()
+
+    def test_invalid_record(self) -> None:
+        data = ">tx1\nACGT\n>E\n>N1\nAC-GT\n>N2\nAC GT\n"
+        for map_threshold in (10_000_000, 1):
+            registry = TargetRegistry.from_fasta(
+                self.write_fasta(data), map_threshold=map_threshold
+            )
+            self.assertListEqual(registry.target_ids(), ["tx1", "E", "N1", "N2"])
+            for target_id in ("E", "N1", "N2"):
+                with self.subTest(target_id=target_id, map_threshold=map_threshold):
+                    with self.assertRaises(MaveHgvsParseError) as cm:
+                        registry[target_id]
+                    self.assertEqual(cm.exception.code, ErrorCode.INVALID_TARGET)
+                    with self.assertRaises(MaveHgvsParseError) as cm:
+                        Variant(f"{target_id}:c.1A>G", targetseq=registry)
+                    self.assertEqual(cm.exception.code, ErrorCode.INVALID_TARGET)
+                    self.assertIn(f"'{target_id}'", str(cm.exception))
+
+            valid, invalid = parse_variant_strings(
+                ["tx1:c.1A>G", "E:c.1A>G", "N1:c.1A>G"], targetseq=registry
+            )
+            self.assertEqual(str(valid[0]), "tx1:c.1A>G")
+            self.assertIsNone(valid[1])
+            self.assertIsNone(valid[2])
+            self.assertIsNone(invalid[0])
+            self.assertTrue(invalid[1].startswith("invalid target sequence 'E'"))
+            self.assertTrue(invalid[2].startswith("invalid target sequence 'N1'"))
+
+    def test_cache(self) -> None:
+        data = "".join(f">tx{i}\nACGT\n" for i in range(4))
+        registry = TargetRegistry.from_fasta(self.write_fasta(data), cache_size=2)
+        for target_id in ("tx0", "tx1", "tx0", "tx2", "tx1"):
+            registry[target_id]
+        info = registry.cache_info()
+        self.assertEqual(info.maxsize, 2)
+        self.assertEqual(info.currsize, 2)
+
+    def test_memory_mapped(self) -> None:
+        sequence = "ACGTTGCA" * 100
+        data = ">tx1\n" + "\n".join(
+            sequence[i : i + 60] for i in range(0, len(sequence), 60)
+        )
+        registry = TargetRegistry.from_fasta(self.write_fasta(data), map_threshold=1)
+        target = registry["tx1"]
+        self.assertEqual(len(target), len(sequence))
+        self.assertEqual(str(target), sequence)
+        self.assertEqual(target.sequence_type, "dna")
+        self.assertEqual(target.sequence[799], "A")
+        for s in ("tx1:c.1A>T", "tx1:c.800A>T", "tx1:c.61_62insA", "tx1:c.801A>T"):
+            with self.subTest(s=s):
+                try:
+                    expected = Variant(s, targetseq=sequence)
+                except MaveHgvsParseError:
+                    with self.assertRaises(MaveHgvsParseError):
+                        Variant(s, targetseq=registry)
+                else:
+                    self.assertEqual(Variant(s, targetseq=registry), expected)
+
+    def test_pickle(self) -> None:
+        path = self.write_fasta(">tx1\nACGT\n")
+        registry = TargetRegistry.from_fasta(path, default="TTTT")
+        registry["tx1"]
+        copy = pickle.loads(pickle.dumps(registry))
+        self.assertEqual(copy["tx1"], registry["tx1"])
+        self.assertEqual(copy.default, registry.default)
+        self.assertEqual(copy.cache_info().currsize, 1)
+
+    def test_parallel(self) -> None:
+        registry = TargetRegistry.from_fasta(self.write_fasta(">tx1\nACGT\n"))
+        variant_strings = ["tx1:c.1A>T", "tx1:c.1C>T", "tx2:c.1A>T"] * 10
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(
+                parse_variant_strings(
+                    variant_strings, targetseq=registry, executor=executor
+                ),
+                parse_variant_strings(variant_strings, targetseq=registry),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,22 @@
+import gc
+import itertools
+import random
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
-from mavehgvs.util import parse_variant_strings
+from mavehgvs.exceptions import ErrorCode
+from mavehgvs.target import TargetRegistry
+from mavehgvs.util import (
+    parse_variant_strings,
+    parse_unique_variant_strings,
+    DeduplicationInfo,
+    iter_parse_variant_strings,
+    is_valid,
+    sort_variants,
+    variants_to_records,
+    variants_to_columns,
+)
 from mavehgvs.variant import Variant
 
 
@@ -100,3 +116,478 @@ class TestParseVariantStrings(unittest.TestCase):
             with self.subTest(p=p):
                 with self.assertRaises(ValueError):
                     parse_variant_strings([variant], expected_prefix=p)
+
+    def test_parallel(self) -> None:
+        variant_strings = [
+            "c.1A>T",
+            "c.3G>C",
+            "c.[1A>T;3G>C]",
+            "c.1C>T",
+            "c.5A>G",
+            "p.Glu27Trp",
+            "c.1A>T",
+            "not a variant",
+        ] * 5
+        expected = parse_variant_strings(
+            variant_strings, targetseq="ACGT", expected_prefix="c"
+        )
+
+        with self.subTest(workers=2):
+            self.assertEqual(
+                parse_variant_strings(
+                    variant_strings, targetseq="ACGT", expected_prefix="c", workers=2
+                ),
+                expected,
+            )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for batch_size in (None, 1, 3, 100):
+                with self.subTest(batch_size=batch_size):
+                    self.assertEqual(
+                        parse_variant_strings(
+                            variant_strings,
+                            targetseq="ACGT",
+                            expected_prefix="c",
+                            executor=executor,
+                            batch_size=batch_size,
+                        ),
+                        expected,
+                    )
+
+    def test_parallel_empty(self) -> None:
+        self.assertEqual(parse_variant_strings([], workers=2), ([], []))
+
+    def test_parallel_invalid_options(self) -> None:
+        with self.assertRaises(ValueError):
+            parse_variant_strings(["c.1A>T"], workers=0)
+        with self.assertRaises(ValueError):
+            parse_variant_strings(["c.1A>T"], workers=2, batch_size=0)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with self.assertRaises(ValueError):
+                parse_variant_strings(["c.1A>T"], workers=2, executor=executor)
+
+    def test_error_codes(self) -> None:
+        variant_strings = [
+            "c.1A>T",
+            "NA",
+            "",
+            "c.5_3del",
+            "c.[1A>T;1A>G]",
+            "c.5A>T",
+            "c.1C>T",
+            "p.(=)",
+            "c.[3G>C;1A>T]",
+            "tx1:c.1A>T",
+        ]
+        expected_codes = [
+            None,
+            ErrorCode.REGEX,
+            ErrorCode.REGEX,
+            ErrorCode.POSITION_ORDER,
+            ErrorCode.SAME_POSITION,
+            ErrorCode.OUT_OF_BOUNDS,
+            ErrorCode.REFERENCE_MISMATCH,
+            ErrorCode.UNEXPECTED_PREFIX,
+            ErrorCode.VARIANT_ORDER,
+            None,
+        ]
+        for targetseq in ("ACGT", TargetRegistry({"tx1": "ACGT"}, default="ACGT")):
+            with self.subTest(targetseq=targetseq):
+                valid, messages = parse_variant_strings(
+                    variant_strings, targetseq=targetseq, expected_prefix="c"
+                )
+                self.assertEqual(
+                    parse_variant_strings(
+                        variant_strings,
+                        targetseq=targetseq,
+                        expected_prefix="c",
+                        error_codes=True,
+                    ),
+                    (valid, expected_codes),
+                )
+                self.assertListEqual(
+                    messages,
+                    [None if c is None else c.message for c in expected_codes],
+                )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            _, codes = parse_variant_strings(
+                variant_strings,
+                targetseq="ACGT",
+                expected_prefix="c",
+                executor=executor,
+                batch_size=3,
+                error_codes=True,
+            )
+        self.assertListEqual(codes, expected_codes)
+        _, codes, _ = parse_unique_variant_strings(
+            variant_strings * 2, targetseq="ACGT", expected_prefix="c", error_codes=True
+        )
+        self.assertListEqual(codes, expected_codes * 2)
+
+    def test_error_codes_without_exceptions(self) -> None:
+        variant_strings = [
+            "NA",
+            "c.5_3del",
+            "c.12_14insA",
+            "c.[3A>T;1C>G]",
+            "c.[1_3del;2_4dup]",
+            "c.[1A>T;1A>G]",
+            "p.[Met1fs;Thr2fs]",
+            "tx1:c.5A>T",
+            "tx1:c.1C>T",
+            "tx2:c.1A>T",
+            "c.1A>T",
+        ]
+        expected_codes = [
+            ErrorCode.REGEX,
+            ErrorCode.POSITION_ORDER,
+            ErrorCode.INSERTION_POSITIONS,
+            ErrorCode.VARIANT_ORDER,
+            ErrorCode.OVERLAP,
+            ErrorCode.SAME_POSITION,
+            ErrorCode.MULTIPLE_FRAME_SHIFTS,
+            ErrorCode.OUT_OF_BOUNDS,
+            ErrorCode.REFERENCE_MISMATCH,
+            ErrorCode.UNKNOWN_TARGET_ID,
+            ErrorCode.MISSING_TARGET_ID,
+        ]
+        with patch(
+            "mavehgvs.exceptions.MaveHgvsParseError.__init__",
+            side_effect=AssertionError("exception created"),
+        ):
+            _, codes = parse_variant_strings(
+                variant_strings,
+                targetseq=TargetRegistry({"tx1": "ACGT"}),
+                error_codes=True,
+            )
+        self.assertListEqual(codes, expected_codes)
+
+        _, messages = parse_variant_strings(
+            variant_strings, targetseq=TargetRegistry({"tx1": "ACGT"})
+        )
+        self.assertEqual(messages[-2], "unknown target identifier 'tx2'")
+
+    def test_error_codes_cache(self) -> None:
+        Variant.enable_cache()
+        self.addCleanup(Variant.disable_cache)
+        for _ in range(2):
+            self.assertEqual(
+                parse_variant_strings(
+                    ["c.1A>T", "NA", "c.5A>T"], targetseq="ACGT", error_codes=True
+                ),
+                (
+                    [Variant("c.1A>T"), None, None],
+                    [None, ErrorCode.REGEX, ErrorCode.OUT_OF_BOUNDS],
+                ),
+            )
+
+    def test_garbage_collector_state(self) -> None:
+        self.addCleanup(gc.enable)
+        for enabled in (True, False):
+            with self.subTest(enabled=enabled):
+                gc.enable() if enabled else gc.disable()
+                with patch("gc.disable") as disable, ThreadPoolExecutor(1) as pool:
+                    parse_variant_strings(["c.1A>T", "NA"], executor=pool)
+                self.assertEqual(disable.called, enabled)
+                self.assertEqual(gc.isenabled(), enabled)
+
+
+class TestParseUniqueVariantStrings(unittest.TestCase):
+    variant_strings = [
+        "c.1A>T",
+        "c.3G>C",
+        "c.1A>T",
+        "not a variant",
+        "p.Glu27Trp",
+        "c.[1A>T;3G>C]",
+        "not a variant",
+        "c.1A>T",
+    ]
+
+    def test_unique(self) -> None:
+        valid, invalid, info = parse_unique_variant_strings(
+            self.variant_strings, targetseq="ACGT", expected_prefix="c"
+        )
+        self.assertEqual(
+            (valid, invalid),
+            parse_variant_strings(
+                self.variant_strings, targetseq="ACGT", expected_prefix="c"
+            ),
+        )
+        self.assertEqual(info, DeduplicationInfo(total=8, unique=5))
+        self.assertAlmostEqual(info.ratio, 1.6)
+        self.assertIs(valid[0], valid[2])
+        self.assertIs(valid[0], valid[7])
+
+    def test_deduplicate(self) -> None:
+        expected = parse_variant_strings(self.variant_strings, targetseq="ACGT")
+        self.assertEqual(
+            parse_variant_strings(
+                iter(self.variant_strings), targetseq="ACGT", deduplicate=True
+            ),
+            expected,
+        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for batch_size in (None, 1, 2):
+                with self.subTest(batch_size=batch_size):
+                    self.assertEqual(
+                        parse_variant_strings(
+                            self.variant_strings,
+                            targetseq="ACGT",
+                            executor=executor,
+                            batch_size=batch_size,
+                            deduplicate=True,
+                        ),
+                        expected,
+                    )
+
+    def test_empty(self) -> None:
+        valid, invalid, info = parse_unique_variant_strings([])
+        self.assertEqual((valid, invalid), ([], []))
+        self.assertEqual(info.ratio, 1.0)
+
+    def test_invalid_options(self) -> None:
+        with self.assertRaises(ValueError):
+            parse_unique_variant_strings(["c.1A>T"], expected_prefix="x")
+        with self.assertRaises(ValueError):
+            parse_unique_variant_strings(["c.1A>T"], workers=0)
+
+
+class TestIterParseVariantStrings(unittest.TestCase):
+    variant_strings = [
+        "c.1A>T",
+        "c.3G>C",
+        "c.[1A>T;3G>C]",
+        "c.1C>T",
+        "p.Glu27Trp",
+        "not a variant",
+        "c.4T>A",
+    ]
+
+    def test_agrees_with_parse_variant_strings(self) -> None:
+        for targetseq, expected_prefix in (
+            (None, None),
+            ("ACGT", None),
+            (None, "c"),
+            ("ACGT", "c"),
+        ):
+            with self.subTest(targetseq=targetseq, expected_prefix=expected_prefix):
+                valid, invalid = parse_variant_strings(
+                    self.variant_strings, targetseq, expected_prefix
+                )
+                results = list(
+                    iter_parse_variant_strings(
+                        self.variant_strings, targetseq, expected_prefix
+                    )
+                )
+                self.assertListEqual(
+                    results, list(zip(range(len(valid)), valid, invalid))
+                )
+
+    def test_chunks(self) -> None:
+        results = list(iter_parse_variant_strings(self.variant_strings))
+        for chunk_size in (1, 2, 3, 7, 100):
+            with self.subTest(chunk_size=chunk_size):
+                chunks = list(
+                    iter_parse_variant_strings(
+                        self.variant_strings, chunk_size=chunk_size
+                    )
+                )
+                self.assertTrue(all(0 < len(x) <= chunk_size for x in chunks))
+                self.assertListEqual([r for x in chunks for r in x], results)
+
+    def test_lazy(self) -> None:
+        def variant_strings():
+            for i in itertools.count(1):
+                yield f"c.{i}A>T"
+
+        results = iter_parse_variant_strings(variant_strings())
+        self.assertEqual(next(results), (0, Variant("c.1A>T"), None))
+        self.assertEqual(next(results), (1, Variant("c.2A>T"), None))
+
+        chunks = iter_parse_variant_strings(variant_strings(), chunk_size=2)
+        self.assertEqual(
+            [v for _, v, _ in next(chunks)], [Variant("c.1A>T"), Variant("c.2A>T")]
+        )
+
+    def test_empty(self) -> None:
+        self.assertListEqual(list(iter_parse_variant_strings([])), [])
+        self.assertListEqual(list(iter_parse_variant_strings([], chunk_size=2)), [])
+
+    def test_invalid_options(self) -> None:
+        with self.assertRaises(ValueError):
+            iter_parse_variant_strings(["c.1A>T"], expected_prefix="x")
+        with self.assertRaises(ValueError):
+            iter_parse_variant_strings(["c.1A>T"], chunk_size=0)
+
+
+class TestIsValid(unittest.TestCase):
+    def setUp(self) -> None:
+        self.valid_variant_strings = [
+            "p.Glu27Trp",
+            "c.122-6T>A",
+            "g.44del",
+            "c.78+5_78+10del",
+            "c.77dup",
+            "p.Pro12_Gly18dup",
+            "p.Ala12_Pro13insGlyProCys",
+            "r.22_23insauc",
+            "c.43-6_595+12delinsCTT",
+            "p.Ile71_Cys80delinsSer",
+            "p.=",
+            "c.=",
+            "p.(=)",
+            "NM_001301.4:c.122-6T>A",
+            "NM_001301.4:c.[1_35del;78+5_78+10del;122T>A]",
+            "p.[Glu27Trp;Lys212fs]",
+        ]
+        self.invalid_variant_strings = [
+            "g.Glu27Trp",
+            "p.27Glu>Trp",
+            "G>A",
+            "n.Pro12_Gly18dup",
+            "g.22_23insauc",
+            "g.25_24del",
+            "r.22_24insauc",
+            "x.=",
+            "c.(=)",
+            "NM_001301.4::c.122-6T>A",
+            "NM_001301.4:c.[78+5_78+10del;1_35del;122T>A]",
+            "p.[Glu27Trp;Glu27Tyr]",
+            "p.[Glu27fs;Arg48Lys]",
+            "p.[Glu27Trp]",
+            "",
+            "NA",
+            None,
+            12.5,
+        ]
+
+    def test_valid(self) -> None:
+        for s in self.valid_variant_strings:
+            with self.subTest(s=s):
+                self.assertTrue(is_valid(s))
+
+    def test_invalid(self) -> None:
+        for s in self.invalid_variant_strings:
+            with self.subTest(s=s):
+                self.assertFalse(is_valid(s))
+
+    def test_does_not_create_variants(self) -> None:
+        with patch.object(Variant, "__init__", side_effect=AssertionError):
+            for s in self.valid_variant_strings + self.invalid_variant_strings:
+                with self.subTest(s=s):
+                    is_valid(s)
+
+    def test_does_not_raise_errors(self) -> None:
+        with patch.object(Variant, "_parse_error", side_effect=AssertionError):
+            for s in self.invalid_variant_strings + ["c.5A>T", "c.[1A>T;3T>C]"]:
+                with self.subTest(s=s):
+                    self.assertFalse(is_valid(s, targetseq="ACGT"))
+
+    def test_agrees_with_parse_variant_strings(self) -> None:
+        targetseq = "ACGT"
+        variant_strings = [
+            "c.1A>T",
+            "c.3G>C",
+            "c.[1A>T;3G>C]",
+            "c.1C>T",
+            "c.[1A>T;3T>C]",
+            "c.5A>G",
+            "c.2_3del",
+            "c.3_5del",
+            "c.=",
+            "p.Glu27Trp",
+        ]
+
+        for s in variant_strings:
+            for prefix in (None, "c", "p"):
+                with self.subTest(s=s, prefix=prefix):
+                    valid, _ = parse_variant_strings(
+                        [s], targetseq=targetseq, expected_prefix=prefix
+                    )
+                    self.assertEqual(
+                        valid[0] is not None,
+                        is_valid(s, targetseq=targetseq, expected_prefix=prefix),
+                    )
+
+    def test_valid_expected_prefixes_only(self) -> None:
+        for p in list("CGMNOPRx.4ab?"):
+            with self.subTest(p=p):
+                with self.assertRaises(ValueError):
+                    is_valid("p.Glu27Trp", expected_prefix=p)
+
+
+class TestSortVariants(unittest.TestCase):
+    def test_sort(self) -> None:
+        sorted_variant_strings = [
+            "c.-12G>A",
+            "c.[1_35del;78+5_78+10del;122T>A]",
+            "c.78+5_78+10del",
+            "c.122T>A",
+            "c.*33del",
+            "p.Glu27Trp",
+        ]
+        variants = [Variant(s) for s in sorted_variant_strings]
+
+        for _ in range(10):
+            shuffled_variants = variants.copy()
+            random.shuffle(shuffled_variants)
+            self.assertListEqual(sort_variants(shuffled_variants), variants)
+            self.assertListEqual(
+                sort_variants(shuffled_variants, reverse=True), variants[::-1]
+            )
+
+    def test_iterable(self) -> None:
+        variant_strings = ["c.122T>A", "c.1A>T"]
+        self.assertListEqual(
+            sort_variants(Variant(s) for s in variant_strings),
+            [Variant("c.1A>T"), Variant("c.122T>A")],
+        )
+
+
+class TestVariantsToRecords(unittest.TestCase):
+    def setUp(self) -> None:
+        self.variants = [
+            Variant("p.Glu27Trp"),
+            None,
+            Variant("GeneX:c.[1_35del;78+5_78+10del;122T>A]"),
+            Variant("c.="),
+        ]
+
+    def test_records(self) -> None:
+        records = variants_to_records(self.variants)
+        self.assertEqual(len(records), len(self.variants))
+        self.assertIsNone(records[1])
+        for v, r in zip(self.variants, records):
+            if v is not None:
+                with self.subTest(v=v):
+                    self.assertEqual(r, v.to_dict())
+                    self.assertEqual(Variant(r), v)
+                    self.assertEqual(Variant.from_dict(r), v)
+
+    def test_columns(self) -> None:
+        columns = variants_to_columns(self.variants)
+        self.assertListEqual(columns["variant_index"], [0, 2, 2, 2, 3])
+        self.assertListEqual(columns["prefix"], ["p", "c", "c", "c", "c"])
+        self.assertListEqual(
+            columns["target_id"], [None, "GeneX", "GeneX", "GeneX", None]
+        )
+        self.assertListEqual(columns["position"], [27, None, None, 122, None])
+        self.assertListEqual(columns["start_position"], [None, 1, "78+5", None, None])
+        self.assertTrue(all(len(c) == 5 for c in columns.values()))
+
+        rows = [
+            {k: c[i] for k, c in columns.items() if c[i] is not None} for i in range(5)
+        ]
+        for row in rows:
+            del row["variant_index"]
+        self.assertEqual(Variant(rows[0]), self.variants[0])
+        self.assertEqual(Variant.from_dict(rows[1:4]), self.variants[2])
+        self.assertEqual(Variant(rows[4]), self.variants[3])
+
+    def test_empty(self) -> None:
+        self.assertListEqual(variants_to_records([]), [])
+        columns = variants_to_columns([])
+        self.assertIn("variant_index", columns)
+        self.assertTrue(all(len(c) == 0 for c in columns.values()))
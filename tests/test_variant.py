@@ -1,6 +1,7 @@
+import pickle
 import unittest
 
-from mavehgvs.exceptions import MaveHgvsParseError
+from mavehgvs.exceptions import ErrorCode, MaveHgvsParseError
 from mavehgvs.variant import Variant
 from mavehgvs.position import VariantPosition
 
@@ -247,11 +248,40 @@ class TestCreateMultiVariantFromString(unittest.TestCase):
                 with self.assertRaises(MaveHgvsParseError):
                     Variant(s)
 
+    def test_many_events(self):
+        variant_strings = [
+            f"p.[{';'.join(f'Ala{i}Gly' for i in range(1, 50))}]",
+            f"c.[{';'.join(f'{i}_{i + 1}insA' for i in range(1, 100, 3))}]",
+            f"r.[{';'.join(f'{i}a>u' for i in range(1, 40))}]",
+        ]
+
+        invalid_variant_strings = [
+            f"p.[{';'.join(f'Ala{i}Gly' for i in range(1, 50))};]",
+            f"p.[{';'.join(f'Ala{i}Gly' for i in range(1, 50))}]]",
+            f"p.[{';'.join(f'Ala{i}Gly' for i in range(1, 50))};Ala51Gly",
+            f"c.[{';'.join(f'{i}A>T' for i in range(1, 40))};40a>u]",
+            "p.[Glu27Trp]",
+            "p.[]",
+        ]
+
+        for s in variant_strings:
+            with self.subTest(s=s):
+                v = Variant(s)
+                self.assertEqual(s, str(v))
+                self.assertEqual(v.variant_count, s.count(";") + 1)
+
+        for s in invalid_variant_strings:
+            with self.subTest(s=s):
+                with self.assertRaises(MaveHgvsParseError):
+                    Variant(s)
+
     def test_ordering(self):
         variant_string_tuples = [
             ("p.[Gly345Lys;Glu27Trp]", "p.[Glu27Trp;Gly345Lys]"),
             ("p.[Glu27Trp;Gly18del;Ter345Lys]", "p.[Gly18del;Glu27Trp;Ter345Lys]"),
             ("c.[122T>A;1_35del;78+5_78+10del]", "c.[1_35del;78+5_78+10del;122T>A]"),
+            ("c.[135del;78+5_78+10del;122T>A]", "c.[78+5_78+10del;122T>A;135del]"),
+            ("c.[122T>A;135del;1_35del]", "c.[1_35del;122T>A;135del]"),
         ]
 
         for s, _ in variant_string_tuples:
@@ -715,6 +745,279 @@ class TestCreateMultiVariantFromValues(unittest.TestCase):
                     Variant(d)
 
 
+class TestCreateVariantFromComponents(unittest.TestCase):
+    def test_round_trip(self):
+        variant_strings = [
+            "p.Glu27Trp",
+            "p.Ter345Lys",
+            "p.Cys22=",
+            "p.(=)",
+            "p.=",
+            "p.Glu27fs",
+            "p.Ile71_Cys80delinsSer",
+            "p.His7_Gln8insSer",
+            "c.=",
+            "c.1_3=",
+            "c.122-6T>A",
+            "c.*33del",
+            "c.43-6_595+12delinsCTT",
+            "n.12_13insC",
+            "g.44dup",
+            "r.22g>u",
+            "r.123_127del",
+            "NM_001130145.3:c.832C>T",
+            "c.[1_35del;78+5_78+10del;122T>A]",
+            "p.[Glu27Trp;Lys212fs]",
+            "GeneX:r.[22g>u;35del]",
+        ]
+
+        for s in variant_strings:
+            with self.subTest(s=s):
+                v = Variant(s)
+                w = Variant.from_components(
+                    v.prefix,
+                    v.variant_type,
+                    v.positions,
+                    v.sequence,
+                    target_id=v.target_id,
+                )
+                self.assertEqual(v, w)
+                self.assertEqual(s, str(w))
+                self.assertEqual(hash(v), hash(w))
+
+    def test_position_strings(self):
+        v = Variant.from_components("c", "del", ("78+5", "78+10"))
+        self.assertEqual(str(v), "c.78+5_78+10del")
+        self.assertIs(v.positions[0], VariantPosition.intern("78+5"))
+
+    def test_relaxed_ordering(self):
+        components = [
+            ("c", ["sub", "del"], ["122", ("1", "35")], [("T", "A"), None]),
+            ("c", "del", ("35", "1"), None),
+        ]
+        expected = ["c.[1_35del;122T>A]", "c.1_35del"]
+
+        for c, s in zip(components, expected):
+            with self.subTest(s=s):
+                with self.assertRaises(MaveHgvsParseError):
+                    Variant.from_components(*c)
+                v = Variant.from_components(*c, relaxed_ordering=True)
+                self.assertEqual(str(v), s)
+                self.assertEqual(v, Variant(s))
+
+    def test_target_validation(self):
+        v = Variant.from_components("c", "sub", "3", ("G", "T"), targetseq="ACGT")
+        self.assertEqual(str(v), "c.3G>T")
+
+        with self.assertRaises(MaveHgvsParseError):
+            Variant.from_components("c", "sub", "3", ("A", "T"), targetseq="ACGT")
+        with self.assertRaises(MaveHgvsParseError):
+            Variant.from_components("c", "del", ("3", "5"), targetseq="ACGT")
+
+    def test_invalid_components(self):
+        invalid_components = [
+            ("x", "sub", "3", ("A", "T")),
+            ("c", "inv", "3", None),
+            ("c", "fs", "3", None),
+            ("c", "sub", None, ("A", "T")),
+            ("c", "sub", ("3", "4"), ("A", "T")),
+            ("c", "sub", "3", "T"),
+            ("c", "sub", "Glu3", ("A", "T")),
+            ("p", "sub", "3", ("Glu", "Trp")),
+            ("g", "sub", "*3", ("A", "T")),
+            ("g", "sub", "3+1", ("A", "T")),
+            ("n", "sub", "*3", ("A", "T")),
+            ("n", "equal", "3", "="),
+            ("c", "equal", None, "(=)"),
+            ("c", "equal", None, None),
+            ("c", "del", "3", "A"),
+            ("c", "ins", "3", "A"),
+            ("c", "ins", ("3", "5"), "A"),
+            ("c", "ins", ("3", "4"), None),
+            ("c", "delins", ("3", "4"), ""),
+            ("c", "del", ("4", "4"), None),
+            ("c", "del", ("3", "4", "5"), None),
+            ("c", ["del"], [("3", "4")], None),
+            ("c", ["del", "del"], [("3", "4")], None),
+            ("c", ["del", "del"], [("3", "4"), ("4", "5")], None),
+            ("c", ["sub", "sub"], ["3", "3"], [("A", "T"), ("A", "G")]),
+            ("c", ["equal", "del"], [None, "3"], ["=", None]),
+            ("p", ["fs", "sub"], ["Glu3", "Lys5"], [None, ("Lys", "Trp")]),
+            ("p", ["fs", "fs"], ["Glu3", "Lys5"], None),
+        ]
+
+        for c in invalid_components:
+            with self.subTest(c=c):
+                with self.assertRaises(MaveHgvsParseError):
+                    Variant.from_components(*c)
+
+        with self.assertRaises(MaveHgvsParseError):
+            Variant.from_components("c", "sub", "3", ("A", "T"), target_id="Gene X")
+
+
+class TestVariantToDict(unittest.TestCase):
+    def test_single_variants(self):
+        dict_tuples = [
+            (
+                "p.Glu27Trp",
+                {
+                    "variant_type": "sub",
+                    "prefix": "p",
+                    "position": 27,
+                    "target": "Glu",
+                    "variant": "Trp",
+                },
+            ),
+            (
+                "c.122-6T>A",
+                {
+                    "variant_type": "sub",
+                    "prefix": "c",
+                    "position": "122-6",
+                    "target": "T",
+                    "variant": "A",
+                },
+            ),
+            (
+                "NM_001130145.3:c.832C>T",
+                {
+                    "variant_type": "sub",
+                    "prefix": "c",
+                    "target_id": "NM_001130145.3",
+                    "position": 832,
+                    "target": "C",
+                    "variant": "T",
+                },
+            ),
+            (
+                "p.Glu27fs",
+                {"variant_type": "fs", "prefix": "p", "position": 27, "target": "Glu"},
+            ),
+            (
+                "c.44del",
+                {
+                    "variant_type": "del",
+                    "prefix": "c",
+                    "start_position": 44,
+                    "end_position": 44,
+                },
+            ),
+            (
+                "p.Ile71_Cys80delinsSer",
+                {
+                    "variant_type": "delins",
+                    "prefix": "p",
+                    "start_position": 71,
+                    "start_target": "Ile",
+                    "end_position": 80,
+                    "end_target": "Cys",
+                    "variant": "Ser",
+                },
+            ),
+            (
+                "r.22_23insauc",
+                {
+                    "variant_type": "ins",
+                    "prefix": "r",
+                    "start_position": 22,
+                    "end_position": 23,
+                    "variant": "auc",
+                },
+            ),
+            (
+                "c.1_3=",
+                {
+                    "variant_type": "equal",
+                    "prefix": "c",
+                    "start_position": 1,
+                    "end_position": 3,
+                },
+            ),
+            (
+                "p.Cys22=",
+                {
+                    "variant_type": "equal",
+                    "prefix": "p",
+                    "position": 22,
+                    "target": "Cys",
+                },
+            ),
+            ("c.=", {"variant_type": "equal", "prefix": "c", "variant": "="}),
+            ("p.(=)", {"variant_type": "equal", "prefix": "p", "variant": "(=)"}),
+        ]
+
+        for s, d in dict_tuples:
+            with self.subTest(s=s):
+                v = Variant(s)
+                self.assertDictEqual(v.to_dict(), d)
+                self.assertEqual(str(Variant(d)), s)
+                self.assertEqual(str(Variant.from_dict(d)), s)
+                self.assertEqual(Variant.from_dict(d), v)
+
+    def test_multi_variants(self):
+        variant_strings = [
+            "p.[Glu27Trp;Lys212fs]",
+            "c.[1_35del;78+5_78+10del;122T>A]",
+            "GeneX:r.[22g>u;35del]",
+        ]
+
+        for s in variant_strings:
+            with self.subTest(s=s):
+                v = Variant(s)
+                records = v.to_dict()
+                self.assertEqual(len(records), v.variant_count)
+                self.assertEqual(str(Variant(records)), s)
+                self.assertEqual(str(Variant.from_dict(records)), s)
+
+    def test_from_dict_invalid(self):
+        invalid_dicts = [
+            {"variant_type": "sub", "prefix": "c", "position": 3, "target": "A"},
+            {"variant_type": "fs", "prefix": "c", "position": 3, "target": "A"},
+            {"variant_type": "inv", "prefix": "c", "position": 3},
+            {"prefix": "c", "position": 3},
+            {
+                "variant_type": "del",
+                "prefix": "c",
+                "start_position": 5,
+                "end_position": 3,
+            },
+            [
+                {"variant_type": "fs", "prefix": "p", "position": 27, "target": "Glu"},
+                {"variant_type": "fs", "prefix": "p", "position": 28, "target": "Glu"},
+            ],
+            [
+                {"variant_type": "fs", "prefix": "p", "position": 27, "target": "Glu"},
+                {
+                    "variant_type": "sub",
+                    "prefix": "c",
+                    "position": 3,
+                    "target": "A",
+                    "variant": "T",
+                },
+            ],
+            [
+                {
+                    "variant_type": "fs",
+                    "prefix": "p",
+                    "position": 27,
+                    "target": "Glu",
+                    "target_id": "GeneX",
+                },
+                {"variant_type": "fs", "prefix": "p", "position": 28, "target": "Glu"},
+            ],
+        ]
+
+        for d in invalid_dicts:
+            with self.subTest(d=d):
+                with self.assertRaises(MaveHgvsParseError):
+                    Variant(d)
+                with self.assertRaises(MaveHgvsParseError):
+                    Variant.from_dict(d)
+
+        with self.assertRaises(ValueError):
+            Variant.from_dict("c.3A>T")
+
+
 class TestTargetSequenceValidation(unittest.TestCase):
     def test_valid_dna_equal(self):
         variant_tuples = [("ACGT", "c.1_2="), ("ACGT", "c.4="), ("ACGT", "c.=")]
@@ -1111,6 +1414,153 @@ class TestMiscProperties(unittest.TestCase):
                 v = Variant(s)
                 self.assertEqual(seq, v.sequence)
 
+    def test_variant_count(self):
+        variant_tuples = [
+            (1, "p.Glu27Trp"),
+            (1, "c.="),
+            (2, "p.[Glu27Trp;Lys212fs]"),
+            (3, "c.[1_35del;78+5_78+10del;122T>A]"),
+        ]
+
+        for n, s in variant_tuples:
+            with self.subTest(n=n, s=s):
+                v = Variant(s)
+                self.assertEqual(n, v.variant_count)
+                with self.assertRaises(AttributeError):
+                    v.variant_count = n + 1
+
+    def test_no_instance_dict(self):
+        v = Variant("p.Glu27Trp")
+        self.assertFalse(hasattr(v, "__dict__"))
+        with self.assertRaises(AttributeError):
+            v.extra = None
+
+    def test_pickle(self):
+        variant_strings = [
+            "p.Glu27Trp",
+            "p.(=)",
+            "c.43-6_595+12delinsCTT",
+            "NM_002002.3:c.[1_35del;78+5_78+10del;122T>A]",
+        ]
+
+        for s in variant_strings:
+            with self.subTest(s=s):
+                v = Variant(s)
+                w = pickle.loads(pickle.dumps(v))
+                self.assertEqual(v, w)
+                self.assertEqual(s, str(w))
+
+    def test_hash(self):
+        variant_strings = [
+            "p.Glu27Trp",
+            "p.(=)",
+            "c.43-6_595+12delinsCTT",
+            "NM_002002.3:c.[1_35del;78+5_78+10del;122T>A]",
+            "NM_002002.3:c.122T>A",
+            "c.122T>A",
+            "r.22_23insauc",
+        ]
+
+        variants = [Variant(s) for s in variant_strings]
+        self.assertEqual(len(set(variants)), len(variant_strings))
+        for s in variant_strings:
+            with self.subTest(s=s):
+                self.assertEqual(hash(Variant(s)), hash(Variant(s)))
+                self.assertIn(Variant(s), set(variants))
+
+        # dictionary input compares and hashes the same as the string
+        v = Variant(
+            {
+                "variant_type": "sub",
+                "prefix": "c",
+                "position": 122,
+                "target": "T",
+                "variant": "A",
+            }
+        )
+        self.assertEqual(hash(v), hash(Variant("c.122T>A")))
+
+    def test_ordering(self):
+        sorted_variant_strings = [
+            "c.=",
+            "c.-12G>A",
+            "c.[1_35del;78+5_78+10del;122T>A]",
+            "c.43-6_595+12delinsCTT",
+            "c.78+5_78+10del",
+            "c.122del",
+            "c.122T>A",
+            "c.122T>C",
+            "c.*33del",
+            "GeneX:c.1A>T",
+            "p.(=)",
+            "p.=",
+            "p.Glu27fs",
+            "p.Glu27Trp",
+            "p.[Glu27Trp;Lys212fs]",
+        ]
+        variants = [Variant(s) for s in sorted_variant_strings]
+
+        for v1, v2 in zip(variants, variants[1:]):
+            with self.subTest(v1=v1, v2=v2):
+                self.assertLess(v1, v2)
+                self.assertLessEqual(v1, v2)
+                self.assertGreater(v2, v1)
+                self.assertGreaterEqual(v2, v1)
+                self.assertFalse(v2 < v1)
+
+        for v in variants:
+            with self.subTest(v=v):
+                self.assertLessEqual(v, Variant(str(v)))
+                self.assertGreaterEqual(v, Variant(str(v)))
+                self.assertFalse(v < Variant(str(v)))
+
+        self.assertListEqual(sorted(reversed(variants)), variants)
+
+    def test_sort_key_matches_equality(self):
+        v1 = Variant("p.Glu27del")
+        v2 = Variant("p.Ala27del")
+        self.assertEqual(v1, v2)
+        self.assertTupleEqual(v1.sort_key, v2.sort_key)
+        self.assertEqual(hash(v1), hash(v2))
+
+    def test_hash_pickle(self):
+        v = Variant("c.[1_35del;78+5_78+10del;122T>A]")
+        h = hash(v)
+        w = pickle.loads(pickle.dumps(v))
+        self.assertEqual(hash(w), h)
+        self.assertEqual(w, v)
+
+    def test_compare_other_type(self):
+        self.assertNotEqual(Variant("c.122T>A"), "c.122T>A")
+
+    def test_lazy_positions(self):
+        variant_tuples = [
+            ("p.Glu27Trp", "Glu27"),
+            ("c.122-6T>A", "122-6"),
+            ("c.*33del", "*33"),
+            ("r.22g>u", "22"),
+        ]
+
+        for s, pos in variant_tuples:
+            with self.subTest(s=s):
+                v = Variant(s)
+                self.assertEqual(v._positions, pos)
+                self.assertEqual(s, str(v))
+
+                self.assertIs(v.positions, VariantPosition.intern(pos))
+                self.assertIsInstance(v._positions, VariantPosition)
+                self.assertEqual(s, str(v))
+                self.assertEqual(v, Variant(s))
+
+    def test_lazy_protein_sequence(self):
+        v = Variant("p.Glu27Trp")
+        self.assertTupleEqual(v.sequence, ("Glu", "Trp"))
+        self.assertIsInstance(v._positions, str)
+
+    def test_target_positions_not_lazy(self):
+        v = Variant("c.3G>T", targetseq="ACGT")
+        self.assertIsInstance(v._positions, VariantPosition)
+
     def test_target_id(self):
         variant_tuples = [
             (None, "p.Glu27Trp"),
@@ -1133,5 +1583,64 @@ class TestMiscProperties(unittest.TestCase):
                 self.assertEqual(s, str(v))
 
 
+class TestErrorCodes(unittest.TestCase):
+    def test_string_codes(self):
+        variant_tuples = [
+            ("c.1A>", None, ErrorCode.REGEX),
+            ("x.1A>T", None, ErrorCode.REGEX),
+            ("NA", None, ErrorCode.REGEX),
+            ("c.[1A>T]", None, ErrorCode.REGEX),
+            ("c.5_3del", None, ErrorCode.POSITION_ORDER),
+            ("c.12_14insA", None, ErrorCode.INSERTION_POSITIONS),
+            ("c.[3A>T;1C>G]", None, ErrorCode.VARIANT_ORDER),
+            ("c.[1_3del;2_4dup]", None, ErrorCode.OVERLAP),
+            ("c.[1A>T;1A>G]", None, ErrorCode.SAME_POSITION),
+            ("p.[Met1Leu;Thr2=]", None, ErrorCode.MULTI_TARGET_IDENTICAL),
+            ("p.[Met1fs;Thr2fs]", None, ErrorCode.MULTIPLE_FRAME_SHIFTS),
+            ("c.5A>T", "ACGT", ErrorCode.OUT_OF_BOUNDS),
+            ("c.1C>T", "ACGT", ErrorCode.REFERENCE_MISMATCH),
+        ]
+
+        for s, target, code in variant_tuples:
+            with self.subTest(s=s):
+                with self.assertRaises(MaveHgvsParseError) as cm:
+                    Variant(s, targetseq=target)
+                self.assertEqual(cm.exception.code, code)
+                self.assertEqual(str(cm.exception), code.message)
+
+    def test_component_codes(self):
+        with self.assertRaises(MaveHgvsParseError) as cm:
+            Variant.from_components("x", "sub", VariantPosition("1"), ("A", "T"))
+        self.assertEqual(cm.exception.code, ErrorCode.INVALID_PREFIX)
+        self.assertEqual(str(cm.exception), "invalid variant prefix 'x'")
+
+        with self.assertRaises(MaveHgvsParseError) as cm:
+            Variant({"variant_type": "sub", "prefix": "c"})
+        self.assertEqual(cm.exception.code, ErrorCode.INVALID_DICTIONARY)
+
+    def test_default_code(self):
+        error = MaveHgvsParseError("invalid")
+        self.assertEqual(error.code, ErrorCode.INVALID)
+        self.assertEqual(str(error), "invalid")
+        self.assertEqual(
+            str(MaveHgvsParseError(code=ErrorCode.REGEX)), ErrorCode.REGEX.message
+        )
+
+    def test_cached_code(self):
+        Variant.enable_cache()
+        self.addCleanup(Variant.disable_cache)
+        for _ in range(2):
+            with self.assertRaises(MaveHgvsParseError) as cm:
+                Variant("c.5A>T", targetseq="ACGT")
+            self.assertEqual(cm.exception.code, ErrorCode.OUT_OF_BOUNDS)
+
+    def test_pickle(self):
+        error = pickle.loads(
+            pickle.dumps(MaveHgvsParseError("message", ErrorCode.OVERLAP))
+        )
+        self.assertEqual(str(error), "message")
+        self.assertEqual(error.code, ErrorCode.OVERLAP)
+
+
 if __name__ == "__main__":
     unittest.main()